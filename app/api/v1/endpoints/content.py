@@ -0,0 +1,40 @@
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException
+from app.core.dependencies import get_content_scheduler, require_admin
+from app.core.scheduler import require_scheduler_leader
+from app.models.content import RunManifestResponse, WeeklyUpdateTriggerResponse
+from app.services.content.manifest import RunManifest
+from app.services.content.scheduler import ContentScheduler, is_weekly_update_running
+
+router = APIRouter()
+
+# 백그라운드 실행 태스크가 완료 전에 GC 되지 않도록 참조 유지
+_background_tasks = set()
+
+@router.post(
+    "/weekly-update",
+    response_model=WeeklyUpdateTriggerResponse,
+    status_code=202,
+    dependencies=[Depends(require_admin), Depends(require_scheduler_leader)]
+)
+async def trigger_weekly_update(force: bool = False, content_scheduler: ContentScheduler = Depends(get_content_scheduler)):
+    """Start the weekly update in the background, resuming from this week's completed stages"""
+    if is_weekly_update_running():
+        raise HTTPException(status_code=409, detail="Weekly update is already running")
+    task = asyncio.create_task(content_scheduler.run_weekly_update(force=force))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return {"run_id": RunManifest.current().run_id, "status": "started"}
+
+@router.get("/runs/current", response_model=RunManifestResponse)
+async def get_current_run():
+    """Get the stage status of this week's run"""
+    return RunManifest.current().summary()
+
+@router.get("/runs/{run_id}", response_model=RunManifestResponse)
+async def get_run(run_id: str):
+    """Get the stage status of a weekly run (e.g. 2025-W20)"""
+    manifest = RunManifest(run_id)
+    if not manifest.path.exists():
+        raise HTTPException(status_code=404, detail="Run not found")
+    return manifest.summary()
@@ -1,22 +1,74 @@
-from fastapi import APIRouter, HTTPException
-from app.models.lol_store import DiscountResponse, LastUpdateResponse
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request
+from app.core.dependencies import get_history_store, get_lol_store_service
+from app.core.response_cache import response_cache
+from app.models.lol_store import DiscountResponse, HistoryPage, LastUpdateResponse, SeenSkinPage, SnapshotDiffResponse
 from app.services.lol_store import LoLStoreService
+from app.services.lol_store.history import HistoryStore
 
 router = APIRouter()
-lol_store_service = LoLStoreService()
 
 @router.get("/discounts", response_model=DiscountResponse)
-async def get_discounts():
-    """Get the latest scraping results"""
-    results = await lol_store_service.get_discounts()
-    if not results["discounts"]:
-        raise HTTPException(status_code=404, detail="No scraping results available yet")
-    return results
+async def get_discounts(request: Request, lol_store_service: LoLStoreService = Depends(get_lol_store_service)):
+    """Get the latest scraping results (cached per scrape, supports ETag/304)"""
+    async def build():
+        results = await lol_store_service.get_discounts()
+        if not results["discounts"]:
+            raise HTTPException(status_code=404, detail="No scraping results available yet")
+        return results
+
+    return await response_cache.respond(request, "lol-store/discounts", lol_store_service.current_generation(), build)
 
 @router.get("/last-update", response_model=LastUpdateResponse)
-async def get_last_update():
+async def get_last_update(lol_store_service: LoLStoreService = Depends(get_lol_store_service)):
     """Get the timestamp of the last successful scraping"""
     result = lol_store_service.get_last_update()
     if not result["last_update"]:
         raise HTTPException(status_code=404, detail="No scraping has been performed yet")
-    return result 
\ No newline at end of file
+    return result
+
+@router.get("/diff", response_model=SnapshotDiffResponse)
+async def get_snapshot_diff(
+    week: Optional[str] = Query(None, pattern=r"^\d{4}-W\d{2}$"),
+    lol_store_service: LoLStoreService = Depends(get_lol_store_service)
+):
+    """Get the skins added, removed and changed in a week (default: latest) compared to the week before"""
+    diff = lol_store_service.diff_for_week(week)
+    if diff is None:
+        raise HTTPException(status_code=404, detail="No scraping results recorded for this week")
+    return diff.to_dict()
+
+@router.get("/history/skins/{name}", response_model=HistoryPage)
+async def get_price_history(
+    name: str,
+    cursor: Optional[int] = None,
+    limit: int = Query(50, ge=1, le=500),
+    history: HistoryStore = Depends(get_history_store)
+):
+    """Get every recorded price and discount of a skin, oldest first"""
+    items, next_cursor = history.price_history(name, cursor, limit)
+    return {"items": items, "next_cursor": next_cursor}
+
+@router.get("/history/weeks/{week}", response_model=HistoryPage)
+async def get_week_discounts(
+    week: str = Path(..., pattern=r"^\d{4}-W\d{2}$"),
+    cursor: Optional[int] = None,
+    limit: int = Query(50, ge=1, le=500),
+    history: HistoryStore = Depends(get_history_store)
+):
+    """Get the skins on sale in an ISO week (e.g. 2025-W20)"""
+    items, next_cursor = history.week_items(week, cursor, limit)
+    if not items and cursor is None:
+        raise HTTPException(status_code=404, detail="No scraping results recorded for this week")
+    return {"items": items, "next_cursor": next_cursor}
+
+@router.get("/history/seen", response_model=SeenSkinPage)
+async def get_seen_discounted(
+    before: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    history: HistoryStore = Depends(get_history_store)
+):
+    """Get the skins seen discounted before a date (ISO date, default: ever), by name"""
+    items, next_cursor = history.seen_discounted(before, cursor, limit)
+    return {"items": items, "next_cursor": next_cursor}
@@ -0,0 +1,10 @@
+from fastapi import APIRouter
+from app.core.scheduler import scheduler_status
+from app.models.scheduler import SchedulerStatusResponse
+
+router = APIRouter()
+
+@router.get("/status", response_model=SchedulerStatusResponse)
+async def get_scheduler_status():
+    """Get which worker process holds the scheduler leader lock (jobs are listed by the leader only)"""
+    return scheduler_status()
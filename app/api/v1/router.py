@@ -1,5 +1,7 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import lol_store
+from app.api.v1.endpoints import content, lol_store, scheduler
 
 api_router = APIRouter()
-api_router.include_router(lol_store.router, prefix="/lol-store", tags=["lol-store"]) 
\ No newline at end of file
+api_router.include_router(lol_store.router, prefix="/lol-store", tags=["lol-store"])
+api_router.include_router(content.router, prefix="/content", tags=["content"])
+api_router.include_router(scheduler.router, prefix="/scheduler", tags=["scheduler"])
\ No newline at end of file
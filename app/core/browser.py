@@ -0,0 +1,100 @@
+import asyncio
+from contextlib import asynccontextmanager
+from playwright.async_api import async_playwright
+from app.core.config.settings import settings
+
+
+class BrowserManager:
+    """App-lifetime Chromium instance that hands out isolated browser contexts"""
+
+    def __init__(self, max_uses: int = None, max_contexts: int = None):
+        self.max_uses = max_uses or settings.BROWSER_MAX_USES
+        self.max_contexts = max_contexts or settings.BROWSER_MAX_CONTEXTS
+        self._playwright = None
+        self._browser = None
+        self._uses = 0
+        self._active = 0
+        self._launches = 0
+        self._lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(self.max_contexts)
+
+    async def start(self):
+        """Start Playwright and launch the shared browser (idempotent)"""
+        async with self._lock:
+            await self._ensure_browser()
+
+    async def stop(self):
+        """Close the shared browser and stop Playwright"""
+        async with self._lock:
+            await self._close_browser()
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+            print("브라우저 매니저 종료")
+
+    def _is_healthy(self) -> bool:
+        return self._browser is not None and self._browser.is_connected()
+
+    async def _close_browser(self):
+        browser, self._browser = self._browser, None
+        self._uses = 0
+        if browser is not None:
+            try:
+                await browser.close()
+            except Exception as e:
+                print(f"Error closing browser: {str(e)}")
+
+    def _on_disconnected(self, browser):
+        # 크래시 등으로 연결이 끊기면 다음 요청 시 재실행
+        if self._browser is browser:
+            print("⚠️ 브라우저 연결이 끊어졌습니다. 다음 요청 시 재실행합니다.")
+            self._browser = None
+
+    async def _ensure_browser(self):
+        """Launch or recycle the browser; must be called with the lock held"""
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+
+        # 사용 횟수를 초과했고 사용 중인 컨텍스트가 없으면 재활용
+        if self._is_healthy() and self._uses >= self.max_uses and self._active == 0:
+            print(f"브라우저 재활용: {self._uses}회 사용")
+            await self._close_browser()
+
+        if not self._is_healthy():
+            await self._close_browser()
+            self._browser = await self._playwright.chromium.launch(headless=True)
+            self._browser.on("disconnected", self._on_disconnected)
+            self._launches += 1
+            print(f"브라우저 실행 (총 {self._launches}회)")
+        return self._browser
+
+    @asynccontextmanager
+    async def context(self, **kwargs):
+        """Yield a fresh browser context from the shared browser"""
+        async with self._semaphore:
+            async with self._lock:
+                browser = await self._ensure_browser()
+                self._uses += 1
+                self._active += 1
+            context = None
+            try:
+                context = await browser.new_context(**kwargs)
+                yield context
+            finally:
+                self._active -= 1
+                if context is not None:
+                    try:
+                        await context.close()
+                    except Exception as e:
+                        print(f"Error closing browser context: {str(e)}")
+
+    def status(self) -> dict:
+        return {
+            "running": self._is_healthy(),
+            "uses": self._uses,
+            "active_contexts": self._active,
+            "launches": self._launches,
+        }
+
+
+browser_manager = BrowserManager()
@@ -13,9 +13,70 @@ class Settings:
     YOUTUBE_CLIENT_SECRET: str = os.getenv("YOUTUBE_CLIENT_SECRET", "")
     YOUTUBE_REFRESH_TOKEN: str = os.getenv("YOUTUBE_REFRESH_TOKEN", "")
 
+    # 주간 실행 등 관리용 API 토큰 (Authorization: Bearer <토큰>), 비어 있으면 로컬 요청만 허용
+    ADMIN_API_TOKEN: str = os.getenv("ADMIN_API_TOKEN", "")
+
     # Other API Settings
     OTHER_API_KEY: str = os.getenv("OTHER_API_KEY", "")
 
+    # LoL Store Scraping Settings
+    LOL_STORE_READY_TIMEOUT_MS: int = int(os.getenv("LOL_STORE_READY_TIMEOUT_MS", "5000"))
+    LOL_STORE_NETWORK_QUIET_MS: int = int(os.getenv("LOL_STORE_NETWORK_QUIET_MS", "250"))
+    LOL_STORE_IDLE_ROUNDS: int = int(os.getenv("LOL_STORE_IDLE_ROUNDS", "3"))
+    LOL_STORE_BLOCK_RESOURCES: bool = os.getenv("LOL_STORE_BLOCK_RESOURCES", "true").lower() == "true"
+    LOL_STORE_BLOCK_ANALYTICS: bool = os.getenv("LOL_STORE_BLOCK_ANALYTICS", "true").lower() == "true"
+    LOL_STORE_BLOCK_ALLOWLIST: str = os.getenv("LOL_STORE_BLOCK_ALLOWLIST", "")
+    # 카탈로그 응답 매핑(CATALOG_FIELDS)을 실제 응답 녹화본으로 검증하기 전까지는 기본으로 끔
+    LOL_STORE_HTTP_SOURCE: bool = os.getenv("LOL_STORE_HTTP_SOURCE", "false").lower() == "true"
+    LOL_STORE_CATALOG_URL: str = os.getenv("LOL_STORE_CATALOG_URL", "")
+    LOL_STORE_CATALOG_PATTERN: str = os.getenv("LOL_STORE_CATALOG_PATTERN", "/catalog")
+    LOL_STORE_CATALOG_PAGE_PARAM: str = os.getenv("LOL_STORE_CATALOG_PAGE_PARAM", "page")
+    LOL_STORE_CATALOG_FIRST_PAGE: int = int(os.getenv("LOL_STORE_CATALOG_FIRST_PAGE", "1"))
+    LOL_STORE_HTTP_CONCURRENCY: int = int(os.getenv("LOL_STORE_HTTP_CONCURRENCY", "4"))
+    LOL_STORE_HTTP_TIMEOUT: float = float(os.getenv("LOL_STORE_HTTP_TIMEOUT", "10"))
+
+    # Shared Browser Settings
+    BROWSER_MAX_USES: int = int(os.getenv("BROWSER_MAX_USES", "20"))
+    BROWSER_MAX_CONTEXTS: int = int(os.getenv("BROWSER_MAX_CONTEXTS", "2"))
+
+    # Image Generator Settings
+    ASSET_CACHE_MAX_MB: int = int(os.getenv("ASSET_CACHE_MAX_MB", "512"))
+    ASSET_CACHE_FRESH_SECONDS: int = int(os.getenv("ASSET_CACHE_FRESH_SECONDS", "86400"))
+    ASSET_DOWNLOAD_WORKERS: int = int(os.getenv("ASSET_DOWNLOAD_WORKERS", "8"))
+    ASSET_DOWNLOAD_TIMEOUT: float = float(os.getenv("ASSET_DOWNLOAD_TIMEOUT", "15"))
+    RENDER_CACHE_MAX_MB: int = int(os.getenv("RENDER_CACHE_MAX_MB", "256"))
+    RENDER_CACHE_MAX_AGE_DAYS: int = int(os.getenv("RENDER_CACHE_MAX_AGE_DAYS", "60"))
+    # 1: 단일 프로세스, 0: CPU 코어 수만큼
+    IMAGE_RENDER_WORKERS: int = int(os.getenv("IMAGE_RENDER_WORKERS", "0"))
+
+    # Video Settings
+    VIDEO_ENCODER_BACKEND: str = os.getenv("VIDEO_ENCODER_BACKEND", "ffmpeg")
+    VIDEO_ENCODING_PROFILE: str = os.getenv("VIDEO_ENCODING_PROFILE", "publish")
+    AUDIO_CACHE_MAX_FILES: int = int(os.getenv("AUDIO_CACHE_MAX_FILES", "8"))
+
+    # Weekly Pipeline Settings (초)
+    PIPELINE_SCRAPE_TIMEOUT: float = float(os.getenv("PIPELINE_SCRAPE_TIMEOUT", "900"))
+    PIPELINE_CONTENT_TIMEOUT: float = float(os.getenv("PIPELINE_CONTENT_TIMEOUT", "1800"))
+    PIPELINE_UPLOAD_TIMEOUT: float = float(os.getenv("PIPELINE_UPLOAD_TIMEOUT", "3600"))
+    # 스크래핑/렌더링/인코딩을 큐로 연결해 동시에 진행 (false 이거나 moviepy 백엔드면 단계별 순차 실행)
+    PIPELINE_STREAMING: bool = os.getenv("PIPELINE_STREAMING", "true").lower() == "true"
+    PIPELINE_QUEUE_SIZE: int = int(os.getenv("PIPELINE_QUEUE_SIZE", "8"))
+    # 업로드 후 재생목록에 추가 (data/runs/<주차>.json 의 playlist 단계)
+    PIPELINE_ADD_TO_PLAYLIST: bool = os.getenv("PIPELINE_ADD_TO_PLAYLIST", "false").lower() == "true"
+
+    # discounts.json 저장 시 사람이 읽기 쉬운 사본(discounts.pretty.json)도 기록
+    LOL_STORE_PRETTY_EXPORT: bool = os.getenv("LOL_STORE_PRETTY_EXPORT", "false").lower() == "true"
+
+    # Discount History Store (SQLite)
+    HISTORY_DB_PATH: str = os.getenv("HISTORY_DB_PATH", "data/lol_store/history.sqlite3")
+
+    # 스케줄러 리더 잠금 (여러 워커 중 하나만 작업 실행, 나머지는 주기적으로 리더 획득 재시도)
+    SCHEDULER_LOCK_PATH: str = os.getenv("SCHEDULER_LOCK_PATH", "data/scheduler.lock")
+    SCHEDULER_LEADER_RETRY_SECONDS: float = float(os.getenv("SCHEDULER_LEADER_RETRY_SECONDS", "15"))
+
+    # API Response Cache (초)
+    RESPONSE_CACHE_MAX_AGE: int = int(os.getenv("RESPONSE_CACHE_MAX_AGE", "60"))
+
     # Database Settings
     DB_HOST: str = os.getenv("DB_HOST", "localhost")
     DB_PORT: int = int(os.getenv("DB_PORT", "5432"))
@@ -0,0 +1,37 @@
+import os
+from pathlib import Path
+
+# 인코딩 프로필
+# preset/crf/tune: libx264 옵션, fps: 출력 프레임레이트, threads: 0 이면 ffmpeg 자동,
+# scale: 출력 해상도 배율 (None 이면 원본 1280x2266)
+ENCODING_PROFILES = {
+    "fast-draft": {
+        "preset": "ultrafast",
+        "crf": 30,
+        "tune": "stillimage",
+        "fps": 12,
+        "threads": 0,
+        "scale": 0.5,
+    },
+    "balanced": {
+        "preset": "veryfast",
+        "crf": 24,
+        "tune": "stillimage",
+        "fps": 24,
+        "threads": 0,
+        "scale": 0.75,
+    },
+    "publish": {
+        "preset": "medium",
+        "crf": 23,
+        "tune": "stillimage",
+        "fps": 24,
+        "threads": 0,
+        "scale": None,
+    },
+}
+DEFAULT_ENCODING_PROFILE = "publish"
+
+# 프로필별 인코딩 결과 기록 (JSON Lines)
+BASE_DIR = Path(__file__).resolve().parent.parent.parent.parent
+ENCODE_STATS_FILE = os.path.join(BASE_DIR, "data", "videos", "encode_stats.jsonl")
@@ -16,6 +16,10 @@ OAUTH2_FILE = os.path.join(BASE_DIR, "app", "core", "config", "oauth2.json")
 
 # 업로드 설정
 MAX_RETRIES = 10
+UPLOAD_URL = os.getenv("YOUTUBE_UPLOAD_URL", "https://www.googleapis.com/upload/youtube/v3/videos")
+UPLOAD_CHUNK_SIZE = int(os.getenv("YOUTUBE_UPLOAD_CHUNK_MB", "8")) * 1024 * 1024
+UPLOAD_STATE_FILE = os.path.join(BASE_DIR, "data", "youtube", "upload_session.json")
+UPLOAD_SESSION_MAX_AGE = 6 * 24 * 60 * 60  # 업로드 세션 URI 는 약 일주일 후 만료됨
 VALID_PRIVACY_STATUSES = ("public", "private", "unlisted")
 
 # 에러 메시지
@@ -0,0 +1,77 @@
+import hmac
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
+
+from fastapi import Depends, Header, HTTPException, Request
+
+from app.core.config.settings import settings
+
+if TYPE_CHECKING:
+    from app.services.content.generator import ContentGeneratorService
+    from app.services.content.publisher import YouTubePublisherService
+    from app.services.content.scheduler import ContentScheduler
+    from app.services.lol_store.history import HistoryStore
+    from app.services.lol_store.store import LoLStoreService
+    from app.services.slp.login import SLPLoginService
+
+# 관리 API 를 토큰 없이 호출할 수 있는 클라이언트 주소
+LOCAL_CLIENTS = {"127.0.0.1", "::1", "localhost"}
+
+
+def require_admin(request: Request, authorization: Optional[str] = Header(None)):
+    """
+    Guard for endpoints that start scrapes, encodes or uploads
+
+    With ADMIN_API_TOKEN set, the request must send "Authorization: Bearer <token>".
+    Without it, only requests from the local machine are accepted.
+    """
+    if settings.ADMIN_API_TOKEN:
+        scheme, _, token = (authorization or "").partition(" ")
+        if scheme.lower() != "bearer" or not hmac.compare_digest(
+            token.strip().encode("utf-8"), settings.ADMIN_API_TOKEN.encode("utf-8")
+        ):
+            raise HTTPException(status_code=401, detail="Invalid or missing API token", headers={"WWW-Authenticate": "Bearer"})
+        return
+    if request.client is None or request.client.host not in LOCAL_CLIENTS:
+        raise HTTPException(status_code=403, detail="Set ADMIN_API_TOKEN to call this endpoint remotely")
+
+
+# 공유 서비스 인스턴스
+# 처음 요청될 때 한 번만 생성되며, FastAPI 엔드포인트(Depends)와 스케줄러 작업이 같은 인스턴스를 사용함.
+# 서비스 모듈도 getter 안에서 import 하므로 주 1회만 쓰는 Pillow/moviepy/googleapiclient 는
+# 해당 단계가 실행될 때 로드되고, 서버 기동 시에는 로드되지 않음
+
+
+@lru_cache(maxsize=None)
+def get_lol_store_service() -> "LoLStoreService":
+    from app.services.lol_store.store import LoLStoreService
+    return LoLStoreService()
+
+
+def get_history_store(service: "LoLStoreService" = Depends(get_lol_store_service)) -> "HistoryStore":
+    return service.history
+
+
+@lru_cache(maxsize=None)
+def get_content_generator() -> "ContentGeneratorService":
+    from app.services.content.generator import ContentGeneratorService
+    return ContentGeneratorService()
+
+
+@lru_cache(maxsize=None)
+def get_youtube_publisher() -> "YouTubePublisherService":
+    from app.services.content.publisher import YouTubePublisherService
+    return YouTubePublisherService()
+
+
+@lru_cache(maxsize=None)
+def get_slp_login_service() -> "SLPLoginService":
+    from app.services.slp.login import SLPLoginService
+    return SLPLoginService()
+
+
+@lru_cache(maxsize=None)
+def get_content_scheduler() -> "ContentScheduler":
+    # ContentScheduler 가 이 모듈의 getter 를 사용하므로 순환 import 를 피하기 위해서도 여기서 import
+    from app.services.content.scheduler import ContentScheduler
+    return ContentScheduler()
@@ -0,0 +1,77 @@
+import json
+import os
+import socket
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pytz
+
+from app.core.config.settings import settings
+
+try:
+    import fcntl
+except ImportError:
+    # fcntl 이 없는 플랫폼(Windows)에서는 단일 프로세스로 보고 항상 리더가 됨
+    fcntl = None
+
+
+class LeaderLock:
+    """
+    Scheduler leadership across worker processes via an exclusive file lock
+
+    The first worker to flock the lock file becomes the leader and keeps the lock until it exits; the
+    kernel drops the lock when the process dies, so a follower retrying try_acquire() takes over. The
+    holder's pid, host and acquire time are written into the file for the status endpoint.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path or settings.SCHEDULER_LOCK_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd: Optional[int] = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._fd is not None
+
+    def try_acquire(self) -> bool:
+        """Take leadership if no other process holds it (non-blocking)"""
+        if self.is_leader:
+            return True
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        if fcntl is not None:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                os.close(fd)
+                return False
+        self._fd = fd
+        # 잠금을 잡은 뒤에만 내용을 덮어씀 (이전 리더의 정보는 여기서 교체됨)
+        holder = json.dumps({
+            "pid": os.getpid(),
+            "hostname": socket.gethostname(),
+            "acquired_at": datetime.now(pytz.timezone('Asia/Seoul')).isoformat(),
+        }).encode("utf-8")
+        os.ftruncate(fd, 0)
+        os.pwrite(fd, holder, 0)
+        os.fsync(fd)
+        return True
+
+    def release(self):
+        if self._fd is None:
+            return
+        try:
+            os.ftruncate(self._fd, 0)
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    def holder(self) -> Optional[Dict[str, Any]]:
+        """pid/hostname/acquired_at of the last process that took leadership, if recorded"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.loads(f.read() or "null")
+        except (OSError, ValueError):
+            return None
@@ -0,0 +1,122 @@
+import gzip
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from fastapi import Request, Response
+
+from app.core.config.settings import settings
+
+try:
+    import brotli
+except ImportError:
+    # brotli 가 설치되어 있지 않으면 gzip 만 사용
+    brotli = None
+
+# 이보다 작은 응답은 압축하지 않음
+MIN_COMPRESS_BYTES = 512
+
+
+def _accepted_encodings(header: str) -> Set[str]:
+    """Encodings listed in Accept-Encoding, excluding those with q=0"""
+    accepted = set()
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        if coding and params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+class CachedPayload:
+    """One JSON payload serialized once, with its compressed variants and strong ETags"""
+
+    def __init__(self, data: Any):
+        self.body = json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+        digest = hashlib.sha256(self.body).hexdigest()[:32]
+        # 인코딩마다 표현이 다르므로 ETag 도 인코딩별로 구분
+        self.variants: Dict[Optional[str], Tuple[bytes, str]] = {None: (self.body, f'"{digest}"')}
+        if len(self.body) >= MIN_COMPRESS_BYTES:
+            self.variants["gzip"] = (gzip.compress(self.body, compresslevel=9, mtime=0), f'"{digest}-gz"')
+            if brotli is not None:
+                self.variants["br"] = (brotli.compress(self.body), f'"{digest}-br"')
+        self.etags = {etag for _, etag in self.variants.values()}
+
+    def select(self, accept_encoding: str) -> Tuple[Optional[str], bytes, str]:
+        accepted = _accepted_encodings(accept_encoding)
+        for encoding in ("br", "gzip"):
+            if encoding in self.variants and encoding in accepted:
+                return (encoding, *self.variants[encoding])
+        return (None, *self.variants[None])
+
+    def matches(self, if_none_match: str) -> bool:
+        """Weak comparison of If-None-Match against every variant's ETag (RFC 7232)"""
+        if if_none_match.strip() == "*":
+            return True
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return not tags.isdisjoint(self.etags)
+
+
+class ResponseCache:
+    """
+    Pre-serialized JSON responses keyed by endpoint and data generation
+
+    The payload is built and serialized only when the generation changes (e.g. after a scrape saves
+    new data); other requests just pick a pre-compressed body or answer 304 Not Modified.
+    """
+
+    def __init__(self, max_age: Optional[int] = None):
+        self.max_age = settings.RESPONSE_CACHE_MAX_AGE if max_age is None else max_age
+        self._entries: Dict[str, Tuple[Any, CachedPayload]] = {}
+        self.stats = {"hits": 0, "builds": 0, "not_modified": 0}
+
+    async def _payload(self, key: str, generation: Any, build: Callable[[], Awaitable[Any]]) -> CachedPayload:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == generation:
+            self.stats["hits"] += 1
+            return entry[1]
+        payload = CachedPayload(await build())
+        self.stats["builds"] += 1
+        self._entries[key] = (generation, payload)
+        return payload
+
+    def invalidate(self, key: Optional[str] = None):
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    async def respond(
+        self,
+        request: Request,
+        key: str,
+        generation: Any,
+        build: Callable[[], Awaitable[Any]]
+    ) -> Response:
+        """
+        Serve a cached JSON payload for the request
+
+        Args:
+            request: Incoming request (If-None-Match / Accept-Encoding are honored)
+            key: Cache key, one per endpoint
+            generation: Version of the underlying data; a different value rebuilds the payload
+            build: Coroutine function returning the JSON-serializable data, called only on a rebuild
+        """
+        payload = await self._payload(key, generation, build)
+        encoding, body, etag = payload.select(request.headers.get("accept-encoding", ""))
+        headers = {
+            "ETag": etag,
+            "Cache-Control": f"public, max-age={self.max_age}",
+            "Vary": "Accept-Encoding",
+        }
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and payload.matches(if_none_match):
+            self.stats["not_modified"] += 1
+            return Response(status_code=304, headers=headers)
+
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        return Response(content=body, media_type="application/json", headers=headers)
+
+
+response_cache = ResponseCache()
@@ -1,16 +1,52 @@
+import asyncio
+import os
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from fastapi import HTTPException
 from pytz import timezone
-from app.services.content.scheduler import ContentScheduler
+from app.core.browser import browser_manager
+from app.core.config.settings import settings
+from app.core.dependencies import get_content_scheduler
+from app.core.leader import LeaderLock
 
 scheduler = AsyncIOScheduler()
+leader_lock = LeaderLock()
+_election_task = None
+
+async def _run_election():
+    """Start the scheduler once this worker holds the leader lock, retrying until it does"""
+    while not leader_lock.try_acquire():
+        await asyncio.sleep(settings.SCHEDULER_LEADER_RETRY_SECONDS)
+    scheduler.start()
+    print(f"Scheduler leader: pid {os.getpid()}")
+    # 스크래핑은 리더 워커에서만 실행되므로 공유 브라우저도 리더에서만 미리 띄움
+    try:
+        await browser_manager.start()
+    except Exception as e:
+        # 실패해도 첫 스크래핑 시 다시 실행을 시도함
+        print(f"Error starting browser: {str(e)}")
+
+def require_scheduler_leader():
+    """Reject a manual job run in a worker that is not the scheduler leader (it would race the leader's jobs)"""
+    if not leader_lock.is_leader:
+        raise HTTPException(
+            status_code=409,
+            detail={"message": "Jobs run in the scheduler leader worker, retry the request", "leader": leader_lock.holder()}
+        )
 
 def setup_scheduler():
-    """Setup scheduler for weekly scraping every Monday at 00:00 KST"""
+    """
+    Register the scheduled jobs and start the scheduler in the leader worker only
+
+    With several uvicorn workers every worker calls this on startup; one takes the leader lock and runs
+    the jobs, the others only serve HTTP and take over if the leader process dies.
+    """
+    global _election_task
     kst = timezone('Asia/Seoul')
+    content_scheduler = get_content_scheduler()
     
     scheduler.add_job(
-        func=ContentScheduler()._login_to_slp,
+        func=content_scheduler._login_to_slp,
         trigger=CronTrigger(
             hour=0,
             minute=10,
@@ -21,23 +57,9 @@ def setup_scheduler():
         replace_existing=True
     )
     
-    # 매주 화요일 새벽 3시 10분 - 예외처리 리스트 생성
-    scheduler.add_job(
-        func=ContentScheduler().create_exception_list,
-        trigger=CronTrigger(
-            day_of_week='tue',
-            hour=3,
-            minute=30,
-            timezone=kst
-        ),
-        id='create_exception_list',
-        name='Create LoL previous discounts list',
-        replace_existing=True
-    )
-    
     # 매주 화요일 새벽 4시 10분 - 주간 롤 스킨 갱신 (서머타임 해제 시, 5시로 변경 필요)
     scheduler.add_job(
-        func=ContentScheduler().run_weekly_update,
+        func=content_scheduler.run_weekly_update,
         trigger=CronTrigger(
             day_of_week='tue',
             hour=4,
@@ -49,5 +71,25 @@ def setup_scheduler():
         replace_existing=True
     )
     
-    # Start the scheduler
-    scheduler.start() 
\ No newline at end of file
+    # 리더가 된 워커에서만 스케줄러 시작
+    _election_task = asyncio.create_task(_run_election())
+
+def shutdown_scheduler():
+    """Stop the scheduler (or the pending election) and hand leadership to another worker"""
+    if _election_task is not None:
+        _election_task.cancel()
+    if scheduler.running:
+        scheduler.shutdown(wait=False)
+    leader_lock.release()
+
+def scheduler_status() -> dict:
+    """Leader lock holder and, in the leader worker, the scheduled jobs"""
+    return {
+        "pid": os.getpid(),
+        "is_leader": leader_lock.is_leader,
+        "leader": leader_lock.holder(),
+        "jobs": [
+            {"id": job.id, "name": job.name, "next_run_time": job.next_run_time}
+            for job in scheduler.get_jobs()
+        ] if scheduler.running else [],
+    } 
\ No newline at end of file
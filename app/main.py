@@ -1,8 +1,12 @@
-from fastapi import FastAPI
+import time
+from fastapi import Depends, FastAPI, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 from app.api.v1.router import api_router
-from app.core.scheduler import setup_scheduler
+from app.core.browser import browser_manager
+from app.core.dependencies import get_lol_store_service
+from app.core.response_cache import response_cache
+from app.core.scheduler import setup_scheduler, shutdown_scheduler
 from app.services.lol_store import LoLStoreService
 import os
 
@@ -18,13 +22,18 @@ app.mount("/static", StaticFiles(directory="app/static"), name="static")
 # Include API router
 app.include_router(api_router, prefix="/api/v1")
 
-# Initialize services
-lol_store_service = LoLStoreService()
-
 @app.on_event("startup")
 async def startup_event():
-    """Initialize scheduler on startup"""
+    """Register the scheduler; the worker that becomes leader also launches the shared browser"""
+    started = time.perf_counter()
     setup_scheduler()
+    print(f"Startup completed in {time.perf_counter() - started:.2f}s")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close shared browser and release scheduler leadership on shutdown"""
+    shutdown_scheduler()
+    await browser_manager.stop()
 
 @app.get("/")
 async def root():
@@ -32,6 +41,6 @@ async def root():
     return FileResponse("app/templates/index.html")
 
 @app.get("/discounts")
-async def get_discounts():
-    """Get current discount information"""
-    return await lol_store_service.get_discounts() 
\ No newline at end of file
+async def get_discounts(request: Request, lol_store_service: LoLStoreService = Depends(get_lol_store_service)):
+    """Get current discount information (cached per scrape, supports ETag/304)"""
+    return await response_cache.respond(request, "discounts", lol_store_service.current_generation(), lol_store_service.get_discounts) 
\ No newline at end of file
@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+from typing import Any, Dict
+
+class RunManifestResponse(BaseModel):
+    run_id: str
+    stages: Dict[str, Dict[str, Any]]
+
+class WeeklyUpdateTriggerResponse(BaseModel):
+    run_id: str
+    status: str
@@ -14,4 +14,49 @@ class DiscountResponse(BaseModel):
     results: List[DiscountedSkin]
 
 class LastUpdateResponse(BaseModel):
-    last_update: datetime 
\ No newline at end of file
+    last_update: datetime 
+
+class HistoryItem(BaseModel):
+    id: int
+    snapshot_id: int
+    scraped_at: datetime
+    week: str
+    name: str
+    price: str
+    price_rp: Optional[int]
+    discount: str
+    discount_pct: Optional[int]
+    url: str
+
+class HistoryPage(BaseModel):
+    items: List[HistoryItem]
+    next_cursor: Optional[int]
+
+class SeenSkin(BaseModel):
+    name: str
+    times: int
+    first_seen: datetime
+    last_seen: datetime
+    max_discount_pct: Optional[int]
+
+class SeenSkinPage(BaseModel):
+    items: List[SeenSkin]
+    next_cursor: Optional[str]
+
+class DiffSummary(BaseModel):
+    added: int
+    removed: int
+    changed: int
+    unchanged: int
+
+class ChangedSkin(BaseModel):
+    name: str
+    fields: List[str]
+    before: DiscountedSkin
+    after: DiscountedSkin
+
+class SnapshotDiffResponse(BaseModel):
+    summary: DiffSummary
+    added: List[DiscountedSkin]
+    removed: List[DiscountedSkin]
+    changed: List[ChangedSkin]
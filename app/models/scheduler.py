@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import datetime
+
+class LeaderInfo(BaseModel):
+    pid: int
+    hostname: str
+    acquired_at: datetime
+
+class ScheduledJob(BaseModel):
+    id: str
+    name: str
+    next_run_time: Optional[datetime]
+
+class SchedulerStatusResponse(BaseModel):
+    pid: int
+    is_leader: bool
+    leader: Optional[LeaderInfo]
+    jobs: List[ScheduledJob]
@@ -1,5 +1,15 @@
-from app.services.content.generator import ContentGeneratorService
-from app.services.content.publisher import YouTubePublisherService
-from app.services.content.scheduler import ContentScheduler
+# 서비스 모듈은 Pillow/moviepy/googleapiclient 를 import 하므로 실제로 사용할 때 불러옴
+_EXPORTS = {
+    'ContentGeneratorService': 'app.services.content.generator',
+    'YouTubePublisherService': 'app.services.content.publisher',
+    'ContentScheduler': 'app.services.content.scheduler',
+}
 
-__all__ = ['ContentGeneratorService', 'YouTubePublisherService', 'ContentScheduler'] 
\ No newline at end of file
+__all__ = ['ContentGeneratorService', 'YouTubePublisherService', 'ContentScheduler']
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        import importlib
+        return getattr(importlib.import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
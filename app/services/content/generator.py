@@ -29,4 +29,24 @@ class ContentGeneratorService:
             transition_duration=0.5
         )
         
-        return image_paths, video_path 
\ No newline at end of file
+        return image_paths, video_path
+
+
+def generate_images_in_process(discounts_data: dict) -> List[str]:
+    """
+    Process-pool entry point for the image stage of the weekly run
+
+    Builds the generator inside the worker so nothing unpicklable crosses the process boundary.
+    """
+    image_paths = DiscountImageGenerator().generate_all_images(discounts_data)
+    return [str(path) for path in image_paths]
+
+
+def generate_video_in_process() -> str:
+    """Process-pool entry point for the video stage of the weekly run"""
+    return VideoGenerator().create_weekly_sale_video(
+        image_dir="data/images",
+        audio_file="data/audio/bgm.mp3",
+        image_duration=3,
+        transition_duration=0.5
+    )
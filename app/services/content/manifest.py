@@ -0,0 +1,116 @@
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+import pytz
+
+# 주간 실행 순서
+STAGES = ("scrape", "images", "video", "upload", "playlist")
+RUNS_DIR = Path("data/runs")
+
+
+def hash_inputs(*parts: Any) -> str:
+    """Stable hash of JSON-serializable stage inputs"""
+    encoded = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def file_digest(path: str) -> str:
+    """sha256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class RunManifest:
+    """
+    Per-run record of the weekly pipeline stages
+
+    Each stage stores its inputs hash, outputs and status in data/runs/<run_id>.json.
+    A rerun reuses a stage whose status is done, whose inputs hash is unchanged and whose output files
+    still exist, and continues from the first stage that cannot be reused.
+    """
+
+    def __init__(self, run_id: str, runs_dir: Path = RUNS_DIR):
+        self.run_id = run_id
+        self.path = runs_dir / f"{run_id}.json"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.data = self._load()
+
+    @classmethod
+    def current(cls, runs_dir: Path = RUNS_DIR) -> "RunManifest":
+        """Manifest of this week's run, identified by the ISO week in KST (e.g. 2025-W20)"""
+        year, week, _ = datetime.now(pytz.timezone('Asia/Seoul')).isocalendar()
+        return cls(f"{year}-W{week:02d}", runs_dir)
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {"run_id": self.run_id, "stages": {}}
+
+    def save(self):
+        tmp_path = self.path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def reset(self):
+        """Forget every stage so the next run starts from scratch"""
+        self.data = {"run_id": self.run_id, "stages": {}}
+        self.save()
+
+    def _now(self) -> str:
+        return datetime.now(pytz.timezone('Asia/Seoul')).isoformat()
+
+    def reusable(self, stage: str, inputs_hash: str) -> Optional[Dict[str, Any]]:
+        """Outputs of a completed stage with the same inputs, or None if the stage has to run"""
+        entry = self.data["stages"].get(stage)
+        if not entry or entry.get("status") != "done" or entry.get("inputs_hash") != inputs_hash:
+            return None
+        if not all(os.path.exists(path) for path in entry.get("files", [])):
+            return None
+        return entry["outputs"]
+
+    def start(self, stage: str, inputs_hash: str):
+        self.data["stages"][stage] = {
+            "status": "running",
+            "inputs_hash": inputs_hash,
+            "started_at": self._now(),
+        }
+        self.save()
+
+    def complete(self, stage: str, outputs: Dict[str, Any], files: Iterable[str] = ()):
+        """Mark a stage done; files are checked for existence before the outputs are reused"""
+        entry = self.data["stages"].setdefault(stage, {})
+        entry.update({
+            "status": "done",
+            "outputs": outputs,
+            "files": [str(path) for path in files],
+            "finished_at": self._now(),
+        })
+        entry.pop("error", None)
+        self.save()
+
+    def fail(self, stage: str, error: str):
+        entry = self.data["stages"].setdefault(stage, {})
+        entry.update({"status": "failed", "error": error, "finished_at": self._now()})
+        self.save()
+
+    def skip(self, stage: str, reason: str):
+        self.data["stages"][stage] = {"status": "skipped", "reason": reason, "finished_at": self._now()}
+        self.save()
+
+    def summary(self) -> Dict[str, Any]:
+        """Run id and per-stage status in pipeline order"""
+        stages = self.data["stages"]
+        return {
+            "run_id": self.run_id,
+            "stages": {stage: stages[stage] for stage in STAGES if stage in stages},
+        }
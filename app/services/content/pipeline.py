@@ -0,0 +1,251 @@
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.config.settings import settings
+from app.services.image_generator.discount_image import DiscountImageGenerator, FONT_PATH, TEMPLATE_VERSION
+from app.services.lol_store.index import skin_key
+from app.services.lol_store.store import LoLStoreService
+from app.services.video.ffmpeg_encoder import FFmpegEncoder
+from app.services.video.video_generator import VideoGenerator
+
+# 큐가 끝났음을 알리는 값
+_DONE = None
+
+
+def _shutdown_executor(executor, terminate: bool):
+    """Shut a render pool down, killing its workers if the pipeline was cancelled"""
+    if terminate:
+        for process in list((getattr(executor, "_processes", None) or {}).values()):
+            process.terminate()
+    executor.shutdown(wait=not terminate, cancel_futures=terminate)
+
+
+class StreamingContentPipeline:
+    """
+    Weekly content pipeline with overlapping stages
+
+    scrape ──(skin queue)──> asset fetch + card render ──(card queue)──> segment encode ──> concat
+
+    Skins are rendered as soon as the scraper finds them and each finished card is encoded into its own
+    video segment, so the total time approaches the slowest stage instead of the sum of all stages.
+    Both queues are bounded: a slow renderer pauses the scraper and a slow encoder limits the number of
+    cards rendered ahead of it.
+
+    Streamed skins can differ from the final result (a source that fails part-way is replaced by the
+    next one), so the video is assembled in the order of the final discounts: segments encoded while
+    streaming are reused where the card and its predecessor match, and the rest are encoded at the end.
+    Segments are encoded with ffmpeg, so the video generator must use the ffmpeg backend.
+    """
+
+    def __init__(
+        self,
+        store_service: LoLStoreService,
+        image_generator: Optional[DiscountImageGenerator] = None,
+        video_generator: Optional[VideoGenerator] = None,
+        queue_size: Optional[int] = None,
+        image_duration: int = 3,
+        transition_duration: float = 0.5,
+        fade_duration: float = 1.0,
+        audio_file: str = "data/audio/bgm.mp3"
+    ):
+        self.store_service = store_service
+        self.image_generator = image_generator or DiscountImageGenerator()
+        self.video_generator = video_generator or VideoGenerator()
+        if self.video_generator.backend != "ffmpeg":
+            raise ValueError("StreamingContentPipeline encodes segments with ffmpeg, use the ffmpeg backend")
+        self.queue_size = queue_size or settings.PIPELINE_QUEUE_SIZE
+        self.image_duration = image_duration
+        self.transition_duration = transition_duration
+        self.fade_duration = fade_duration
+        self.audio_file = audio_file
+        self.stats: Dict[str, Any] = {}
+
+    def _mark(self, name: str):
+        """Record the time since the start of the run for a pipeline event (first only)"""
+        self.stats.setdefault(name, round(time.perf_counter() - self._started, 2))
+
+    async def _scrape(self, skins: asyncio.Queue) -> List[Dict[str, Any]]:
+        count = 0
+
+        async def on_items(items):
+            nonlocal count
+            self._mark("first_skin_s")
+            for skin in items:
+                count += 1
+                # 큐가 가득 차면 렌더링이 따라올 때까지 스크래핑이 대기
+                await skins.put((count, skin))
+
+        discounts = await self.store_service.update_discounts(on_items=on_items)
+        self._mark("scrape_done_s")
+        if self._on_scraped and discounts:
+            self._on_scraped(discounts)
+        await skins.put(_DONE)
+        return discounts
+
+    async def _render_card(self, executor, skin: Dict[str, Any], index: int, date_range) -> Path:
+        """Reuse a cached card or fetch the skin image and render it on the process pool"""
+        render_cache = self.image_generator.render_cache
+        output_path = self.image_generator.output_dir / f"{index:02d}.png"
+        key = render_cache.key(skin, date_range, TEMPLATE_VERSION, FONT_PATH)
+        if await asyncio.to_thread(render_cache.get, key, output_path):
+            return output_path
+
+        # 렌더 워커는 같은 디스크 캐시를 읽으므로 여기서 받아 두면 워커에서 네트워크를 쓰지 않음
+        await asyncio.to_thread(self.image_generator.asset_cache.fetch, skin["url"])
+        path = await asyncio.wrap_future(self.image_generator.submit_render(executor, skin, index, date_range))
+        await asyncio.to_thread(render_cache.put, key, path)
+        return path
+
+    async def _render(self, skins: asyncio.Queue, cards: asyncio.Queue, executor, date_range):
+        while (entry := await skins.get()) is not _DONE:
+            index, skin = entry
+            # 렌더링은 병렬로 진행하고, 인코더는 카드 큐 순서대로 결과를 기다림
+            task = asyncio.ensure_future(self._render_card(executor, skin, index, date_range))
+            self._card_tasks.append(task)
+            await cards.put((skin_key(skin), task))
+        await cards.put(_DONE)
+
+    def _encode_segment(self, encoder: FFmpegEncoder, key: tuple, previous: Optional[Path], card: Path, segment_dir: str) -> str:
+        """Encode one card, crossfading in from the previous card; the first card fades in and the last fades out"""
+        _, _, first, last = key
+        return encoder.encode_segment(
+            card,
+            str(Path(segment_dir) / f"{len(self._segments) + 1:03d}.mp4"),
+            image_duration=self.image_duration,
+            previous_image=previous,
+            transition_duration=self.transition_duration,
+            fade_in=self.fade_duration if first else 0,
+            fade_out=self.fade_duration if last else 0
+        )
+
+    async def _segment(self, encoder: FFmpegEncoder, keys: List[tuple], i: int, last: bool, segment_dir: str) -> str:
+        """Segment of the i-th card of `keys`, encoding it unless an identical one was already encoded"""
+        previous = keys[i - 1] if i > 0 else None
+        key = (previous, keys[i], i == 0, last)
+        if key not in self._segments:
+            started = time.perf_counter()
+            self._segments[key] = await asyncio.to_thread(
+                self._encode_segment, encoder, key, self._cards.get(previous), self._cards[keys[i]], segment_dir
+            )
+            self._encode_seconds += time.perf_counter() - started
+        return self._segments[key]
+
+    async def _encode(self, cards: asyncio.Queue, encoder: FFmpegEncoder, segment_dir: str):
+        """Encode segments in streaming order while cards arrive (the last card is encoded by _assemble)"""
+        keys = []
+        while (entry := await cards.get()) is not _DONE:
+            key, task = entry
+            self._cards[key] = await task
+            keys.append(key)
+            self._mark("first_card_s")
+            # 마지막 카드인지 알 수 있도록(페이드 아웃) 한 장 늦게 인코딩
+            if len(keys) > 1:
+                await self._segment(encoder, keys, len(keys) - 2, False, segment_dir)
+                self._mark("first_segment_s")
+        self._mark("render_done_s")
+
+    async def _assemble(self, discounts: List[Dict[str, Any]], executor, date_range, encoder: FFmpegEncoder, segment_dir: str) -> Tuple[List[Path], List[str]]:
+        """
+        Cards and segments in the order of the final discounts
+
+        Cards the final result has but the stream did not are rendered now; streamed cards that are not in
+        the final result are deleted. The cards are renamed 01.png, 02.png, ... in the final order so the
+        image directory matches the video.
+        """
+        keys = [skin_key(skin) for skin in discounts]
+        for index, (key, skin) in enumerate(zip(keys, discounts), len(self._cards) + 1):
+            if key not in self._cards:
+                self._cards[key] = await self._render_card(executor, skin, index, date_range)
+
+        segments = [
+            await self._segment(encoder, keys, i, i == len(keys) - 1, segment_dir)
+            for i in range(len(keys))
+        ]
+
+        # 최종 순서대로 01.png, 02.png ... 로 이름을 바꾸고 최종 결과에 없는 카드는 삭제
+        output_dir = self.image_generator.output_dir
+        staged = {}
+        for key, path in self._cards.items():
+            if key in staged:
+                continue
+            staged[key] = path.rename(path.with_suffix(".png.tmp"))
+        image_paths = []
+        for i, key in enumerate(keys, 1):
+            image_paths.append(staged.pop(key).rename(output_dir / f"{i:02d}.png"))
+        for path in staged.values():
+            path.unlink(missing_ok=True)
+        return image_paths, segments
+
+    async def run(
+        self, on_scraped: Optional[Callable[[List[Dict[str, Any]]], None]] = None
+    ) -> Tuple[List[Dict[str, Any]], List[str], Optional[str]]:
+        """
+        Scrape, render and encode the weekly video in one overlapped pass
+
+        Args:
+            on_scraped: Optional callback with the scraped discounts, called as soon as scraping finishes
+
+        Returns:
+            tuple: (scraped discounts, list of image paths, video path or None if nothing was found)
+        """
+        self._started = time.perf_counter()
+        self.stats = {}
+        self._card_tasks = []
+        self._cards: Dict[tuple, Path] = {}
+        self._segments: Dict[tuple, str] = {}
+        self._encode_seconds = 0.0
+        self._on_scraped = on_scraped
+        skins = asyncio.Queue(maxsize=self.queue_size)
+        cards = asyncio.Queue(maxsize=self.queue_size)
+
+        self.image_generator.clear_output_dir()
+        # 모든 카드가 같은 날짜 범위를 쓰도록 한 번만 계산
+        date_range = self.image_generator._get_date_range()
+        encoder = FFmpegEncoder.from_profile(self.video_generator.profile)
+        executor = self.image_generator.create_render_executor(self.image_generator.render_workers())
+        cancelled = True
+        try:
+            with tempfile.TemporaryDirectory(prefix="segments-") as segment_dir:
+                stages = [
+                    asyncio.ensure_future(self._scrape(skins)),
+                    asyncio.ensure_future(self._render(skins, cards, executor, date_range)),
+                    asyncio.ensure_future(self._encode(cards, encoder, segment_dir)),
+                ]
+                try:
+                    # 한 단계가 실패하면 나머지가 큐에서 영원히 기다리지 않도록 모두 취소
+                    done, _ = await asyncio.wait(stages, return_when=asyncio.FIRST_EXCEPTION)
+                    for stage in done:
+                        stage.result()
+                finally:
+                    for task in stages + self._card_tasks:
+                        task.cancel()
+
+                discounts = stages[0].result()
+                if not discounts:
+                    cancelled = False
+                    return discounts, [], None
+
+                image_paths, segments = await self._assemble(discounts, executor, date_range, encoder, segment_dir)
+                cancelled = False
+                self.image_generator.render_cache.evict()
+                video_path = await asyncio.to_thread(
+                    self.video_generator.create_video_from_segments,
+                    segments,
+                    self.video_generator.WEEKLY_VIDEO_FILENAME,
+                    self.image_duration,
+                    self.audio_file,
+                    self._encode_seconds
+                )
+        finally:
+            _shutdown_executor(executor, terminate=cancelled)
+
+        self.stats.update({
+            "cards": len(image_paths),
+            "render_cache": dict(self.image_generator.render_cache.stats),
+            "total_s": round(time.perf_counter() - self._started, 2),
+        })
+        print(f"파이프라인 통계: {self.stats}")
+        return discounts, [str(path) for path in image_paths], video_path
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Optional, List
 from datetime import datetime, timedelta
 import pytz
@@ -7,6 +8,19 @@ class YouTubePublisherService:
     def __init__(self):
         self.youtube_uploader = YouTubeUploader()
         self.playlist_id = "PLOjGkLv4hSDB54IOZlae8NXw69sjrEoZi"  # 롤 스킨 할인 재생목록 ID
+        self.keywords = ["롤스킨할인", "롤스킨세일", "롤할인", "롤할인스킨", "롤스킨", "스킨할인", "게임", "리그오브레전드"]
+
+    def _build_metadata(self, title: Optional[str], description: Optional[str]) -> tuple[str, str]:
+        """Fill in the default title and description"""
+        if title is None:
+            current_date = datetime.now(pytz.timezone('Asia/Seoul')).strftime("%m월 %d일")
+            title = f"주간 롤 스킨 할인 정보 ({current_date}) #게임 #리그오브레전드 #롤스킨세일 #롤스킨할인 #롤할인 #롤할인스킨"
+
+        if description is None:
+            current_date = datetime.now(pytz.timezone('Asia/Seoul'))
+            end_date = current_date + timedelta(days=7)
+            description = f"주간 롤 스킨 할인 정보 ({current_date.strftime('%m월 %d일')} ~ {end_date.strftime('%m월 %d일')})"
+        return title, description
 
     def publish_video(self, video_path: str, title: str = None, description: str = None) -> Optional[str]:
         """
@@ -20,14 +34,7 @@ class YouTubePublisherService:
         Returns:
             Optional[str]: YouTube video ID if successful, None otherwise
         """
-        if title is None:
-            current_date = datetime.now(pytz.timezone('Asia/Seoul')).strftime("%m월 %d일")
-            title = f"주간 롤 스킨 할인 정보 ({current_date}) #게임 #리그오브레전드 #롤스킨세일 #롤스킨할인 #롤할인 #롤할인스킨"
-
-        if description is None:
-            current_date = datetime.now(pytz.timezone('Asia/Seoul'))
-            end_date = current_date + timedelta(days=7)
-            description = f"주간 롤 스킨 할인 정보 ({current_date.strftime('%m월 %d일')} ~ {end_date.strftime('%m월 %d일')})"
+        title, description = self._build_metadata(title, description)
 
         # 비디오 업로드
         video_id = self.youtube_uploader.upload_video(
@@ -35,7 +42,7 @@ class YouTubePublisherService:
             title=title,
             description=description,
             privacy_status="public",
-            keywords=["롤스킨할인", "롤스킨세일", "롤할인", "롤할인스킨", "롤스킨", "스킨할인", "게임", "리그오브레전드"]
+            keywords=self.keywords
         )
 
         # 업로드 성공 시 재생목록에 추가
@@ -45,4 +52,24 @@ class YouTubePublisherService:
         #     else:
         #         print(f"Failed to add video to playlist: {self.playlist_id}")
 
-        return video_id 
\ No newline at end of file
+        return video_id
+
+    async def publish_video_async(self, video_path: str, title: str = None, description: str = None) -> Optional[str]:
+        """Async variant of publish_video that does not block the event loop while uploading"""
+        title, description = self._build_metadata(title, description)
+        return await self.youtube_uploader.upload_video_async(
+            file_path=video_path,
+            title=title,
+            description=description,
+            privacy_status="public",
+            keywords=self.keywords
+        )
+
+    async def add_to_playlist_async(self, video_id: str) -> bool:
+        """Add an uploaded video to the weekly discount playlist"""
+        added = await asyncio.to_thread(self.youtube_uploader.add_video_to_playlist, video_id, self.playlist_id)
+        if added:
+            print(f"Successfully added video to playlist: {self.playlist_id}")
+        else:
+            print(f"Failed to add video to playlist: {self.playlist_id}")
+        return added
@@ -1,17 +1,67 @@
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 import pytz
-from app.services.lol_store.store import LoLStoreService
-from app.services.content.generator import ContentGeneratorService
-from app.services.content.publisher import YouTubePublisherService
-from app.services.slp.login import SLPLoginService
+from app.core import dependencies
+from app.core.config.settings import settings
+from app.services.content.manifest import RunManifest, file_digest, hash_inputs
+
+# 이미지/비디오 생성(CPU 작업)을 이벤트 루프 밖에서 실행하는 프로세스 풀
+_content_executor = None
+
+
+def _get_content_executor() -> ProcessPoolExecutor:
+    global _content_executor
+    if _content_executor is None:
+        _content_executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+    return _content_executor
+
+
+def _terminate_content_executor():
+    """Kill the content worker so a cancelled or timed-out stage stops using CPU"""
+    global _content_executor
+    executor, _content_executor = _content_executor, None
+    if executor is None:
+        return
+    for process in list((executor._processes or {}).values()):
+        process.terminate()
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+# 정기 실행과 수동 실행이 같은 주차 매니페스트를 동시에 갱신하지 않도록 직렬화
+_weekly_update_lock = asyncio.Lock()
+
+
+def is_weekly_update_running() -> bool:
+    return _weekly_update_lock.locked()
+
 
 class ContentScheduler:
-    def __init__(self):
-        self.store_service = LoLStoreService()
-        self.content_generator = ContentGeneratorService()
-        self.youtube_publisher = YouTubePublisherService()
-        self.slp_login = SLPLoginService()
-        
+    """
+    Scheduled jobs of the weekly content flow
+
+    Services come from app.core.dependencies and are created on first use, so registering the jobs
+    does no work and the weekly scrape updates the same LoLStoreService the API serves.
+    """
+
+    @property
+    def store_service(self):
+        return dependencies.get_lol_store_service()
+
+    @property
+    def content_generator(self):
+        return dependencies.get_content_generator()
+
+    @property
+    def youtube_publisher(self):
+        return dependencies.get_youtube_publisher()
+
+    @property
+    def slp_login(self):
+        return dependencies.get_slp_login_service()
+
     def _login_to_slp(self):
         """
         Login to SLP (Student Life Portal)
@@ -44,43 +94,210 @@ class ContentScheduler:
         description += "\n\n#롤스킨할인 #롤스킨세일 #롤할인 #롤할인스킨 #롤스킨 #스킨할인 #게임 #리그오브레전드"
         return description
     
-    async def create_exception_list(self):
+    async def _run_stage(self, name: str, coro, timeout: float):
+        """
+        Run one pipeline stage with a timeout
+
+        On timeout or cancellation the stage coroutine is cancelled, which stops its worker.
+        """
+        started = time.perf_counter()
+        print(f"[{name}] 시작")
+        try:
+            result = await asyncio.wait_for(coro, timeout=timeout)
+        except asyncio.TimeoutError:
+            print(f"[{name}] 시간 초과 ({timeout}초)")
+            raise
+        except asyncio.CancelledError:
+            print(f"[{name}] 취소됨")
+            raise
+        print(f"[{name}] 완료 ({time.perf_counter() - started:.1f}초)")
+        return result
+
+    async def _offload(self, func, *args):
+        """Run a CPU-bound content function in the content process pool"""
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(_get_content_executor(), func, *args)
+        try:
+            return await future
+        except asyncio.CancelledError:
+            _terminate_content_executor()
+            raise
+
+    async def _checkpoint(self, manifest: RunManifest, stage: str, inputs_hash: str, make_coro, timeout: float, files=None):
         """
-        Create exception list from exception discounts data
+        Run a stage unless the manifest already has its outputs for the same inputs
+
+        make_coro returns the stage coroutine and is only called when the stage runs. The coroutine
+        returns the stage outputs (JSON-serializable dict), or None when there is nothing to record.
+        files maps the outputs to the files that must still exist for the outputs to be reused.
         """
-        discounts = await self.store_service.update_exception_discounts()
+        outputs = manifest.reusable(stage, inputs_hash)
+        if outputs is not None:
+            print(f"[{stage}] {manifest.run_id} 의 이전 결과를 재사용합니다.")
+            return outputs
+
+        manifest.start(stage, inputs_hash)
+        try:
+            outputs = await self._run_stage(stage, make_coro(), timeout)
+        except BaseException as e:
+            manifest.fail(stage, f"{type(e).__name__}: {e}")
+            raise
+        if outputs is None:
+            manifest.fail(stage, "no output")
+            return None
+        manifest.complete(stage, outputs, files(outputs) if files else ())
+        return outputs
+
+    def _scrape_outputs(self, discounts: list) -> dict:
+        """Scrape stage outputs, including the diff against last week's snapshot"""
+        last_diff = self.store_service.last_diff
+        return {
+            "last_update": self.store_service.last_update,
+            "discounts": discounts,
+            "diff": last_diff.summary() if last_diff else None
+        }
+
+    async def _scrape(self):
+        discounts = await self.store_service.update_discounts()
         if not discounts:
-            print("No discounts found. Exception list creation skipped.")
-        else:
-            print("Exception list is created.")
-        return
-        
+            return None
+        return self._scrape_outputs(discounts)
+
+    async def _generate_images(self, scraped: dict):
+        # Pillow/moviepy 는 주 1회 실행되는 콘텐츠 단계에서만 import
+        from app.services.content.generator import generate_images_in_process
+        return {"images": await self._offload(generate_images_in_process, scraped)}
+
+    async def _generate_video(self):
+        from app.services.content.generator import generate_video_in_process
+        return {"video": await self._offload(generate_video_in_process)}
+
+    async def _upload(self, video_path: str, discounts: list):
+        description = self._generate_description(discounts)
+        video_id = await self.youtube_publisher.publish_video_async(video_path, description=description)
+        return {"video_id": video_id} if video_id else None
+
+    async def _add_to_playlist(self, video_id: str):
+        if not await self.youtube_publisher.add_to_playlist_async(video_id):
+            return None
+        return {"playlist_id": self.youtube_publisher.playlist_id}
+
+    async def _stream_content(self, manifest: RunManifest, scrape_hash: str):
+        """Scrape, render and encode in one overlapped pass, recording all three stages"""
+        from app.services.content.pipeline import StreamingContentPipeline
+
+        def on_scraped(discounts):
+            # 인코딩이 실패해도 다음 실행에서 스크래핑은 건너뛸 수 있도록 먼저 기록
+            manifest.complete("scrape", self._scrape_outputs(discounts))
+
+        manifest.start("scrape", scrape_hash)
+        try:
+            discounts, image_paths, video_path = await self._run_stage(
+                "scrape+content",
+                StreamingContentPipeline(
+                    self.store_service,
+                    image_generator=self.content_generator.image_generator,
+                    video_generator=self.content_generator.video_generator
+                ).run(on_scraped=on_scraped),
+                settings.PIPELINE_SCRAPE_TIMEOUT + settings.PIPELINE_CONTENT_TIMEOUT
+            )
+        except BaseException as e:
+            stage = "images" if manifest.reusable("scrape", scrape_hash) else "scrape"
+            manifest.fail(stage, f"{type(e).__name__}: {e}")
+            raise
+        if not discounts or not video_path:
+            manifest.fail("scrape", "no discounts")
+            return None
+
+        manifest.start("images", self._images_inputs_hash(discounts))
+        manifest.complete("images", {"images": image_paths}, image_paths)
+        manifest.start("video", self._video_inputs_hash(image_paths))
+        manifest.complete("video", {"video": video_path}, [video_path])
+        return self._scrape_outputs(discounts)
+
+    def _images_inputs_hash(self, discounts: list) -> str:
+        from app.services.image_generator.discount_image import TEMPLATE_VERSION
+        return hash_inputs(discounts, TEMPLATE_VERSION)
+
+    def _video_inputs_hash(self, image_paths: list) -> str:
+        return hash_inputs([file_digest(path) for path in image_paths])
 
-    async def run_weekly_update(self):
+    async def run_weekly_update(self, force: bool = False):
         """
         Run the complete weekly update process:
         1. Scrape discount information
-        2. Generate content (images and video)
-        3. Publish to YouTube
+        2. Generate images, then the video, in a worker process
+        3. Publish to YouTube without blocking the event loop
+        4. Add the video to the playlist (PIPELINE_ADD_TO_PLAYLIST)
+
+        Progress is checkpointed in data/runs/<ISO week>.json. A rerun in the same week skips completed
+        stages whose inputs are unchanged, so a failed upload is retried without scraping or encoding again.
+        With PIPELINE_STREAMING and the ffmpeg backend, a fresh run scrapes, renders and encodes overlapped through
+        StreamingContentPipeline.
+
+        Args:
+            force: Ignore this week's checkpoints and run every stage again
         """
-        # 1. 스크래핑
-        discounts = await self.store_service.update_discounts()
-        if not discounts:
+        async with _weekly_update_lock:
+            manifest = RunManifest.current()
+            if force:
+                manifest.reset()
+            try:
+                await self._run_weekly_stages(manifest)
+            except asyncio.TimeoutError:
+                print("Weekly update aborted: stage timed out")
+            except Exception as e:
+                # 실패한 단계는 매니페스트에 기록되어 다음 실행에서 이어서 진행됨
+                print(f"Weekly update failed: {str(e)}")
+            return manifest.summary()
+
+    async def _run_weekly_stages(self, manifest: RunManifest):
+        # 1. 스크래핑 (주차마다 한 번)
+        scrape_hash = hash_inputs(manifest.run_id)
+        scraped = manifest.reusable("scrape", scrape_hash)
+        # 스트리밍 파이프라인은 카드마다 ffmpeg 로 구간을 인코딩하므로 moviepy 백엔드는 단계별 실행(프로세스 풀)을 사용
+        if scraped is None and settings.PIPELINE_STREAMING and settings.VIDEO_ENCODER_BACKEND == "ffmpeg":
+            # 1+2. 스크래핑과 동시에 카드 렌더링/구간 인코딩
+            scraped = await self._stream_content(manifest, scrape_hash)
+        else:
+            scraped = await self._checkpoint(
+                manifest, "scrape", scrape_hash, self._scrape, settings.PIPELINE_SCRAPE_TIMEOUT
+            )
+        if not scraped:
             print("No discounts found, skipping content generation")
             return
+        discounts = scraped["discounts"]
 
         # 2. 콘텐츠 생성
-        data = {
-            "last_update": self.store_service.last_update,
-            "discounts": discounts
-        }
-        image_paths, video_path = self.content_generator.generate_content(data)
-        print(f"Generated {len(image_paths)} images and video: {video_path}")
+        images = await self._checkpoint(
+            manifest, "images", self._images_inputs_hash(discounts),
+            lambda: self._generate_images(scraped), settings.PIPELINE_CONTENT_TIMEOUT,
+            files=lambda outputs: outputs["images"]
+        )
+        video = await self._checkpoint(
+            manifest, "video", self._video_inputs_hash(images["images"]),
+            self._generate_video, settings.PIPELINE_CONTENT_TIMEOUT,
+            files=lambda outputs: [outputs["video"]]
+        )
+        video_path = video["video"]
+        print(f"Generated {len(images['images'])} images and video: {video_path}")
 
-        # 3. YouTube 업로드
-        description = self._generate_description(discounts)
-        video_id = self.youtube_publisher.publish_video(video_path, description=description)
-        if video_id:
-            print(f"Successfully uploaded video to YouTube. Video ID: {video_id}")
-        else:
-            print("Failed to upload video to YouTube") 
\ No newline at end of file
+        # 3. YouTube 업로드 (같은 영상은 다시 올리지 않음)
+        uploaded = await self._checkpoint(
+            manifest, "upload", file_digest(video_path),
+            lambda: self._upload(video_path, discounts), settings.PIPELINE_UPLOAD_TIMEOUT
+        )
+        if not uploaded:
+            print("Failed to upload video to YouTube")
+            return
+        video_id = uploaded["video_id"]
+        print(f"Successfully uploaded video to YouTube. Video ID: {video_id}")
+
+        # 4. 재생목록 추가
+        if not settings.PIPELINE_ADD_TO_PLAYLIST:
+            manifest.skip("playlist", "PIPELINE_ADD_TO_PLAYLIST is disabled")
+            return
+        await self._checkpoint(
+            manifest, "playlist", hash_inputs(video_id, self.youtube_publisher.playlist_id),
+            lambda: self._add_to_playlist(video_id), settings.PIPELINE_UPLOAD_TIMEOUT
+        )
@@ -0,0 +1,128 @@
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.core.config.settings import settings
+
+
+class AssetCache:
+    """On-disk, URL-keyed cache of skin images with conditional revalidation"""
+
+    def __init__(
+        self,
+        cache_dir: Path = Path("data/cache/assets"),
+        max_bytes: Optional[int] = None,
+        workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+        fresh_seconds: Optional[int] = None,
+    ):
+        self.cache_dir = cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes or settings.ASSET_CACHE_MAX_MB * 1024 * 1024
+        self.workers = workers or settings.ASSET_DOWNLOAD_WORKERS
+        self.timeout = timeout or settings.ASSET_DOWNLOAD_TIMEOUT
+        self.fresh_seconds = settings.ASSET_CACHE_FRESH_SECONDS if fresh_seconds is None else fresh_seconds
+        self.stats = {"fresh": 0, "revalidated": 0, "downloaded": 0, "errors": 0}
+
+        # keep-alive 연결을 재사용하도록 세션의 커넥션 풀을 워커 수에 맞춤
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.workers, pool_maxsize=self.workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _paths(self, url: str):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.bin", self.cache_dir / f"{key}.json"
+
+    def _load_meta(self, meta_path: Path) -> Optional[dict]:
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_atomic(self, path: Path, data: bytes):
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def fetch(self, url: str) -> Path:
+        """Return the local path of an asset, downloading or revalidating it as needed"""
+        body_path, meta_path = self._paths(url)
+        meta = self._load_meta(meta_path) if body_path.exists() else None
+
+        if meta and time.time() - meta.get("fetched_at", 0) < self.fresh_seconds:
+            self.stats["fresh"] += 1
+            os.utime(body_path)
+            return body_path
+
+        headers = {}
+        if meta:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        try:
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+            if response.status_code == 304 and meta:
+                self.stats["revalidated"] += 1
+            else:
+                response.raise_for_status()
+                self._write_atomic(body_path, response.content)
+                self.stats["downloaded"] += 1
+                meta = {
+                    "url": url,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "size": len(response.content),
+                }
+        except requests.RequestException as e:
+            self.stats["errors"] += 1
+            if not meta:
+                raise
+            # 재검증에 실패하면 기존 캐시를 그대로 사용
+            print(f"Error revalidating {url}, using cached copy: {e}")
+            return body_path
+
+        meta["fetched_at"] = time.time()
+        self._write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+        os.utime(body_path)
+        return body_path
+
+    def prefetch(self, urls: Iterable[str]) -> Dict[str, Path]:
+        """Fetch all assets concurrently, returning {url: local path} for the ones that succeeded"""
+        unique_urls = list(dict.fromkeys(url for url in urls if url))
+        paths = {}
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {url: executor.submit(self.fetch, url) for url in unique_urls}
+            for url, future in futures.items():
+                try:
+                    paths[url] = future.result()
+                except Exception as e:
+                    print(f"Error downloading {url}: {e}")
+        self.evict(protected=set(paths.values()))
+        print(f"에셋 캐시: {self.stats}")
+        return paths
+
+    def evict(self, protected: Iterable[Path] = ()):
+        """Remove least recently used assets until the cache fits in max_bytes"""
+        protected = set(protected)
+        bodies = sorted(self.cache_dir.glob("*.bin"), key=lambda p: p.stat().st_mtime)
+        total = sum(p.stat().st_size for p in bodies)
+        for body_path in bodies:
+            if total <= self.max_bytes:
+                break
+            if body_path in protected:
+                continue
+            total -= body_path.stat().st_size
+            body_path.unlink(missing_ok=True)
+            body_path.with_suffix(".json").unlink(missing_ok=True)
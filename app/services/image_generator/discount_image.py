@@ -1,22 +1,68 @@
 from PIL import Image, ImageDraw, ImageFont
-import requests
 from io import BytesIO
 from datetime import datetime, timedelta
 import pytz
 import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from app.core.config.settings import settings
+from app.services.image_generator.asset_cache import AssetCache
+from app.services.image_generator.render_cache import RenderCache
+
+# 카드 레이아웃을 바꾸면 올려서 렌더 캐시를 무효화
+TEMPLATE_VERSION = 1
+FONT_PATH = "app/services/image_generator/fonts/GamjaFlower-Regular.ttf"
+RP_ICON_PATH = Path("app/services/image_generator/templates/icon_rp.png")
+
+
+@lru_cache(maxsize=None)
+def _load_font(size):
+    """Load a font once per process and share it between generator instances"""
+    return ImageFont.truetype(FONT_PATH, size)
+
+
+@lru_cache(maxsize=None)
+def _load_rp_icon():
+    """Decode the RP icon once per process"""
+    icon = Image.open(RP_ICON_PATH)
+    icon.load()
+    return icon
+
+
+# 렌더링 워커 프로세스마다 한 번만 생성되는 생성기 (폰트/템플릿 재사용)
+_worker_generator = None
+
+
+def _init_render_worker(asset_paths):
+    global _worker_generator
+    _worker_generator = DiscountImageGenerator()
+    _worker_generator._asset_paths = asset_paths
+
+
+def _render_in_worker(job):
+    skin, index, date_range = job
+    return _worker_generator.generate_discount_image(skin, index, date_range)
+
 
 class DiscountImageGenerator:
     def __init__(self):
         self.output_dir = Path("data/images")
         self.output_dir.mkdir(exist_ok=True)
-        self.rp_icon_path = Path("app/services/image_generator/templates/icon_rp.png")
-        
-        # 폰트 설정
-        self.title_font = ImageFont.truetype("app/services/image_generator/fonts/GamjaFlower-Regular.ttf", 68)
-        self.date_font = ImageFont.truetype("app/services/image_generator/fonts/GamjaFlower-Regular.ttf", 92)
-        self.name_font = ImageFont.truetype("app/services/image_generator/fonts/GamjaFlower-Regular.ttf", 64)
-        self.price_font = ImageFont.truetype("app/services/image_generator/fonts/GamjaFlower-Regular.ttf", 62   )
+        self.rp_icon_path = RP_ICON_PATH
+        self.asset_cache = AssetCache()
+        self.render_cache = RenderCache()
+        self._asset_paths = {}
+        # 현재 날짜 범위에 대해 한 번만 그리는 헤더(날짜 + 제목) 베이스 이미지
+        self._base_template = None
+        self._base_template_range = None
+
+        # 폰트 설정 (프로세스 전체에서 공유)
+        self.title_font = _load_font(68)
+        self.date_font = _load_font(92)
+        self.name_font = _load_font(64)
+        self.price_font = _load_font(62)
 
     def _create_template(self):
         """Create a template image with gradient background"""
@@ -33,35 +79,43 @@ class DiscountImageGenerator:
         return now.strftime("%Y.%m.%d"), end_date.strftime("%Y.%m.%d")
 
     def _download_image(self, url):
-        """Download image from URL"""
-        response = requests.get(url)
-        return Image.open(BytesIO(response.content))
+        """Load image from the asset cache, downloading it if needed"""
+        path = self._asset_paths.get(url) or self.asset_cache.fetch(url)
+        return Image.open(BytesIO(path.read_bytes()))
 
     def _resize_image(self, image, max_size=(1280, 1280)):
         """Resize image maintaining aspect ratio"""
         image.thumbnail(max_size, Image.Resampling.LANCZOS)
         return image
 
-    def generate_discount_image(self, skin_data, index):
-        """Generate discount image for a single skin"""
-        # 템플릿 이미지 생성
-        template = self._create_template()
-        draw = ImageDraw.Draw(template)
+    def _get_base_template(self, date_range):
+        """Return the header layer (date range and title) for a date range, rendering it once"""
+        if self._base_template_range != date_range:
+            template = self._create_template()
+            draw = ImageDraw.Draw(template)
 
-        # 날짜 범위 가져오기
-        start_date, end_date = self._get_date_range()
-        date_text = f"{start_date} ~ {end_date}"
-        title_text = "주간 롤 스킨 할인 정보"
+            start_date, end_date = date_range
+            date_text = f"{start_date} ~ {end_date}"
+            title_text = "주간 롤 스킨 할인 정보"
 
-        # 날짜와 제목 텍스트 그리기
-        date_bbox = draw.textbbox((0, 0), date_text, font=self.date_font)
-        title_bbox = draw.textbbox((0, 0), title_text, font=self.title_font)
-        
-        date_width = date_bbox[2] - date_bbox[0]
-        title_width = title_bbox[2] - title_bbox[0]
-        
-        draw.text(((template.width - date_width) // 2, 420), date_text, font=self.date_font, fill="white")
-        draw.text(((template.width - title_width) // 2, 560), title_text, font=self.title_font, fill="#FFD700")  # 노란색
+            # 날짜와 제목 텍스트 그리기
+            date_bbox = draw.textbbox((0, 0), date_text, font=self.date_font)
+            title_bbox = draw.textbbox((0, 0), title_text, font=self.title_font)
+
+            date_width = date_bbox[2] - date_bbox[0]
+            title_width = title_bbox[2] - title_bbox[0]
+
+            draw.text(((template.width - date_width) // 2, 420), date_text, font=self.date_font, fill="white")
+            draw.text(((template.width - title_width) // 2, 560), title_text, font=self.title_font, fill="#FFD700")  # 노란색
+            self._base_template = template
+            self._base_template_range = date_range
+        return self._base_template
+
+    def generate_discount_image(self, skin_data, index, date_range=None):
+        """Generate discount image for a single skin"""
+        # 헤더가 그려진 베이스 이미지를 복사해서 시작
+        template = self._get_base_template(date_range or self._get_date_range()).copy()
+        draw = ImageDraw.Draw(template)
 
         # 스킨 이미지 다운로드 및 배치
         skin_image = self._download_image(skin_data["url"])
@@ -75,7 +129,7 @@ class DiscountImageGenerator:
         draw.text(((template.width - name_width) // 2, 1600), skin_data["name"], font=self.name_font, fill="white")
 
         # RP 아이콘과 가격 정보 그리기
-        rp_icon = Image.open(self.rp_icon_path)
+        rp_icon = _load_rp_icon()
         price_text = f"{skin_data['price']} ({skin_data['discount']})"
         price_bbox = draw.textbbox((0, 0), price_text, font=self.price_font)
         price_width = price_bbox[2] - price_bbox[0]
@@ -91,17 +145,70 @@ class DiscountImageGenerator:
         template.save(output_path)
         return output_path
 
-    def generate_all_images(self, skins_data):
-        """Generate images for all skins"""
-        # 기존 이미지 파일 삭제
+    def clear_output_dir(self):
+        """Delete the cards of the previous run"""
         for file in self.output_dir.glob("*.png"):
             try:
                 file.unlink()
             except Exception as e:
                 print(f"Error deleting file {file}: {e}")
 
-        generated_paths = []
-        for i, skin in enumerate(skins_data["discounts"], 1):
-            path = self.generate_discount_image(skin, i)
-            generated_paths.append(path)
-        return generated_paths 
\ No newline at end of file
+    def render_workers(self, workers=None, job_count=None):
+        """Number of render processes to use (IMAGE_RENDER_WORKERS, 0 = one per CPU)"""
+        workers = settings.IMAGE_RENDER_WORKERS if workers is None else workers
+        if workers <= 0:
+            workers = os.cpu_count() or 1
+        return min(workers, job_count) if job_count is not None else workers
+
+    def create_render_executor(self, workers):
+        """Process pool whose workers each hold one generator (fonts/templates loaded once)"""
+        # spawn 컨텍스트: 스케줄러/이벤트 루프 스레드가 있는 부모 프로세스를 fork 하지 않음
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_render_worker,
+            initargs=(self._asset_paths,),
+        )
+
+    def submit_render(self, executor, skin, index, date_range):
+        """Render one card on a pool from create_render_executor(), returning a concurrent future"""
+        return executor.submit(_render_in_worker, (skin, index, date_range))
+
+    def generate_all_images(self, skins_data, workers=None):
+        """Generate images for all skins, optionally across a process pool"""
+        # 기존 이미지 파일 삭제
+        self.clear_output_dir()
+
+        # 모든 카드가 같은 날짜 범위를 쓰도록 한 번만 계산
+        date_range = self._get_date_range()
+        skins = skins_data["discounts"]
+        generated_paths = [self.output_dir / f"{i:02d}.png" for i in range(1, len(skins) + 1)]
+
+        # 스킨/가격/할인/날짜/템플릿/폰트가 같으면 이전에 인코딩한 PNG 를 재사용
+        keys = [self.render_cache.key(skin, date_range, TEMPLATE_VERSION, FONT_PATH) for skin in skins]
+        jobs = [
+            (skin, i, date_range)
+            for i, (skin, key, path) in enumerate(zip(skins, keys, generated_paths), 1)
+            if not self.render_cache.get(key, path)
+        ]
+
+        if jobs:
+            # 렌더링 전에 필요한 스킨 이미지를 병렬로 받아 둠
+            self._asset_paths = self.asset_cache.prefetch(skin["url"] for skin, _, _ in jobs)
+            rendered = self._render_jobs(jobs, workers)
+            for (_, i, _), path in zip(jobs, rendered):
+                self.render_cache.put(keys[i - 1], path)
+        self.render_cache.evict()
+        print(f"렌더 캐시: {self.render_cache.stats}")
+        return generated_paths
+
+    def _render_jobs(self, jobs, workers=None):
+        """Render (skin, index, date_range) jobs in order, optionally across a process pool"""
+        workers = self.render_workers(workers, len(jobs))
+
+        if workers <= 1:
+            return [self.generate_discount_image(*job) for job in jobs]
+
+        with self.create_render_executor(workers) as executor:
+            # map 은 입력 순서대로 결과를 돌려주므로 01.png, 02.png ... 순서가 유지됨
+            return list(executor.map(_render_in_worker, jobs))
@@ -0,0 +1,86 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from app.core.config.settings import settings
+
+
+@lru_cache(maxsize=None)
+def _file_digest(path: str) -> str:
+    """Hash a file once per process (fonts do not change while the app runs)"""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return path
+
+
+class RenderCache:
+    """Content-addressed cache of encoded discount cards"""
+
+    def __init__(
+        self,
+        cache_dir: Path = Path("data/cache/renders"),
+        max_bytes: Optional[int] = None,
+        max_age_seconds: Optional[int] = None,
+    ):
+        self.cache_dir = cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes or settings.RENDER_CACHE_MAX_MB * 1024 * 1024
+        self.max_age_seconds = max_age_seconds or settings.RENDER_CACHE_MAX_AGE_DAYS * 86400
+        self.stats = {"hits": 0, "misses": 0}
+
+    def key(self, skin: Dict[str, Any], date_range: Iterable[str], template_version: int, font_path: str) -> str:
+        """Hash of everything that affects the rendered card"""
+        payload = {
+            "skin": {field: skin.get(field) for field in ("url", "name", "price", "discount")},
+            "date_range": list(date_range),
+            "template_version": template_version,
+            "font": _file_digest(font_path),
+        }
+        encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.png"
+
+    def get(self, key: str, output_path: Path) -> bool:
+        """Copy a cached card to output_path, returning False on a miss"""
+        cached = self._path(key)
+        if not cached.exists():
+            self.stats["misses"] += 1
+            return False
+        shutil.copyfile(cached, output_path)
+        os.utime(cached)
+        self.stats["hits"] += 1
+        return True
+
+    def put(self, key: str, rendered_path: Path):
+        """Store a freshly rendered card"""
+        cached = self._path(key)
+        tmp_path = cached.with_suffix(".png.tmp")
+        shutil.copyfile(rendered_path, tmp_path)
+        os.replace(tmp_path, cached)
+
+    def evict(self):
+        """Drop cards older than max_age, then the least recently used ones above max_bytes"""
+        now = time.time()
+        entries = []
+        for path in self.cache_dir.glob("*.png"):
+            stat = path.stat()
+            if now - stat.st_mtime > self.max_age_seconds:
+                path.unlink(missing_ok=True)
+            else:
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
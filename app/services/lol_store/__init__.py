@@ -1,3 +1,4 @@
 from app.services.lol_store.store import LoLStoreService
+from app.services.lol_store.sources import DiscountSource, HttpDiscountSource, PlaywrightDiscountSource
 
-__all__ = ['LoLStoreService'] 
\ No newline at end of file
+__all__ = ['LoLStoreService', 'DiscountSource', 'HttpDiscountSource', 'PlaywrightDiscountSource'] 
\ No newline at end of file
@@ -0,0 +1,66 @@
+from typing import Any, Dict, Iterable, List
+
+from app.services.lol_store.index import SKIN_KEY_FIELDS, ExceptionIndex, name_key, skin_key
+
+
+class SnapshotDiff:
+    """Added, removed and changed skins between two scrapes, keyed by skin name"""
+
+    def __init__(self, previous: Iterable[Dict[str, Any]], current: Iterable[Dict[str, Any]]):
+        """
+        Args:
+            previous: Skins of the last persisted snapshot
+            current: Skins of the new scrape, in scrape order
+        """
+        previous = list(previous)
+        before = {name_key(skin): skin for skin in previous}
+        # 스트리밍 필터(LoLStoreService.exception_index)와 같은 기준: 직전 스냅샷의 (이름, 할인율)
+        self.carried_over = ExceptionIndex(previous)
+        self.current = list(current)
+        self.added: List[Dict[str, Any]] = []
+        self.changed: List[Dict[str, Any]] = []
+        self.unchanged: List[Dict[str, Any]] = []
+
+        # 새 결과를 한 번 훑으면서 이전 스냅샷의 키 맵에서 찾음
+        seen = set()
+        for skin in self.current:
+            key = name_key(skin)
+            seen.add(key)
+            old = before.get(key)
+            if old is None:
+                self.added.append(skin)
+                continue
+            fields = [
+                field for field, old_value, new_value in zip(SKIN_KEY_FIELDS, skin_key(old), skin_key(skin))
+                if old_value != new_value
+            ]
+            if fields:
+                self.changed.append({"name": skin.get("name"), "fields": fields, "before": old, "after": skin})
+            else:
+                self.unchanged.append(skin)
+        self.removed: List[Dict[str, Any]] = [skin for key, skin in before.items() if key not in seen]
+
+    @property
+    def fresh(self) -> List[Dict[str, Any]]:
+        """
+        Skins that are newly on sale, in scrape order: added, or still on sale with a different discount
+
+        A skin recorded with the same discount in the last snapshot is a sale carried over from last week.
+        """
+        return [skin for skin in self.current if skin not in self.carried_over]
+
+    def summary(self) -> Dict[str, int]:
+        return {
+            "added": len(self.added),
+            "removed": len(self.removed),
+            "changed": len(self.changed),
+            "unchanged": len(self.unchanged),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "summary": self.summary(),
+            "added": self.added,
+            "removed": self.removed,
+            "changed": self.changed,
+        }
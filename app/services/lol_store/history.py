@@ -0,0 +1,193 @@
+import re
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import pytz
+
+from app.core.config.settings import settings
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    scraped_at TEXT NOT NULL,
+    week TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    item_count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS snapshot_items (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots(id),
+    scraped_at TEXT NOT NULL,
+    week TEXT NOT NULL,
+    name TEXT NOT NULL,
+    price TEXT NOT NULL,
+    price_rp INTEGER,
+    discount TEXT NOT NULL,
+    discount_pct INTEGER,
+    url TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_snapshots_week ON snapshots(week, kind, id);
+CREATE INDEX IF NOT EXISTS idx_items_name ON snapshot_items(name, id);
+CREATE INDEX IF NOT EXISTS idx_items_name_seen ON snapshot_items(name, scraped_at, discount_pct);
+CREATE INDEX IF NOT EXISTS idx_items_week ON snapshot_items(week, id);
+CREATE INDEX IF NOT EXISTS idx_items_scraped_at ON snapshot_items(scraped_at);
+CREATE INDEX IF NOT EXISTS idx_items_discount ON snapshot_items(discount_pct, id);
+"""
+
+ITEM_COLUMNS = "id, snapshot_id, scraped_at, week, name, price, price_rp, discount, discount_pct, url"
+
+KST = pytz.timezone('Asia/Seoul')
+
+
+def iso_week(timestamp: Optional[str] = None) -> str:
+    """ISO week label (e.g. 2025-W20) of an ISO timestamp, or of now in KST"""
+    moment = datetime.fromisoformat(timestamp) if timestamp else datetime.now(KST)
+    year, week, _ = moment.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def _parse_int(text: str) -> Optional[int]:
+    """Leading number of a scraped value ('1,350 RP' -> 1350, '-30%' -> 30)"""
+    match = re.search(r"\d[\d,]*", text or "")
+    return int(match.group().replace(",", "")) if match else None
+
+
+class HistoryStore:
+    """
+    SQLite history of every scrape
+
+    Each scrape is stored as a snapshot with its items, so price history, weekly sale lists and
+    "seen discounted before" lists are indexed queries instead of re-scraping. List queries use keyset
+    pagination on the item id (monotonic in scrape order): pass the returned next_cursor back as cursor.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = Path(db_path or settings.HISTORY_DB_PATH)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        # 요청마다 짧게 연결 (WAL 모드라 스크래핑 중 기록과 API 조회가 서로 막지 않음)
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def record(self, skins: Iterable[Dict[str, Any]], scraped_at: Optional[str] = None, kind: str = "weekly") -> int:
+        """
+        Store one scrape as a snapshot
+
+        Args:
+            skins: Scraped {url, name, price, discount} dicts
+            scraped_at: ISO timestamp of the scrape (default: now in KST)
+            kind: "weekly" or "exception"
+
+        Returns:
+            int: Snapshot id
+        """
+        scraped_at = scraped_at or datetime.now(KST).isoformat()
+        week = iso_week(scraped_at)
+        skins = list(skins)
+        with self._connect() as conn:
+            snapshot_id = conn.execute(
+                "INSERT INTO snapshots (scraped_at, week, kind, item_count) VALUES (?, ?, ?, ?)",
+                (scraped_at, week, kind, len(skins))
+            ).lastrowid
+            conn.executemany(
+                "INSERT INTO snapshot_items (snapshot_id, scraped_at, week, name, price, price_rp, discount, discount_pct, url)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        snapshot_id, scraped_at, week, skin.get("name", ""), skin.get("price", ""),
+                        _parse_int(skin.get("price", "")), skin.get("discount", ""),
+                        _parse_int(skin.get("discount", "")), skin.get("url", "")
+                    )
+                    for skin in skins
+                ]
+            )
+        return snapshot_id
+
+    @staticmethod
+    def _page(rows: List[sqlite3.Row], limit: int) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Rows of one page (limit + 1 were fetched) and the cursor of the next page"""
+        items = [dict(row) for row in rows[:limit]]
+        next_cursor = items[-1]["id"] if len(rows) > limit else None
+        return items, next_cursor
+
+    def price_history(self, name: str, cursor: Optional[int] = None, limit: int = 50):
+        """Every recorded price/discount of a skin, oldest first"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT {ITEM_COLUMNS} FROM snapshot_items WHERE name = ? AND id > ? ORDER BY id LIMIT ?",
+                (name, cursor or 0, limit + 1)
+            ).fetchall()
+        return self._page(rows, limit)
+
+    def week_items(self, week: str, cursor: Optional[int] = None, limit: int = 50, kind: str = "weekly"):
+        """Skins on sale in a week, from that week's latest snapshot of the given kind"""
+        with self._connect() as conn:
+            snapshot = conn.execute(
+                "SELECT id FROM snapshots WHERE week = ? AND kind = ? ORDER BY id DESC LIMIT 1",
+                (week, kind)
+            ).fetchone()
+            if snapshot is None:
+                return [], None
+            rows = conn.execute(
+                f"SELECT {ITEM_COLUMNS} FROM snapshot_items WHERE week = ? AND snapshot_id = ? AND id > ? ORDER BY id LIMIT ?",
+                (week, snapshot["id"], cursor or 0, limit + 1)
+            ).fetchall()
+        return self._page(rows, limit)
+
+    def seen_discounted(self, before: Optional[str] = None, cursor: Optional[str] = None, limit: int = 50):
+        """
+        Skins that appeared discounted before a date, one row per skin name
+
+        Args:
+            before: ISO date/timestamp upper bound (exclusive), default: no bound
+            cursor: Last skin name of the previous page
+
+        Returns:
+            tuple: (rows of {name, times, first_seen, last_seen, max_discount_pct}, next cursor)
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT name, COUNT(*) AS times, MIN(scraped_at) AS first_seen, MAX(scraped_at) AS last_seen,"
+                " MAX(discount_pct) AS max_discount_pct"
+                " FROM snapshot_items WHERE name > ? AND scraped_at < ?"
+                " GROUP BY name ORDER BY name LIMIT ?",
+                (cursor or "", before or "9999", limit + 1)
+            ).fetchall()
+        items = [dict(row) for row in rows[:limit]]
+        next_cursor = items[-1]["name"] if len(rows) > limit else None
+        return items, next_cursor
+
+    def latest_snapshot(
+        self, before_week: Optional[str] = None, kind: Optional[str] = None, week: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Latest snapshot (optionally of a week, before a week and/or of a kind) with its items"""
+        query = "SELECT * FROM snapshots WHERE week < ?"
+        params: List[Any] = [before_week or "9999"]
+        if week:
+            query += " AND week = ?"
+            params.append(week)
+        if kind:
+            query += " AND kind = ?"
+            params.append(kind)
+        with self._connect() as conn:
+            snapshot = conn.execute(query + " ORDER BY id DESC LIMIT 1", params).fetchone()
+            if snapshot is None:
+                return None
+            items = conn.execute(
+                "SELECT url, name, price, discount FROM snapshot_items WHERE snapshot_id = ? ORDER BY id",
+                (snapshot["id"],)
+            ).fetchall()
+        return dict(snapshot, items=[dict(item) for item in items])
@@ -0,0 +1,65 @@
+from typing import Dict, Iterable, List, Any, Tuple
+
+
+def _normalize(value: Any) -> str:
+    """Normalize a scraped text value (trim and collapse whitespace)"""
+    if value is None:
+        return ""
+    return " ".join(str(value).split())
+
+
+SKIN_KEY_FIELDS = ("name", "discount", "price", "url")
+
+
+def skin_key(skin: Dict[str, Any]) -> Tuple[str, str, str, str]:
+    """Identity of a scraped skin: (name, discount, price, url)"""
+    return tuple(_normalize(skin.get(field)) for field in SKIN_KEY_FIELDS)
+
+
+def name_key(skin: Dict[str, Any]) -> str:
+    """Identity used by snapshot diffs: the skin name"""
+    return _normalize(skin.get("name"))
+
+
+def exception_key(skin: Dict[str, Any]) -> Tuple[str, str]:
+    """Identity used by the exception list: (name, discount)"""
+    return _normalize(skin.get("name")), _normalize(skin.get("discount"))
+
+
+class DiscountIndex:
+    """Insertion-ordered, hashed collection of scraped skins"""
+
+    def __init__(self, skins: Iterable[Dict[str, Any]] = ()):
+        self._items: Dict[Tuple[str, str, str, str], Dict[str, Any]] = {}
+        for skin in skins:
+            self.add(skin)
+
+    def add(self, skin: Dict[str, Any]) -> bool:
+        """Add a skin, returning False if an identical skin was already collected"""
+        key = skin_key(skin)
+        if key in self._items:
+            return False
+        self._items[key] = skin
+        return True
+
+    def __contains__(self, skin: Dict[str, Any]) -> bool:
+        return skin_key(skin) in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        return list(self._items.values())
+
+
+class ExceptionIndex:
+    """Precomputed set of (name, discount) pairs from the exception list"""
+
+    def __init__(self, exceptions: Iterable[Dict[str, Any]] = ()):
+        self._keys = {exception_key(exception) for exception in exceptions}
+
+    def __contains__(self, skin: Dict[str, Any]) -> bool:
+        return exception_key(skin) in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
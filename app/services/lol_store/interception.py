@@ -0,0 +1,84 @@
+from typing import Dict, Any, Iterable
+from urllib.parse import urlparse
+from app.core.config.settings import settings
+
+# 스크래퍼는 DOM 의 텍스트와 data-asset-url 만 읽으므로 실제 파일은 필요 없음
+BLOCKED_RESOURCE_TYPES = ("image", "media", "font")
+
+ANALYTICS_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "facebook.net",
+    "hotjar.com",
+    "sentry.io",
+    "newrelic.com",
+    "nr-data.net",
+)
+
+
+class ResourceBlocker:
+    """Abort image, media, font (and optionally analytics) requests of a browser context"""
+
+    def __init__(
+        self,
+        block_types: Iterable[str] = BLOCKED_RESOURCE_TYPES,
+        block_analytics: bool = True,
+        allowlist: Iterable[str] = (),
+    ):
+        self.block_types = set(block_types)
+        self.block_analytics = block_analytics
+        self.allowlist = tuple(pattern for pattern in allowlist if pattern)
+        self.stats = {
+            "blocked_requests": 0,
+            "blocked_by_type": {},
+            "allowed_requests": 0,
+            "transferred_bytes": 0,
+        }
+
+    @classmethod
+    def from_settings(cls) -> "ResourceBlocker":
+        return cls(
+            block_analytics=settings.LOL_STORE_BLOCK_ANALYTICS,
+            allowlist=settings.LOL_STORE_BLOCK_ALLOWLIST.split(","),
+        )
+
+    def _is_allowed(self, url: str) -> bool:
+        return any(pattern.strip() in url for pattern in self.allowlist)
+
+    def _is_analytics(self, url: str) -> bool:
+        host = urlparse(url).hostname or ""
+        return any(host == domain or host.endswith("." + domain) for domain in ANALYTICS_HOSTS)
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        if self._is_allowed(url):
+            return False
+        if resource_type in self.block_types:
+            return True
+        return self.block_analytics and self._is_analytics(url)
+
+    async def _handle_route(self, route):
+        request = route.request
+        if self.should_block(request.url, request.resource_type):
+            self.stats["blocked_requests"] += 1
+            by_type = self.stats["blocked_by_type"]
+            by_type[request.resource_type] = by_type.get(request.resource_type, 0) + 1
+            await route.abort()
+        else:
+            self.stats["allowed_requests"] += 1
+            await route.continue_()
+
+    def _on_response(self, response):
+        # 압축 전송 크기를 알 수 없는 응답(chunked)은 집계에서 제외
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            self.stats["transferred_bytes"] += int(length)
+
+    async def install(self, context):
+        """Register the interception route and response accounting on a browser context"""
+        await context.route("**/*", self._handle_route)
+        context.on("response", self._on_response)
+
+    def summary(self) -> Dict[str, Any]:
+        return dict(self.stats, blocked_by_type=dict(self.stats["blocked_by_type"]))
@@ -0,0 +1,101 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    # orjson 이 설치되어 있지 않으면 표준 json 으로 직렬화
+    orjson = None
+
+
+def dumps(data: Any) -> bytes:
+    """Compact UTF-8 JSON"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _fsync_dir(path: Path):
+    """Persist a rename in the directory (no-op where directories cannot be opened, e.g. Windows)"""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def atomic_write(path: Path, raw: bytes):
+    """Write via temp file + fsync + rename so readers see either the old or the new contents"""
+    # 워커마다 다른 임시 파일을 쓰도록 mkstemp 사용 (같은 디렉터리여야 rename 이 원자적)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    _fsync_dir(path.parent)
+
+
+class JsonFile:
+    """
+    JSON file written atomically and re-read only when it changes on disk
+
+    save() writes a temp file in the same directory, fsyncs it and renames it over the target, so a crash
+    mid-write leaves the previous file intact and readers never see partial data. load_if_changed()
+    compares the file's stat signature with the last one seen, so unchanged files are not parsed again.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._signature: Optional[Tuple[int, int, int]] = None
+
+    def _stat(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def save(self, data: Any):
+        atomic_write(self.path, dumps(data))
+        self._signature = self._stat()
+
+    def load_if_changed(self) -> Optional[Dict[str, Any]]:
+        """Parsed contents if the file changed since the last save/load, otherwise None"""
+        signature = self._stat()
+        if signature is None or signature == self._signature:
+            return None
+        with open(self.path, "rb") as f:
+            data = loads(f.read())
+        self._signature = signature
+        return data
+
+    def export_pretty(self, path: Path):
+        """Write an indented, human-readable copy of the current file"""
+        with open(self.path, "rb") as f:
+            data = loads(f.read())
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(path, json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8"))
@@ -0,0 +1,379 @@
+import asyncio
+import json
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Awaitable, Callable, List, Dict, Any, Optional
+from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
+
+import httpx
+import pytz
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from app.core.browser import browser_manager
+from app.core.config.settings import settings
+from app.services.lol_store.index import DiscountIndex
+from app.services.lol_store.interception import ResourceBlocker
+
+STORE_URL = "https://store.leagueoflegends.co.kr/skins?sort=ReleaseDate&order=DESC"
+
+# 수집 도중 새로 찾은 항목 묶음을 넘겨받는 콜백 (스트리밍 파이프라인용)
+ItemsCallback = Callable[[List[Dict[str, str]]], Awaitable[None]]
+
+# 카탈로그 응답(JSON)의 필드 경로. 캡처한 응답 구조가 바뀌면 이 매핑만 수정
+# (Playwright 소스가 캡처 파일에 남기는 첫 응답(sample)을 tests/fixtures/lol_store/catalog_recording.json 으로 복사해 검증)
+CATALOG_FIELDS = {
+    "items": "data",
+    "total_pages": "totalPages",
+    "name": "name",
+    "url": "assetUrl",
+    "price": "sale.price",
+    "discount": "sale.discountRate",
+}
+
+
+def _get_path(data: Any, path: str) -> Any:
+    """Resolve a dotted path (e.g. 'sale.price') in nested dicts"""
+    for key in path.split("."):
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+class DiscountSource(ABC):
+    """A backend that returns the currently discounted skins"""
+
+    name = "base"
+
+    def __init__(self):
+        self.last_stats: Dict[str, Any] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return True
+
+    @abstractmethod
+    async def fetch(self, on_items: Optional[ItemsCallback] = None) -> List[Dict[str, str]]:
+        """
+        Return discounted skins as {url, name, price, discount} dicts
+
+        If on_items is given, it is awaited with each batch of newly found skins as soon as the batch is collected.
+        """
+
+
+class PlaywrightDiscountSource(DiscountSource):
+    """Scrape the store's infinite-scroll UI with the shared headless browser"""
+
+    name = "playwright"
+
+    def __init__(self, capture_file: Path = Path("data/lol_store/catalog_capture.json")):
+        super().__init__()
+        self.capture_file = capture_file
+
+    @staticmethod
+    def _new_stats() -> Dict[str, Any]:
+        """Empty per-run scrape statistics"""
+        return {"scrolls": 0, "wait_ms": 0.0, "items": 0, "elapsed_s": 0.0, "items_per_s": 0.0}
+
+    async def fetch_new_discounted_skins(self, page, scroll_step=0, ready_timeout=0, quiet_ms=0):
+        """Collect only not-yet-returned discount nodes, report scroll metrics, scroll and wait for readiness in one round trip"""
+        return await page.evaluate("""
+        async ({scrollStep, readyTimeout, quietMs}) => {
+            let discounts = document.querySelectorAll('.sale-discount');
+            let items = [];
+            for (let i = 0; i < discounts.length; i++) {
+                // 이미 반환한 노드는 건너뜀 (DOM 에 표시를 남겨 다음 라운드에서 재방문하지 않음)
+                if (discounts[i].dataset.hmhCollected) continue;
+                try {
+                    const element = discounts[i].parentNode.parentElement.parentElement.children[0].children[0].children[0];
+                    const imgUrl = element.dataset.assetUrl;
+
+                    let name = discounts[i].parentNode.parentElement.previousElementSibling.children[0].innerText;
+                    let price = discounts[i].parentNode.parentElement.previousElementSibling.children[1]
+                                .querySelectorAll('.price')[1].innerText;
+                    let discount = discounts[i].innerText;
+                    items.push({
+                        url: imgUrl,
+                        name: name,
+                        price: price + ' RP',
+                        discount: '-' + discount + '%'
+                    });
+                    discounts[i].dataset.hmhCollected = '1';
+                } catch (e) {
+                    // 아직 렌더링되지 않은 노드는 표시하지 않고 다음 라운드에서 다시 시도
+                }
+            }
+
+            const count = discounts.length;
+            const scrollY = window.scrollY;
+            const scrollHeight = document.documentElement.scrollHeight;
+            const clientHeight = document.documentElement.clientHeight;
+            const isBottom = scrollY + clientHeight >= scrollHeight;
+            let readyReason = null;
+            let waitedMs = 0;
+            if (!isBottom && scrollStep > 0) {
+                window.scrollTo(0, scrollY + scrollStep);
+
+                // 고정 대기 대신 항목 수 증가 또는 네트워크 정지(quietMs 동안 신규 리소스 없음)를 기다림
+                if (readyTimeout > 0) {
+                    performance.setResourceTimingBufferSize(100000);
+                    const start = performance.now();
+                    let lastResources = performance.getEntriesByType('resource').length;
+                    let quietSince = start;
+                    readyReason = await new Promise(resolve => {
+                        const tick = () => {
+                            const now = performance.now();
+                            if (document.querySelectorAll('.sale-discount').length > count) return resolve('grown');
+                            const resources = performance.getEntriesByType('resource').length;
+                            if (resources !== lastResources) {
+                                lastResources = resources;
+                                quietSince = now;
+                            } else if (now - quietSince >= quietMs) {
+                                return resolve('network-idle');
+                            }
+                            if (now - start >= readyTimeout) return resolve('timeout');
+                            setTimeout(tick, 25);
+                        };
+                        tick();
+                    });
+                    waitedMs = performance.now() - start;
+                }
+            }
+            return {
+                items: items,
+                count: count,
+                scrollY: scrollY,
+                scrollHeight: scrollHeight,
+                clientHeight: clientHeight,
+                isBottom: isBottom,
+                readyReason: readyReason,
+                waitedMs: waitedMs
+            };
+        }
+        """, {"scrollStep": scroll_step, "readyTimeout": ready_timeout, "quietMs": quiet_ms})
+
+    async def scroll_and_collect_data(self, page, max_scrolls=300, ready_timeout=None, idle_rounds=None, on_items=None):
+        ready_timeout = settings.LOL_STORE_READY_TIMEOUT_MS if ready_timeout is None else ready_timeout
+        idle_rounds = settings.LOL_STORE_IDLE_ROUNDS if idle_rounds is None else idle_rounds
+        collected = DiscountIndex()
+        scroll_step = 8000
+        rounds_without_new = 0
+
+        for i in range(max_scrolls):
+            # 신규 항목 수집 + 스크롤 정보 + 스크롤 이동 + 로딩 대기를 한 번의 evaluate 로 처리
+            round_info = await self.fetch_new_discounted_skins(
+                page, scroll_step, ready_timeout, settings.LOL_STORE_NETWORK_QUIET_MS
+            )
+            self.last_stats["scrolls"] += 1
+            self.last_stats["wait_ms"] += round_info["waitedMs"]
+
+            new_items = [result for result in round_info["items"] if collected.add(result)]
+            if on_items and new_items:
+                await on_items(new_items)
+
+            print(f"[스크롤 {i+1}] 현재 할인 항목 개수: {round_info['count']}, 수집된 고유 항목: {len(collected)}")
+
+            # 스크롤이 끝에 도달했거나, 연속 idle_rounds 번 새로운 항목이 발견되지 않으면 종료
+            rounds_without_new = 0 if round_info["items"] else rounds_without_new + 1
+            if round_info["isBottom"] or rounds_without_new >= idle_rounds:
+                print(f"스크롤 종료: {'페이지 끝 도달' if round_info['isBottom'] else '새로운 항목 없음'}")
+                break
+
+        return collected.to_list()
+
+    async def _wait_for_ready(self, page, condition):
+        """Wait for a readiness condition up to the configured timeout, returning the time spent in ms"""
+        start = time.perf_counter()
+        try:
+            if condition == "networkidle":
+                await page.wait_for_load_state("networkidle", timeout=settings.LOL_STORE_READY_TIMEOUT_MS)
+            else:
+                await page.wait_for_function(condition, timeout=settings.LOL_STORE_READY_TIMEOUT_MS)
+        except PlaywrightTimeoutError:
+            print(f"⚠️ 대기 시간 초과: {condition}")
+        return (time.perf_counter() - start) * 1000
+
+    def _save_capture(self, urls: List[str], sample: Any = None):
+        """
+        Record the catalog XHRs seen after the sale filter was applied so the HTTP source can replay them
+
+        catalog_url is the first of them (the filtered catalog) and sample its JSON response, kept as a
+        recording to check CATALOG_FIELDS against.
+        """
+        if not urls:
+            return
+        data = {
+            "captured_at": datetime.now(pytz.timezone('Asia/Seoul')).isoformat(),
+            "catalog_url": urls[0],
+            "urls": urls,
+            "sample": sample
+        }
+        with open(self.capture_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    async def fetch(self, on_items: Optional[ItemsCallback] = None) -> List[Dict[str, str]]:
+        started = time.perf_counter()
+        self.last_stats = self._new_stats()
+        captured_urls = []
+        capture_state = {"filtered": False, "sample": None}
+
+        async def capture(response):
+            # 첫 로딩의 요청은 할인 필터가 없는 전체 카탈로그이므로 필터를 누른 뒤의 요청만 기록
+            content_type = response.headers.get("content-type", "")
+            if not capture_state["filtered"] or "json" not in content_type:
+                return
+            if settings.LOL_STORE_CATALOG_PATTERN not in response.url:
+                return
+            captured_urls.append(response.url)
+            if capture_state["sample"] is None:
+                try:
+                    capture_state["sample"] = await response.json()
+                except Exception as e:
+                    print(f"⚠️ 카탈로그 응답을 읽지 못했습니다: {str(e)}")
+
+        async with browser_manager.context() as context:
+            # 차단을 끈 경우에도 전송량은 집계하여 차단 효과를 비교할 수 있게 함
+            blocker = ResourceBlocker.from_settings() if settings.LOL_STORE_BLOCK_RESOURCES else ResourceBlocker((), False)
+            await blocker.install(context)
+            page = await context.new_page()
+            page.on("response", capture)
+            await page.goto(STORE_URL)
+            self.last_stats["wait_ms"] += await self._wait_for_ready(page, "networkidle")
+
+            capture_state["filtered"] = True
+            await page.evaluate("""
+            () => {
+                const buttons = Array.from(document.querySelectorAll('button'));
+                const saleFilter = buttons.find(btn => btn.innerText.includes('할인 중'));
+                if (saleFilter) saleFilter.click();
+            }
+            """)
+            self.last_stats["wait_ms"] += await self._wait_for_ready(
+                page, "() => document.querySelectorAll('.sale-discount').length > 0"
+            )
+
+            all_results = await self.scroll_and_collect_data(page, on_items=on_items)
+
+        self._save_capture(captured_urls, capture_state["sample"])
+        elapsed = time.perf_counter() - started
+        self.last_stats.update({
+            "items": len(all_results),
+            "elapsed_s": round(elapsed, 3),
+            "items_per_s": round(len(all_results) / elapsed, 2) if elapsed > 0 else 0.0,
+            "wait_ms": round(self.last_stats["wait_ms"], 1),
+            "network": blocker.summary(),
+        })
+        return all_results
+
+
+class HttpDiscountSource(DiscountSource):
+    """Replay the store's catalog XHR with concurrent, paginated httpx requests"""
+
+    name = "http"
+
+    def __init__(
+        self,
+        catalog_url: Optional[str] = None,
+        capture_file: Path = Path("data/lol_store/catalog_capture.json"),
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        super().__init__()
+        self.catalog_url = catalog_url if catalog_url is not None else settings.LOL_STORE_CATALOG_URL
+        self.capture_file = capture_file
+        self.max_concurrency = max_concurrency or settings.LOL_STORE_HTTP_CONCURRENCY
+        self.timeout = timeout or settings.LOL_STORE_HTTP_TIMEOUT
+        self.transport = transport
+
+    def _resolve_url(self) -> Optional[str]:
+        """Configured catalog URL, falling back to the sale-filtered catalog URL captured by the Playwright source"""
+        if self.catalog_url:
+            return self.catalog_url
+        if self.capture_file.exists():
+            with open(self.capture_file, "r", encoding="utf-8") as f:
+                return json.load(f).get("catalog_url")
+        return None
+
+    @property
+    def enabled(self) -> bool:
+        return settings.LOL_STORE_HTTP_SOURCE and self._resolve_url() is not None
+
+    @staticmethod
+    def _page_url(url: str, page: int) -> str:
+        """Replace the pagination parameter of a captured URL, keeping repeated and blank parameters"""
+        parsed = urlparse(url)
+        key = settings.LOL_STORE_CATALOG_PAGE_PARAM
+        query = parse_qsl(parsed.query, keep_blank_values=True)
+        if any(name == key for name, _ in query):
+            query = [(name, str(page) if name == key else value) for name, value in query]
+        else:
+            query.append((key, str(page)))
+        return urlunparse(parsed._replace(query=urlencode(query)))
+
+    @staticmethod
+    def parse_item(item: Dict[str, Any]) -> Optional[Dict[str, str]]:
+        """Convert one catalog entry to the scraper's {url, name, price, discount} shape"""
+        discount = _get_path(item, CATALOG_FIELDS["discount"])
+        price = _get_path(item, CATALOG_FIELDS["price"])
+        name = _get_path(item, CATALOG_FIELDS["name"])
+        if not name or not discount or price is None:
+            return None
+        return {
+            "url": _get_path(item, CATALOG_FIELDS["url"]) or "",
+            "name": name,
+            "price": f"{price} RP",
+            "discount": f"-{str(discount).strip('-%')}%",
+        }
+
+    async def _fetch_page(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, url: str, page: int):
+        async with semaphore:
+            response = await client.get(self._page_url(url, page))
+            response.raise_for_status()
+            return response.json()
+
+    async def fetch(self, on_items: Optional[ItemsCallback] = None) -> List[Dict[str, str]]:
+        url = self._resolve_url()
+        if url is None:
+            raise ValueError("No catalog URL configured or captured")
+
+        started = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        collected = DiscountIndex()
+
+        async def collect(payload):
+            new_items = []
+            for item in _get_path(payload, CATALOG_FIELDS["items"]) or []:
+                skin = self.parse_item(item)
+                if skin is not None and collected.add(skin):
+                    new_items.append(skin)
+            if on_items and new_items:
+                await on_items(new_items)
+
+        async with httpx.AsyncClient(timeout=self.timeout, transport=self.transport) as client:
+            first_page = settings.LOL_STORE_CATALOG_FIRST_PAGE
+            first = await self._fetch_page(client, semaphore, url, first_page)
+            total_pages = int(_get_path(first, CATALOG_FIELDS["total_pages"]) or 1)
+            await collect(first)
+            # 나머지 페이지는 동시에 요청하되, 순서를 유지하도록 페이지 순으로 결과를 처리
+            tasks = [
+                asyncio.ensure_future(self._fetch_page(client, semaphore, url, page))
+                for page in range(first_page + 1, first_page + total_pages)
+            ]
+            try:
+                for task in tasks:
+                    await collect(await task)
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+        elapsed = time.perf_counter() - started
+        self.last_stats = {
+            "pages": total_pages,
+            "items": len(collected),
+            "elapsed_s": round(elapsed, 3),
+            "items_per_s": round(len(collected) / elapsed, 2) if elapsed > 0 else 0.0,
+        }
+        return collected.to_list()
@@ -1,165 +1,141 @@
-import asyncio
-from playwright.async_api import async_playwright
-from typing import List, Dict, Any
-import json
+from typing import List, Dict, Any, Optional
 from datetime import datetime
 import pytz
-import os
 from pathlib import Path
+from app.core.config.settings import settings
+from app.services.lol_store.diff import SnapshotDiff
+from app.services.lol_store.history import HistoryStore, iso_week
+from app.services.lol_store.index import DiscountIndex, ExceptionIndex
+from app.services.lol_store.persistence import JsonFile
+from app.services.lol_store.sources import DiscountSource, HttpDiscountSource, ItemsCallback, PlaywrightDiscountSource
 
 class LoLStoreService:
-    def __init__(self):
+    def __init__(self, sources: Optional[List[DiscountSource]] = None, history: Optional[HistoryStore] = None):
         self.data_file = Path("data/lol_store/discounts.json")
-        self.exception_file = Path("data/lol_store/discounts.json")
-        self.data_file.parent.mkdir(parents=True, exist_ok=True)
+        # 원자적으로 저장하고, 파일이 바뀐 경우에만 다시 읽음 (다른 워커가 저장한 결과도 반영)
+        self.store_file = JsonFile(self.data_file)
         self.last_update = None
         self.discounts = []
-        self.exception_list = self._load_exception_list()
+        self.last_scrape_stats = {}
+        # 저장된 데이터가 바뀔 때마다 증가 (API 응답 캐시 무효화용)
+        self.generation = 0
+        # 앞의 소스가 실패하거나 비어 있으면 다음 소스로 대체
+        self.sources = sources if sources is not None else [HttpDiscountSource(), PlaywrightDiscountSource()]
+        # 직전 스냅샷에도 같은 할인율로 있던 항목(지난주부터 이어진 할인)은 새 할인 목록에서 제외
+        self.exception_index = ExceptionIndex()
+        self.last_diff: Optional[SnapshotDiff] = None
         self._load_data()
+        # 모든 스크래핑 결과를 스냅샷으로 보관하는 이력 DB
+        # (discounts.json 은 예외 항목을 걸러낸 목록이라 지난주 비교 기준이 될 수 없으므로 가져오지 않음)
+        self.history = history or HistoryStore()
 
-    def _load_exception_list(self) -> List[Dict[str, str]]:
-        """Load exception list from JSON file"""
-        if self.exception_file.exists():
-            with open(self.exception_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return data.get("discounts", [])
-        return []
+    def _previous_snapshot(self) -> List[Dict[str, Any]]:
+        """Skins of the last snapshot recorded before this week (the previous week's sale)"""
+        snapshot = self.history.latest_snapshot(before_week=iso_week())
+        return snapshot["items"] if snapshot else []
 
     def _is_in_exception_list(self, result: Dict[str, Any]) -> bool:
         """Check if the result is in exception list"""
-        for exception in self.exception_list:
-            if (result["name"] == exception["name"] and 
-                result["discount"] == exception["discount"]):
-                return True
-        return False
-
-    async def fetch_discounted_skins(self, page):
-        return await page.evaluate("""
-        () => {
-            let discounts = document.querySelectorAll('.sale-discount');
-            let result = [];
-            for (let i = 0; i < discounts.length; i++) {
-                try {
-                    const element = discounts[i].parentNode.parentElement.parentElement.children[0].children[0].children[0];
-                    const imgUrl = element.dataset.assetUrl;
-                    
-                    let name = discounts[i].parentNode.parentElement.previousElementSibling.children[0].innerText;
-                    let price = discounts[i].parentNode.parentElement.previousElementSibling.children[1]
-                                .querySelectorAll('.price')[1].innerText;
-                    let discount = discounts[i].innerText;
-                    result.push({
-                        url: imgUrl,
-                        name: name,
-                        price: price + ' RP',
-                        discount: '-' + discount + '%'
-                    });
-                } catch (e) {
-                    // 오류 무시
-                }
-            }
-            return result;
-        }
-        """)
-
-    async def scroll_and_collect_data(self, page, pause=100, max_scrolls=300, is_exception=False):
-        skipped_count = 0
-        all_results = []
-        last_count = 0
-        scroll_step = 8000
-        
-        for i in range(max_scrolls):
-            current_results = await self.fetch_discounted_skins(page)
-            
-            for result in current_results:
-                # Skip if result is in exception list
-                if self._is_in_exception_list(result) and is_exception == False:
-                    skipped_count += 1
-                    print(f"Skipping exception item: {result['name']} ({result['discount']})")
-                    continue
-                    
-                if result not in all_results:
-                    all_results.append(result)
-            
-            # 현재 스크롤 위치와 페이지 높이 확인
-            scroll_info = await page.evaluate("""
-            () => {
-                return {
-                    scrollY: window.scrollY,
-                    scrollHeight: document.documentElement.scrollHeight,
-                    clientHeight: document.documentElement.clientHeight
-                }
-            }
-            """)
-            
-            # 스크롤이 끝에 도달했는지 확인
-            is_bottom = scroll_info['scrollY'] + scroll_info['clientHeight'] >= scroll_info['scrollHeight']
-            
-            # 스크롤이 끝에 도달했거나, 연속 3번 새로운 항목이 발견되지 않으면 종료
-            if is_bottom:
-                print(f"스크롤 종료: {'페이지 끝 도달' if is_bottom else '새로운 항목 없음'}")
-                break
-            
-            await page.evaluate(f"""
-            () => {{
-                const currentScroll = window.scrollY;
-                window.scrollTo(0, currentScroll + {scroll_step});
-            }}
-            """)
-            await page.wait_for_timeout(pause)
-
-            count = await page.evaluate("document.querySelectorAll('.sale-discount').length")
-            print(f"[스크롤 {i+1}] 현재 할인 항목 개수: {count}, 수집된 고유 항목: {len(all_results)}")
-
-            # if len(all_results) + skipped_count == 15:
-            #     print("15개의 고유한 할인 항목을 모두 찾았습니다.")
-            #     break
-            last_count = count
-
-        return all_results
-
-    async def fetch_all_discounted_skins(self, is_exception):
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            await page.goto("https://store.leagueoflegends.co.kr/skins?sort=ReleaseDate&order=DESC")
-            await page.wait_for_timeout(300)
-
-            await page.evaluate("""
-            () => {
-                const buttons = Array.from(document.querySelectorAll('button'));
-                const saleFilter = buttons.find(btn => btn.innerText.includes('할인 중'));
-                if (saleFilter) saleFilter.click();
-            }
-            """)
-            await page.wait_for_timeout(300)
-
-            all_results = await self.scroll_and_collect_data(page, pause=150, is_exception=is_exception)
-            await browser.close()
-
-            if not all_results:
-                print("⚠️ 아무 항목도 찾지 못했습니다.")
-                return []
-            else:
-                print(f"✅ 총 {len(all_results)}개 항목을 찾았습니다.")
-                return all_results
-            
-    async def update_exception_discounts(self):
-        """Update exception discount information by scraping"""
+        return result in self.exception_index
+
+    async def _fetch_from_sources(self, on_items: Optional[ItemsCallback] = None) -> List[Dict[str, Any]]:
+        """Try each enabled source in order, falling back to the next on error or empty result"""
+        for source in self.sources:
+            if not source.enabled:
+                continue
+            try:
+                results = await source.fetch(on_items=on_items)
+            except Exception as e:
+                print(f"⚠️ {source.name} 소스 실패, 다음 소스로 전환합니다: {str(e)}")
+                continue
+            self.last_scrape_stats = dict(source.last_stats, source=source.name)
+            print(f"스크래핑 통계: {self.last_scrape_stats}")
+            if results:
+                return results
+            print(f"⚠️ {source.name} 소스에서 항목을 찾지 못했습니다.")
+        return []
+
+    def _stream_filter(self, on_items: ItemsCallback) -> ItemsCallback:
+        """
+        Wrap a streaming callback so it only sees each skin once
+
+        Exception items are dropped as in the final result, and skins already streamed by a source
+        that failed part-way are not repeated when the next source returns them again.
+        """
+        streamed = DiscountIndex()
+
+        async def forward(items):
+            items = [item for item in items if not self._is_in_exception_list(item)]
+            items = [item for item in items if streamed.add(item)]
+            if items:
+                await on_items(items)
+
+        return forward
+
+    def _record_history(self, results: List[Dict[str, Any]], kind: str):
+        """Store the unfiltered scrape as a history snapshot; a history failure never fails the scrape"""
+        if not results:
+            return
         try:
-            results = await self.fetch_all_discounted_skins(is_exception=True)
-            self.discounts = results
-            self.last_update = datetime.now(pytz.timezone('Asia/Seoul')).isoformat()
-            self._save_data()
-            print(f"Scraping completed at {self.last_update}")
-            return self.discounts
+            self.history.record(results, kind=kind)
         except Exception as e:
-            print(f"Error during scheduled scraping: {str(e)}")
+            print(f"⚠️ 이력 저장 실패: {str(e)}")
+
+    async def fetch_all_discounted_skins(self, on_items: Optional[ItemsCallback] = None):
+        """
+        Scrape the store and return the skins newly on sale this week
+
+        The scrape is diffed against the previous week's snapshot in one pass (last_diff); skins still
+        on sale with the same discount are dropped, which replaces the separate exception-list scrape.
+        """
+        previous = self._previous_snapshot()
+        self.exception_index = ExceptionIndex(previous)
+        if on_items is not None:
+            on_items = self._stream_filter(on_items)
+        all_results = await self._fetch_from_sources(on_items)
+        self._record_history(all_results, "weekly")
+
+        self.last_diff = SnapshotDiff(previous, all_results)
+        print(f"지난 스냅샷 대비 변경: {self.last_diff.summary()}")
+        for skin in self.last_diff.current:
+            if self._is_in_exception_list(skin):
+                print(f"Skipping exception item: {skin['name']} ({skin['discount']})")
+        all_results = self.last_diff.fresh
+
+        if not all_results:
+            print("⚠️ 아무 항목도 찾지 못했습니다.")
             return []
-
-    async def update_discounts(self):
-        """Update discount information by scraping"""
+        else:
+            print(f"✅ 총 {len(all_results)}개 항목을 찾았습니다.")
+            return all_results
+
+    def diff_for_week(self, week: Optional[str] = None) -> Optional[SnapshotDiff]:
+        """
+        Diff between a week's latest snapshot and the last snapshot before that week
+
+        Args:
+            week: ISO week (e.g. 2025-W20), default: the week of the latest snapshot
+        """
+        if week is None:
+            latest = self.history.latest_snapshot()
+            if latest is None:
+                return None
+            week = latest["week"]
+        current = self.history.latest_snapshot(week=week)
+        if current is None:
+            return None
+        previous = self.history.latest_snapshot(before_week=week)
+        return SnapshotDiff(previous["items"] if previous else [], current["items"])
+
+    async def update_discounts(self, on_items: Optional[ItemsCallback] = None):
+        """
+        Update discount information by scraping
+
+        Args:
+            on_items: Optional coroutine called with each batch of new (non-exception) skins while scraping
+        """
         try:
-            results = await self.fetch_all_discounted_skins(is_exception=False)
+            results = await self.fetch_all_discounted_skins(on_items=on_items)
             self.discounts = results
             self.last_update = datetime.now(pytz.timezone('Asia/Seoul')).isoformat()
             self._save_data()
@@ -171,26 +147,37 @@ class LoLStoreService:
 
     async def get_discounts(self):
         """Get current discount information"""
-        if not self.discounts:
-            self._load_data()
+        self._load_data()
         return {
             "last_update": self.last_update,
             "discounts": self.discounts
         }
 
+    def current_generation(self) -> int:
+        """Generation of the saved data, reloading it first if another process saved a newer file"""
+        self._load_data()
+        return self.generation
+
+    def get_last_update(self):
+        """Get the timestamp of the last successful scraping"""
+        self._load_data()
+        return {"last_update": self.last_update}
+
     def _save_data(self):
-        """Save data to JSON file"""
+        """Save data to JSON file (atomic replace, compact form)"""
         data = {
             "last_update": self.last_update,
             "discounts": self.discounts
         }
-        with open(self.data_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        self.store_file.save(data)
+        if settings.LOL_STORE_PRETTY_EXPORT:
+            self.store_file.export_pretty(self.data_file.with_suffix(".pretty.json"))
+        self.generation += 1
 
     def _load_data(self):
-        """Load data from JSON file"""
-        if self.data_file.exists():
-            with open(self.data_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self.last_update = data.get("last_update")
-                self.discounts = data.get("discounts", []) 
\ No newline at end of file
+        """Load data from JSON file, only if it changed on disk since the last save/load"""
+        data = self.store_file.load_if_changed()
+        if data is not None:
+            self.last_update = data.get("last_update")
+            self.discounts = data.get("discounts", [])
+            self.generation += 1 
\ No newline at end of file
@@ -0,0 +1,91 @@
+import hashlib
+import os
+import subprocess
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+import logging
+
+from app.core.config.settings import settings
+from app.services.video.ffmpeg_encoder import find_ffmpeg
+
+logger = logging.getLogger(__name__)
+
+
+class AudioBedCache:
+    """길이/볼륨/페이드가 적용된 배경음악(AAC)을 미리 인코딩해 재사용하는 캐시"""
+
+    def __init__(self, cache_dir: str = "data/cache/audio", max_files: Optional[int] = None, ffmpeg_path: Optional[str] = None):
+        """
+        Args:
+            cache_dir (str): 인코딩된 배경음악이 저장될 디렉토리 경로
+            max_files (int, optional): 보관할 최대 파일 수
+            ffmpeg_path (str, optional): ffmpeg 실행 파일 경로
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_files = max_files or settings.AUDIO_CACHE_MAX_FILES
+        self.ffmpeg_path = ffmpeg_path or find_ffmpeg()
+        self._digests: Dict[Tuple[str, int, int], str] = {}
+
+    def _source_digest(self, source: str) -> str:
+        """원본 파일 해시 (경로/크기/수정 시각이 같으면 다시 계산하지 않음)"""
+        stat = os.stat(source)
+        cache_key = (os.path.abspath(source), stat.st_size, stat.st_mtime_ns)
+        if cache_key not in self._digests:
+            digest = hashlib.sha256()
+            with open(source, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(chunk)
+            self._digests[cache_key] = digest.hexdigest()
+        return self._digests[cache_key]
+
+    def key(self, source: str, duration: float, volume: float, fade: float) -> str:
+        params = f"{self._source_digest(source)}:{duration:.3f}:{volume:.3f}:{fade:.3f}"
+        return hashlib.sha256(params.encode("utf-8")).hexdigest()[:32]
+
+    def prepare(self, source: str, duration: float, volume: float = 0.7, fade: float = 1.0) -> Path:
+        """
+        배경음악을 비디오 길이에 맞춰 반복/자르고 볼륨과 페이드를 적용한 AAC 파일을 반환합니다.
+        같은 (원본 해시, 길이, 볼륨, 페이드) 조합은 한 번만 인코딩합니다.
+
+        Args:
+            source (str): 원본 배경음악 파일 경로
+            duration (float): 비디오 길이(초)
+            volume (float): 볼륨 배율
+            fade (float): 시작/끝 페이드 시간(초)
+
+        Returns:
+            Path: 인코딩된 배경음악 파일 경로
+        """
+        output_path = self.cache_dir / f"{self.key(source, duration, volume, fade)}.m4a"
+        if output_path.exists():
+            logger.info(f"배경음악 캐시 사용: {output_path}")
+            os.utime(output_path)
+            return output_path
+
+        fade_out_start = max(duration - fade, 0)
+        tmp_path = output_path.with_name(f"{output_path.stem}.{os.getpid()}.tmp.m4a")
+        cmd = [
+            self.ffmpeg_path, "-y", "-hide_banner", "-loglevel", "error",
+            "-stream_loop", "-1", "-i", str(source),
+            "-t", str(duration),
+            "-af", f"volume={volume},afade=t=in:st=0:d={fade},afade=t=out:st={fade_out_start}:d={fade}",
+            "-vn", "-c:a", "aac", "-b:a", "192k",
+            str(tmp_path)
+        ]
+        logger.info(f"배경음악 인코딩: {source} → {output_path}")
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        if result.returncode != 0:
+            tmp_path.unlink(missing_ok=True)
+            stderr = result.stderr.decode("utf-8", errors="replace")
+            raise ValueError(f"배경음악 인코딩 실패 (code {result.returncode}): {stderr[-2000:]}")
+        os.replace(tmp_path, output_path)
+        self.evict()
+        return output_path
+
+    def evict(self):
+        """가장 오래 사용하지 않은 파일부터 max_files 개만 남기고 삭제합니다."""
+        beds = [p for p in self.cache_dir.glob("*.m4a") if not p.name.endswith(".tmp.m4a")]
+        beds.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+        for path in beds[self.max_files:]:
+            path.unlink(missing_ok=True)
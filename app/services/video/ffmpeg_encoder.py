@@ -0,0 +1,269 @@
+import math
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def find_ffmpeg() -> str:
+    """시스템 ffmpeg, 없으면 MoviePy 가 사용하는 imageio-ffmpeg 바이너리 경로를 반환합니다."""
+    path = shutil.which("ffmpeg")
+    if path:
+        return path
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except Exception:
+        raise ValueError("ffmpeg 실행 파일을 찾을 수 없습니다.")
+
+
+class FFmpegEncoder:
+    """정지 이미지를 ffmpeg 에 직접 넘겨 인코딩하는 비디오 인코더"""
+
+    def __init__(
+        self,
+        fps: int = 24,
+        ffmpeg_path: Optional[str] = None,
+        preset: str = "medium",
+        crf: int = 23,
+        tune: Optional[str] = "stillimage",
+        threads: int = 0,
+        scale: Optional[float] = None
+    ):
+        """
+        Args:
+            fps (int): 출력 비디오 프레임레이트
+            ffmpeg_path (str, optional): ffmpeg 실행 파일 경로
+            preset (str): libx264 preset
+            crf (int): libx264 CRF (낮을수록 고화질)
+            tune (str, optional): libx264 tune
+            threads (int): 인코딩 스레드 수 (0 이면 자동)
+            scale (float, optional): 출력 해상도 배율
+        """
+        self.fps = fps
+        self.ffmpeg_path = ffmpeg_path or find_ffmpeg()
+        self.preset = preset
+        self.crf = crf
+        self.tune = tune
+        self.threads = threads
+        self.scale = scale
+
+    @classmethod
+    def from_profile(cls, profile: dict) -> "FFmpegEncoder":
+        """video_config.ENCODING_PROFILES 의 프로필로 인코더를 만듭니다."""
+        return cls(
+            fps=profile["fps"],
+            preset=profile["preset"],
+            crf=profile["crf"],
+            tune=profile.get("tune"),
+            threads=profile.get("threads", 0),
+            scale=profile.get("scale")
+        )
+
+    def _scale_filter(self) -> str:
+        """축소 출력용 scale 필터 (yuv420p 를 위해 짝수 크기로 맞춤)"""
+        if not self.scale or self.scale == 1:
+            return ""
+        return f"scale=trunc(iw*{self.scale}/2)*2:trunc(ih*{self.scale}/2)*2,"
+
+    def _video_codec_args(self) -> List[str]:
+        args = ["-c:v", "libx264", "-preset", self.preset, "-crf", str(self.crf)]
+        if self.tune:
+            args += ["-tune", self.tune]
+        # 프레임을 건너뛴 가변 프레임레이트 구간에서 B 프레임을 쓰면 mp4 의 길이가 잘못 기록되어 concat 이 어긋남
+        args += ["-bf", "0", "-pix_fmt", "yuv420p", "-threads", str(self.threads)]
+        return args
+
+    @staticmethod
+    def _quote(path) -> str:
+        escaped = str(Path(path).resolve()).replace("'", "'\\''")
+        return f"file '{escaped}'"
+
+    def _still_clip_filter(self, index: int, length: float) -> str:
+        """
+        입력 index 의 정지 이미지를 length 초, self.fps 의 고정 프레임레이트 클립 [v{index}] 로 만드는 필터입니다.
+
+        xfade 는 고정 프레임레이트 입력만 받으므로 fps 필터를 체인 마지막에 둡니다.
+        (fps 뒤에 setpts 가 오면 프레임레이트 정보가 지워져 xfade 가 실패함)
+        """
+        return (
+            f"[{index}:v]trim=duration={length},setpts=PTS-STARTPTS,"
+            f"{self._scale_filter()}format=yuv420p,fps={self.fps},settb=AVTB[v{index}]"
+        )
+
+    def _changing_frames_filter(self, image_duration: float, head: float, fade_out: float) -> str:
+        """
+        구간에서 화면이 바뀌는 프레임만 남기는 select 필터입니다.
+
+        전환/페이드 인(head 초)과 페이드 아웃 구간의 프레임, 그리고 정지 구간의 첫 프레임과 구간의 마지막 프레임만
+        인코딩하고, 정지 구간의 나머지 프레임은 버려 앞 프레임이 그대로 표시되게 합니다 (가변 프레임레이트).
+        libx264 는 같은 프레임도 장당 수십 ms 씩 걸리므로 인코딩할 프레임 수가 곧 인코딩 시간입니다.
+        """
+        last = round(image_duration * self.fps) - 1
+        keep_until = math.ceil(head * self.fps)
+        keep_from = math.floor((image_duration - fade_out) * self.fps) if fade_out > 0 else last
+        return f"select='lte(n,{keep_until})+gte(n,{keep_from})',settb=1/{self.fps}"
+
+    def _run(self, cmd: List[str]):
+        logger.info(f"ffmpeg 실행: {' '.join(cmd)}")
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        if result.returncode != 0:
+            stderr = result.stderr.decode("utf-8", errors="replace")
+            raise ValueError(f"ffmpeg 인코딩 실패 (code {result.returncode}): {stderr[-2000:]}")
+
+    def encode(
+        self,
+        image_files: List[Path],
+        output_path: str,
+        image_duration: float = 3,
+        audio_file: Optional[str] = None,
+        fade_duration: float = 1.0,
+        audio_volume: float = 0.7,
+        transition_duration: float = 0.0,
+        audio_bed: Optional[str] = None
+    ) -> str:
+        """
+        이미지 시퀀스를 ffmpeg 로 인코딩합니다. 영상/오디오 페이드는 ffmpeg 필터로 처리합니다.
+
+        카드마다 encode_segment() 로 구간을 인코딩한 뒤 concat_segments() 로 재인코딩 없이 합치므로,
+        ffmpeg 가 한 번에 여는 입력은 카드 수와 관계없이 최대 2장이고 메모리 사용량도 카드 수에 비례하지 않습니다.
+
+        Args:
+            image_files (List[Path]): 정렬된 이미지 파일 목록
+            output_path (str): 출력 비디오 경로
+            image_duration (float): 각 이미지가 표시될 시간(초)
+            audio_file (str, optional): 배경음악 파일 경로
+            fade_duration (float): 시작/끝 페이드 시간(초)
+            audio_volume (float): 배경음악 볼륨 배율
+            transition_duration (float): 이미지 사이 크로스페이드 시간(초), 0 이면 컷 전환
+            audio_bed (str, optional): 길이/볼륨/페이드가 이미 적용된 AAC 파일, 재인코딩 없이 복사됨
+
+        Returns:
+            str: 생성된 비디오 파일의 경로
+        """
+        total = len(image_files) * image_duration
+        last = len(image_files) - 1
+
+        with tempfile.TemporaryDirectory(prefix="ffmpeg-") as tmp_dir:
+            segments = [
+                self.encode_segment(
+                    image_path,
+                    str(Path(tmp_dir) / f"{i + 1:03d}.mp4"),
+                    image_duration=image_duration,
+                    previous_image=image_files[i - 1] if i > 0 else None,
+                    transition_duration=transition_duration,
+                    fade_in=fade_duration if i == 0 else 0,
+                    fade_out=fade_duration if i == last else 0
+                )
+                for i, image_path in enumerate(image_files)
+            ]
+            if audio_bed or not audio_file:
+                return self.concat_segments(segments, output_path, audio_bed)
+
+            # 가공되지 않은 배경음악은 합친 영상에 볼륨/페이드를 적용해 인코딩
+            video_path = self.concat_segments(segments, str(Path(tmp_dir) / "video.mp4"))
+            fade_out_start = max(total - fade_duration, 0)
+            self._run([
+                self.ffmpeg_path, "-y", "-hide_banner", "-loglevel", "error",
+                "-i", video_path, "-stream_loop", "-1", "-i", str(audio_file),
+                "-map", "0:v", "-map", "1:a", "-c:v", "copy",
+                "-af",
+                f"volume={audio_volume},"
+                f"afade=t=in:st=0:d={fade_duration},afade=t=out:st={fade_out_start}:d={fade_duration}",
+                "-c:a", "aac", "-t", str(total), "-movflags", "+faststart", str(output_path)
+            ])
+        return str(output_path)
+
+    def encode_segment(
+        self,
+        image_path: Path,
+        output_path: str,
+        image_duration: float = 3,
+        previous_image: Optional[Path] = None,
+        transition_duration: float = 0.0,
+        fade_in: float = 0.0,
+        fade_out: float = 0.0
+    ) -> str:
+        """
+        카드 한 장 분량(image_duration 초)의 영상 구간을 인코딩합니다 (스트리밍 파이프라인용).
+
+        previous_image 가 있으면 구간 시작에서 이전 카드로부터 크로스페이드하므로,
+        구간들을 순서대로 이어 붙이면 encode() 의 크로스페이드 타임라인과 같아집니다.
+        모든 구간은 같은 코덱 설정으로 인코딩되어 concat_segments() 에서 재인코딩 없이 합칠 수 있습니다.
+        전환/페이드 구간만 self.fps 로 인코딩하고 정지 구간은 첫/마지막 프레임만 인코딩합니다 (가변 프레임레이트).
+
+        Args:
+            image_path (Path): 현재 카드 이미지
+            output_path (str): 출력 구간 파일 경로
+            image_duration (float): 구간 길이(초)
+            previous_image (Path, optional): 이전 카드 이미지 (크로스페이드 시작점)
+            transition_duration (float): 크로스페이드 시간(초)
+            fade_in (float): 구간 시작 페이드 인 시간(초), 첫 구간에만 사용
+            fade_out (float): 구간 끝 페이드 아웃 시간(초), 마지막 구간에만 사용
+
+        Returns:
+            str: 생성된 구간 파일의 경로
+        """
+        fades = []
+        if fade_in > 0:
+            fades.append(f"fade=t=in:st=0:d={fade_in}")
+        if fade_out > 0:
+            fades.append(f"fade=t=out:st={max(image_duration - fade_out, 0)}:d={fade_out}")
+        fades = ",".join(fades) or "null"
+        head = max(transition_duration if previous_image is not None else 0, fade_in)
+        select = self._changing_frames_filter(image_duration, head, fade_out)
+
+        cmd = [self.ffmpeg_path, "-y", "-hide_banner", "-loglevel", "error"]
+        if previous_image is not None and transition_duration > 0:
+            # xfade 는 전환 구간 클립에만 적용하고, 나머지 정지 구간은 concat 으로 이어 붙임
+            # (xfade 는 전환이 끝난 뒤의 프레임도 모두 처리하므로 구간 전체에 걸면 필터 시간이 몇 배로 늘어남)
+            clips = [
+                (previous_image, transition_duration),
+                (image_path, transition_duration),
+                (image_path, image_duration - transition_duration),
+            ]
+            filters = []
+            for i, (path, length) in enumerate(clips):
+                cmd += ["-loop", "1", "-framerate", "1", "-t", str(math.ceil(length) + 1), "-i", str(path)]
+                filters.append(self._still_clip_filter(i, length))
+            filters.append(
+                f"[v0][v1]xfade=transition=fade:duration={transition_duration}:offset=0[x];"
+                f"[x][v2]concat=n=2:v=1:a=0,{fades},{select}[out]"
+            )
+            cmd += ["-filter_complex", ";".join(filters), "-map", "[out]"]
+        else:
+            cmd += ["-loop", "1", "-framerate", "1", "-t", str(math.ceil(image_duration) + 1), "-i", str(image_path)]
+            cmd += ["-vf", f"fps={self.fps},{self._scale_filter()}format=yuv420p,{fades},{select}"]
+        cmd += self._video_codec_args()
+        cmd += ["-fps_mode", "passthrough", "-t", str(image_duration), str(output_path)]
+        self._run(cmd)
+        return str(output_path)
+
+    def concat_segments(self, segment_files: List[str], output_path: str, audio_bed: Optional[str] = None) -> str:
+        """encode_segment() 로 만든 구간들과 배경음악을 재인코딩 없이(stream copy) 합칩니다."""
+        with tempfile.TemporaryDirectory(prefix="ffmpeg-") as tmp_dir:
+            list_path = Path(tmp_dir) / "segments.txt"
+            list_path.write_text("\n".join(self._quote(path) for path in segment_files) + "\n", encoding="utf-8")
+            cmd = [
+                self.ffmpeg_path, "-y", "-hide_banner", "-loglevel", "error",
+                "-f", "concat", "-safe", "0", "-i", str(list_path)
+            ]
+            if audio_bed:
+                cmd += ["-i", str(audio_bed), "-map", "0:v", "-map", "1:a"]
+            cmd += ["-c", "copy", "-movflags", "+faststart", str(output_path)]
+            self._run(cmd)
+        return str(output_path)
+
+    def mux(self, video_path: str, audio_path: str, output_path: str) -> str:
+        """영상과 음성을 재인코딩 없이(stream copy) 하나의 파일로 합칩니다."""
+        self._run([
+            self.ffmpeg_path, "-y", "-hide_banner", "-loglevel", "error",
+            "-i", str(video_path), "-i", str(audio_path),
+            "-map", "0:v", "-map", "1:a", "-c", "copy", "-shortest",
+            "-movflags", "+faststart", str(output_path)
+        ])
+        return str(output_path)
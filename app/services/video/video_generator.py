@@ -1,21 +1,57 @@
+import json
 import os
+import shutil
+import tempfile
+import time
 from pathlib import Path
-from typing import Optional, List
-from moviepy.editor import VideoFileClip, ImageClip, concatenate_videoclips, AudioFileClip, vfx
+from typing import TYPE_CHECKING, Optional, List
 import logging
+from app.core.config.settings import settings
+from app.core.config.video_config import ENCODING_PROFILES, ENCODE_STATS_FILE
+from app.services.video.audio_cache import AudioBedCache
+from app.services.video.ffmpeg_encoder import FFmpegEncoder
+
+# moviepy(numpy, imageio 포함)와 Pillow 는 moviepy 백엔드를 쓸 때만 import 합니다.
+if TYPE_CHECKING:
+    import numpy as np
 
 logger = logging.getLogger(__name__)
 
 class VideoGenerator:
     """비디오 생성 서비스 클래스"""
     
-    def __init__(self, output_dir: str = "data/videos"):
+    BACKENDS = ("moviepy", "ffmpeg")
+    WEEKLY_VIDEO_FILENAME = "주간 롤 스킨 할인 정보.mp4"
+
+    def __init__(self, output_dir: str = "data/videos", backend: Optional[str] = None, profile: Optional[str] = None):
         """
         Args:
             output_dir (str): 생성된 비디오가 저장될 디렉토리 경로
+            backend (str, optional): 인코더 백엔드 ("moviepy" 또는 "ffmpeg"), 기본값은 설정값
+            profile (str, optional): 인코딩 프로필 이름 (video_config.ENCODING_PROFILES), 기본값은 설정값
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.backend = backend or settings.VIDEO_ENCODER_BACKEND
+        if self.backend not in self.BACKENDS:
+            raise ValueError(f"backend must be one of {self.BACKENDS}")
+        self.profile_name = profile or settings.VIDEO_ENCODING_PROFILE
+        if self.profile_name not in ENCODING_PROFILES:
+            raise ValueError(f"profile must be one of {tuple(ENCODING_PROFILES)}")
+        self.profile = ENCODING_PROFILES[self.profile_name]
+        self.last_encode_stats = None
+
+    def _get_image_files(self, image_dir: str) -> List[Path]:
+        """디렉토리의 이미지 파일을 정렬된 목록으로 반환합니다."""
+        image_files = [f for f in Path(image_dir).glob("*")
+                       if f.suffix.lower() in ('.png', '.jpg', '.jpeg')]
+
+        if not image_files:
+            raise ValueError(f"'{image_dir}' 디렉토리에 이미지 파일이 없습니다.")
+
+        # 이미지 파일들을 정렬
+        image_files.sort()
+        return image_files
     
     def create_video_from_images(
         self,
@@ -42,79 +78,197 @@ class VideoGenerator:
             ValueError: 이미지 파일이 없거나 처리 중 오류가 발생한 경우
         """
         try:
-            # 이미지 파일 목록 가져오기
-            image_files = [f for f in Path(image_dir).glob("*") 
-                         if f.suffix.lower() in ('.png', '.jpg', '.jpeg')]
-            
-            if not image_files:
-                raise ValueError(f"'{image_dir}' 디렉토리에 이미지 파일이 없습니다.")
-            
-            # 이미지 파일들을 정렬
-            image_files.sort()
-            
+            image_files = self._get_image_files(image_dir)
+            output_path = str(self.output_dir / output_filename)
+
+            started = time.perf_counter()
+            # 배경음악은 (원본 해시, 길이, 볼륨, 페이드) 별로 한 번만 인코딩하고 이후에는 stream copy
+            audio_bed = None
+            if audio_file and os.path.exists(audio_file):
+                audio_bed = str(AudioBedCache().prepare(
+                    audio_file, duration=len(image_files) * image_duration, volume=0.7, fade=1
+                ))
+
+            # 실행마다 별도 임시 디렉토리를 사용해 동시 실행 시 임시 파일이 충돌하지 않게 함
+            with tempfile.TemporaryDirectory(prefix="video-") as run_dir:
+                if self.backend == "ffmpeg":
+                    logger.info(f"비디오 저장 중 (ffmpeg): {output_path}")
+                    FFmpegEncoder.from_profile(self.profile).encode(
+                        image_files,
+                        output_path,
+                        image_duration=image_duration,
+                        transition_duration=transition_duration,
+                        audio_bed=audio_bed
+                    )
+                else:
+                    self._encode_with_moviepy(
+                        image_files, output_path, image_duration, audio_bed, transition_duration, run_dir
+                    )
+            self._record_encode_stats(output_path, time.perf_counter() - started, len(image_files) * image_duration)
+
+            return output_path
+
+        except Exception as e:
+            raise ValueError(f"비디오 생성 중 오류 발생: {str(e)}")
+
+    def create_video_from_segments(
+        self,
+        segment_files: List[str],
+        output_filename: str,
+        image_duration: int = 3,
+        audio_file: Optional[str] = None,
+        encode_seconds: float = 0.0
+    ) -> str:
+        """
+        FFmpegEncoder.encode_segment() 로 카드마다 미리 인코딩한 구간들을 재인코딩 없이 합쳐 비디오를 만듭니다.
+
+        Args:
+            segment_files (List[str]): 순서대로 정렬된 구간 파일 목록
+            output_filename (str): 출력될 비디오 파일 이름
+            image_duration (int): 각 구간(카드)의 길이(초)
+            audio_file (str, optional): 배경음악 파일 경로
+            encode_seconds (float): 구간 인코딩에 걸린 시간(초), 인코딩 통계에 합산됨
+
+        Returns:
+            str: 생성된 비디오 파일의 경로
+        """
+        try:
+            if not segment_files:
+                raise ValueError("합칠 비디오 구간이 없습니다.")
+            output_path = str(self.output_dir / output_filename)
+
+            started = time.perf_counter()
+            duration = len(segment_files) * image_duration
+            audio_bed = None
+            if audio_file and os.path.exists(audio_file):
+                audio_bed = str(AudioBedCache().prepare(audio_file, duration=duration, volume=0.7, fade=1))
+
+            logger.info(f"비디오 구간 합치는 중: {output_path}")
+            FFmpegEncoder.from_profile(self.profile).concat_segments(segment_files, output_path, audio_bed)
+            self._record_encode_stats(output_path, encode_seconds + time.perf_counter() - started, duration)
+            return output_path
+
+        except Exception as e:
+            raise ValueError(f"비디오 생성 중 오류 발생: {str(e)}")
+
+    def _encode_with_moviepy(
+        self,
+        image_files: List[Path],
+        output_path: str,
+        image_duration: int,
+        audio_bed: Optional[str],
+        transition_duration: float,
+        run_dir: str
+    ):
+        """MoviePy 로 영상만 합성한 뒤, 준비된 배경음악을 stream copy 로 합칩니다."""
+        from moviepy.editor import ImageClip, concatenate_videoclips, vfx
+
+        if transition_duration > 0 and len(image_files) > 1:
+            final_clip = self._crossfade_clips(image_files, image_duration, transition_duration)
+        else:
             # 이미지 클립 생성 및 연결
             clips = []
             for image_path in image_files:
-                clip = ImageClip(str(image_path)).set_duration(image_duration)
+                clip = ImageClip(self._load_frame(image_path)).set_duration(image_duration)
                 clips.append(clip)
-            
+
             # 모든 클립 연결
             final_clip = concatenate_videoclips(clips, method="compose")
-            
-            # 페이드 인/아웃 효과 추가
-            final_clip = final_clip.fx(vfx.fadein, 1).fx(vfx.fadeout, 1)
-            
-            # 배경 음악 추가
-            if audio_file and os.path.exists(audio_file):
-                try:
-                    logger.info(f"오디오 파일 로드 중: {audio_file}")
-                    audio = AudioFileClip(str(audio_file))
-                    logger.info(f"오디오 길이: {audio.duration}초, 비디오 길이: {final_clip.duration}초")
-                    
-                    # 오디오 길이를 비디오 길이에 맞춤
-                    if audio.duration > final_clip.duration:
-                        audio = audio.subclip(0, final_clip.duration)
-                    else:
-                        # 오디오가 비디오보다 짧으면 반복
-                        audio = audio.loop(duration=final_clip.duration)
-                    
-                    # 오디오 볼륨 조절 (70%로 설정)
-                    audio = audio.volumex(0.7)
-                    # 오디오 페이드 인/아웃 효과 추가
-                    audio = audio.audio_fadein(1).audio_fadeout(1)
-                    logger.info("오디오를 비디오에 적용 중...")
-                    final_clip = final_clip.set_audio(audio)
-                    logger.info("오디오 적용 완료")
-                except Exception as e:
-                    logger.error(f"오디오 처리 중 오류 발생: {str(e)}")
-                    raise
-            
-            # 출력 파일 경로 생성
-            output_path = str(self.output_dir / output_filename)
-            
-            # 비디오 저장
-            logger.info(f"비디오 저장 중: {output_path}")
-            final_clip.write_videofile(
-                output_path,
-                fps=24,
-                codec='libx264',
-                audio_codec='aac',
-                temp_audiofile='temp-audio.m4a',
-                remove_temp=True,
-                logger=None  # moviepy의 기본 로깅 비활성화
+        
+        # 페이드 인/아웃 효과 추가
+        final_clip = final_clip.fx(vfx.fadein, 1).fx(vfx.fadeout, 1)
+        
+        # 비디오 저장
+        video_only_path = os.path.join(run_dir, "video.mp4")
+        logger.info(f"비디오 저장 중: {output_path}")
+        ffmpeg_params = ["-crf", str(self.profile["crf"])]
+        if self.profile.get("tune"):
+            ffmpeg_params += ["-tune", self.profile["tune"]]
+        final_clip.write_videofile(
+            video_only_path,
+            fps=self.profile["fps"],
+            codec='libx264',
+            preset=self.profile["preset"],
+            threads=self.profile.get("threads") or None,
+            ffmpeg_params=ffmpeg_params,
+            audio=False,
+            logger=None  # moviepy의 기본 로깅 비활성화
+        )
+        
+        # 메모리 정리
+        final_clip.close()
+
+        # 배경 음악 추가
+        if audio_bed:
+            logger.info("오디오를 비디오에 적용 중...")
+            FFmpegEncoder().mux(video_only_path, audio_bed, output_path)
+        else:
+            shutil.move(video_only_path, output_path)
+
+    def _record_encode_stats(self, output_path: str, seconds: float, duration: float):
+        """인코딩 시간, 비트레이트, 파일 크기를 기록합니다."""
+        size = os.path.getsize(output_path)
+        self.last_encode_stats = {
+            "profile": self.profile_name,
+            "backend": self.backend,
+            "encode_seconds": round(seconds, 2),
+            "duration_seconds": duration,
+            "size_bytes": size,
+            "bitrate_kbps": round(size * 8 / duration / 1000, 1) if duration else None,
+            "encoded_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        }
+        logger.info(f"비디오 저장 완료: {self.last_encode_stats}")
+        try:
+            os.makedirs(os.path.dirname(ENCODE_STATS_FILE), exist_ok=True)
+            with open(ENCODE_STATS_FILE, "a", encoding="utf-8") as f:
+                f.write(json.dumps(self.last_encode_stats, ensure_ascii=False) + "\n")
+        except OSError as e:
+            logger.error(f"인코딩 통계 기록 실패: {str(e)}")
+
+    def _load_frame(self, image_path: Path) -> "np.ndarray":
+        """이미지를 RGB 배열로 읽고, 축소 출력 프로필이면 프레임마다가 아니라 여기서 한 번만 축소합니다."""
+        import numpy as np
+        from PIL import Image
+
+        with Image.open(image_path) as image:
+            image = image.convert("RGB")
+            scale = self.profile.get("scale")
+            if scale and scale != 1:
+                size = (int(image.width * scale) // 2 * 2, int(image.height * scale) // 2 * 2)
+                image = image.resize(size, Image.Resampling.LANCZOS)
+            return np.asarray(image)
+
+    @staticmethod
+    def _blend(start: "np.ndarray", end: "np.ndarray", alpha: float) -> "np.ndarray":
+        """두 프레임을 정수 연산으로 알파 블렌딩합니다."""
+        import numpy as np
+
+        weight = int(round(alpha * 256))
+        blended = start.astype(np.uint16) * (256 - weight) + end.astype(np.uint16) * weight
+        return (blended >> 8).astype(np.uint8)
+
+    def _crossfade_clips(self, image_files: List[Path], image_duration: int, transition_duration: float):
+        """
+        크로스페이드가 들어간 클립을 만듭니다.
+
+        정지 구간은 ImageClip 으로 같은 배열을 그대로 내보내고, 블렌딩은 전환 구간 프레임에서만 NumPy 로 계산합니다.
+        전체 길이는 전환이 없을 때와 같은 (이미지 수 × image_duration) 입니다.
+        """
+        from moviepy.editor import ImageClip, VideoClip, concatenate_videoclips
+
+        images = [self._load_frame(image_path) for image_path in image_files]
+        clips = [ImageClip(images[0]).set_duration(image_duration)]
+        for previous, current in zip(images, images[1:]):
+            transition = VideoClip(
+                lambda t, a=previous, b=current: self._blend(a, b, min(t / transition_duration, 1.0)),
+                duration=transition_duration
             )
-            logger.info("비디오 저장 완료")
-            
-            # 메모리 정리
-            final_clip.close()
-            if audio_file and os.path.exists(audio_file):
-                audio.close()
-            
-            return str(output_path)
-            
-        except Exception as e:
-            raise ValueError(f"비디오 생성 중 오류 발생: {str(e)}")
-    
+            clips.append(transition)
+            clips.append(ImageClip(current).set_duration(image_duration - transition_duration))
+
+        # 모든 클립이 같은 크기이므로 합성(compose) 없이 이어 붙임
+        return concatenate_videoclips(clips, method="chain")
+
     def create_weekly_sale_video(
         self,
         image_dir: str,
@@ -136,8 +290,8 @@ class VideoGenerator:
         """
         return self.create_video_from_images(
             image_dir=image_dir,
-            output_filename="주간 롤 스킨 할인 정보.mp4",
+            output_filename=self.WEEKLY_VIDEO_FILENAME,
             image_duration=image_duration,
             audio_file=audio_file,
             transition_duration=transition_duration
-        ) 
\ No newline at end of file
+        )
@@ -0,0 +1,186 @@
+import json
+import os
+import time
+from typing import Optional
+
+from app.core.config.youtube_config import UPLOAD_SESSION_MAX_AGE
+
+# 재개 가능 업로드 청크는 256KiB 의 배수여야 함
+CHUNK_GRANULARITY = 256 * 1024
+
+
+class ResumableUploadError(Exception):
+    """재시도 가능한 업로드 오류 (5xx 응답)"""
+
+    def __init__(self, status: int, content: str = ""):
+        super().__init__(f"HTTP {status}: {content[:500]}")
+        self.status = status
+
+
+class ResumableUpload:
+    """
+    YouTube 재개 가능 업로드 프로토콜 클라이언트.
+    세션 URI 와 업로드된 바이트 위치를 파일에 저장하므로 프로세스가 재시작되어도 이어서 업로드할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        session,
+        file_path: str,
+        body: dict,
+        upload_url: str,
+        state_file: str,
+        chunk_size: int
+    ):
+        """
+        Args:
+            session: 인증된 requests 호환 세션 (google.auth.transport.requests.AuthorizedSession 등)
+            file_path: 업로드할 파일 경로
+            body: 비디오 메타데이터 (snippet, status)
+            upload_url: 업로드 엔드포인트 URL
+            state_file: 세션 상태 저장 파일 경로
+            chunk_size: 청크 크기 (256KiB 배수로 올림)
+        """
+        self.session = session
+        self.file_path = file_path
+        self.body = body
+        self.upload_url = upload_url
+        self.state_file = state_file
+        self.chunk_size = max(CHUNK_GRANULARITY, -(-chunk_size // CHUNK_GRANULARITY) * CHUNK_GRANULARITY)
+        stat = os.stat(file_path)
+        self.file_size = stat.st_size
+        self.file_mtime = stat.st_mtime
+        self.session_uri = None
+        self.offset = 0
+        # 연결 오류 뒤에는 서버에 실제 수신 위치를 먼저 확인
+        self._needs_sync = False
+
+    def _load_state(self) -> Optional[dict]:
+        try:
+            with open(self.state_file, "r") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if (state.get("file") != os.path.abspath(self.file_path)
+                or state.get("size") != self.file_size
+                or state.get("mtime") != self.file_mtime
+                or time.time() - state.get("created_at", 0) > UPLOAD_SESSION_MAX_AGE):
+            return None
+        return state
+
+    def _save_state(self, created_at: Optional[float] = None):
+        state = self._load_state() or {}
+        state.update({
+            "file": os.path.abspath(self.file_path),
+            "size": self.file_size,
+            "mtime": self.file_mtime,
+            "session_uri": self.session_uri,
+            "offset": self.offset,
+            "created_at": created_at or state.get("created_at") or time.time()
+        })
+        os.makedirs(os.path.dirname(self.state_file) or ".", exist_ok=True)
+        tmp_path = f"{self.state_file}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.state_file)
+
+    def clear_state(self):
+        try:
+            os.remove(self.state_file)
+        except FileNotFoundError:
+            pass
+
+    def _initiate(self):
+        """새 업로드 세션을 만들고 세션 URI 를 저장합니다."""
+        response = self.session.post(
+            self.upload_url,
+            params={"uploadType": "resumable", "part": ",".join(self.body.keys())},
+            json=self.body,
+            headers={
+                "X-Upload-Content-Length": str(self.file_size),
+                "X-Upload-Content-Type": "video/*"
+            }
+        )
+        if response.status_code >= 500:
+            raise ResumableUploadError(response.status_code, response.text)
+        response.raise_for_status()
+        self.session_uri = response.headers["Location"]
+        self.offset = 0
+        self._save_state(created_at=time.time())
+        print(f"Started upload session for {self.file_path}")
+
+    def _apply_range(self, response):
+        """308 응답의 Range 헤더(bytes=0-N)로 다음 업로드 위치를 갱신합니다."""
+        range_header = response.headers.get("Range")
+        self.offset = int(range_header.rsplit("-", 1)[1]) + 1 if range_header else 0
+        self._save_state()
+
+    def _handle_response(self, response) -> Optional[dict]:
+        if response.status_code in (200, 201):
+            self.clear_state()
+            return response.json()
+        if response.status_code == 308:
+            self._apply_range(response)
+            return None
+        if response.status_code in (404, 410):
+            # 세션이 만료되면 처음부터 새 세션으로 시작
+            print("Upload session expired, starting a new one.")
+            self.session_uri = None
+            self.clear_state()
+            return None
+        if response.status_code >= 500:
+            self._needs_sync = True
+            raise ResumableUploadError(response.status_code, response.text)
+        response.raise_for_status()
+        return None
+
+    def _sync_offset(self) -> Optional[dict]:
+        """서버가 실제로 받은 바이트 위치를 조회합니다."""
+        response = self.session.put(
+            self.session_uri,
+            headers={"Content-Range": f"bytes */{self.file_size}", "Content-Length": "0"}
+        )
+        self._needs_sync = False
+        return self._handle_response(response)
+
+    def next_chunk(self) -> Optional[dict]:
+        """
+        다음 청크 하나를 업로드합니다 (블로킹).
+
+        Returns:
+            업로드가 끝나면 API 응답(dict), 아직 남았으면 None
+        """
+        if self.session_uri is None:
+            state = self._load_state()
+            if state and state.get("session_uri"):
+                # 이전 프로세스가 남긴 세션으로 이어서 업로드
+                self.session_uri = state["session_uri"]
+                print(f"Resuming upload session at byte {state.get('offset', 0)}")
+                return self._sync_offset()
+            self._initiate()
+            return None
+
+        if self._needs_sync:
+            return self._sync_offset()
+
+        end = min(self.offset + self.chunk_size, self.file_size) - 1
+        with open(self.file_path, "rb") as f:
+            f.seek(self.offset)
+            data = f.read(end - self.offset + 1)
+
+        try:
+            response = self.session.put(
+                self.session_uri,
+                data=data,
+                headers={
+                    "Content-Range": f"bytes {self.offset}-{end}/{self.file_size}",
+                    "Content-Length": str(len(data))
+                }
+            )
+        except Exception:
+            self._needs_sync = True
+            raise
+        result = self._handle_response(response)
+        if result is None and self.session_uri is not None:
+            print(f"Uploaded {self.offset}/{self.file_size} bytes ({self.offset * 100 // max(self.file_size, 1)}%)")
+        return result
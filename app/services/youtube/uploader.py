@@ -1,13 +1,13 @@
+import asyncio
 import http.client as httplib
 import httplib2
 import random
 import time
 from typing import Optional, List
 import json
+import requests
 
 from apiclient.discovery import build
-from apiclient.errors import HttpError
-from apiclient.http import MediaFileUpload
 from oauth2client.client import flow_from_clientsecrets
 from oauth2client.file import Storage
 from oauth2client.tools import run_flow
@@ -19,16 +19,20 @@ from app.core.config.youtube_config import (
     CLIENT_SECRETS_FILE,
     OAUTH2_FILE,
     MAX_RETRIES,
+    UPLOAD_URL,
+    UPLOAD_CHUNK_SIZE,
+    UPLOAD_STATE_FILE,
     MISSING_CLIENT_SECRETS_MESSAGE,
     VALID_PRIVACY_STATUSES
 )
 
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
+from google.auth.transport.requests import Request, AuthorizedSession
 import os
 import pickle
 from app.core.config.settings import settings
+from app.services.youtube.resumable import ResumableUpload, ResumableUploadError
 
 # HTTP 관련 설정
 httplib2.RETRIES = 1
@@ -74,6 +78,41 @@ class YouTubeUploader:
 
         self.youtube = build(YOUTUBE_API_SERVICE_NAME, YOUTUBE_API_VERSION, credentials=self.credentials)
 
+    def _create_upload(
+        self,
+        file_path: str,
+        title: str,
+        description: str,
+        category: str,
+        keywords: Optional[List[str]],
+        privacy_status: str,
+        chunk_size: Optional[int]
+    ) -> ResumableUpload:
+        """업로드 메타데이터를 만들고 재개 가능 업로드 세션 객체를 반환합니다."""
+        if privacy_status not in VALID_PRIVACY_STATUSES:
+            raise ValueError(f"privacy_status must be one of {VALID_PRIVACY_STATUSES}")
+
+        body = {
+            "snippet": {
+                "title": title,
+                "description": description,
+                "tags": keywords or [],
+                "categoryId": category
+            },
+            "status": {
+                "privacyStatus": privacy_status
+            }
+        }
+
+        return ResumableUpload(
+            session=AuthorizedSession(self.credentials),
+            file_path=file_path,
+            body=body,
+            upload_url=UPLOAD_URL,
+            state_file=UPLOAD_STATE_FILE,
+            chunk_size=chunk_size or UPLOAD_CHUNK_SIZE
+        )
+
     def upload_video(
         self,
         file_path: str,
@@ -81,10 +120,11 @@ class YouTubeUploader:
         description: str = "",
         category: str = "22",
         keywords: Optional[List[str]] = None,
-        privacy_status: str = "public"
+        privacy_status: str = "public",
+        chunk_size: Optional[int] = None
     ) -> Optional[str]:
         """
-        비디오를 YouTube에 업로드합니다.
+        비디오를 YouTube에 업로드합니다. 청크 단위로 업로드하며, 중단되면 저장된 세션에서 이어서 업로드합니다.
 
         Args:
             file_path: 업로드할 비디오 파일 경로
@@ -93,32 +133,43 @@ class YouTubeUploader:
             category: 비디오 카테고리 ID
             keywords: 비디오 키워드 리스트
             privacy_status: 비디오 공개 상태 (public, private, unlisted)
+            chunk_size: 청크 크기(바이트), 기본값은 YOUTUBE_UPLOAD_CHUNK_MB
 
         Returns:
             업로드된 비디오의 ID 또는 실패 시 None
         """
-        if privacy_status not in VALID_PRIVACY_STATUSES:
-            raise ValueError(f"privacy_status must be one of {VALID_PRIVACY_STATUSES}")
+        upload = self._create_upload(file_path, title, description, category, keywords, privacy_status, chunk_size)
+        return self._resumable_upload(upload)
 
-        body = {
-            "snippet": {
-                "title": title,
-                "description": description,
-                "tags": keywords or [],
-                "categoryId": category
-            },
-            "status": {
-                "privacyStatus": privacy_status
-            }
-        }
-
-        insert_request = self.youtube.videos().insert(
-            part=",".join(body.keys()),
-            body=body,
-            media_body=MediaFileUpload(file_path, chunksize=-1, resumable=True)
-        )
+    async def upload_video_async(
+        self,
+        file_path: str,
+        title: str,
+        description: str = "",
+        category: str = "22",
+        keywords: Optional[List[str]] = None,
+        privacy_status: str = "public",
+        chunk_size: Optional[int] = None
+    ) -> Optional[str]:
+        """
+        upload_video 의 비동기 버전. 청크 전송은 스레드에서 실행하고 재시도 대기는 asyncio.sleep 을 사용하므로
+        이벤트 루프(스케줄러, API)를 막지 않습니다.
+        """
+        upload = self._create_upload(file_path, title, description, category, keywords, privacy_status, chunk_size)
+        retry = 0
+        while True:
+            response, error = await asyncio.to_thread(self._upload_step, upload)
+            if error is None:
+                retry = 0
+                if response is not None:
+                    return self._handle_upload_response(response)
+                continue
 
-        return self._resumable_upload(insert_request)
+            retry += 1
+            sleep_seconds = self._backoff(error, retry)
+            if sleep_seconds is None:
+                return None
+            await asyncio.sleep(sleep_seconds)
 
     def add_video_to_playlist(self, video_id: str, playlist_id: str) -> bool:
         """
@@ -149,41 +200,57 @@ class YouTubeUploader:
             print(f"Failed to add video to playlist: {str(e)}")
             return False
 
-    def _resumable_upload(self, insert_request) -> Optional[str]:
+    def _upload_step(self, upload: ResumableUpload):
+        """청크 하나를 전송하고 (응답, 재시도 가능한 오류 메시지) 를 반환합니다."""
+        try:
+            return upload.next_chunk(), None
+        except ResumableUploadError as e:
+            if e.status in RETRIABLE_STATUS_CODES:
+                return None, f"A retriable HTTP error {e.status} occurred:\n{e}"
+            raise
+        except requests.HTTPError as e:
+            # requests.HTTPError 는 IOError 의 하위 클래스이므로 RETRIABLE_EXCEPTIONS 보다 먼저 처리
+            # (400/401/403 등은 재시도해도 같은 결과이므로 바로 실패)
+            status = e.response.status_code if e.response is not None else None
+            if status in RETRIABLE_STATUS_CODES:
+                return None, f"A retriable HTTP error {status} occurred:\n{e}"
+            raise
+        except RETRIABLE_EXCEPTIONS as e:
+            return None, f"A retriable error occurred: {e}"
+
+    def _handle_upload_response(self, response: dict) -> Optional[str]:
+        if 'id' in response:
+            print(f"Video id '{response['id']}' was successfully uploaded.")
+            return response['id']
+        print(f"The upload failed with an unexpected response: {response}")
+        return None
+
+    def _backoff(self, error: str, retry: int) -> Optional[float]:
+        """재시도 대기 시간을 계산합니다. 재시도 횟수를 넘으면 None."""
+        print(error)
+        if retry > MAX_RETRIES:
+            print("No longer attempting to retry.")
+            return None
+
+        max_sleep = 2 ** retry
+        sleep_seconds = random.random() * max_sleep
+        print(f"Sleeping {sleep_seconds} seconds and then retrying...")
+        return sleep_seconds
+
+    def _resumable_upload(self, upload: ResumableUpload) -> Optional[str]:
         """재시도 가능한 업로드를 수행합니다."""
-        response = None
-        error = None
         retry = 0
-
-        while response is None:
-            try:
-                print("Uploading file...")
-                status, response = insert_request.next_chunk()
+        while True:
+            print("Uploading file...")
+            response, error = self._upload_step(upload)
+            if error is None:
+                retry = 0
                 if response is not None:
-                    if 'id' in response:
-                        print(f"Video id '{response['id']}' was successfully uploaded.")
-                        return response['id']
-                    else:
-                        print(f"The upload failed with an unexpected response: {response}")
-                        return None
-            except HttpError as e:
-                if e.resp.status in RETRIABLE_STATUS_CODES:
-                    error = f"A retriable HTTP error {e.resp.status} occurred:\n{e.content}"
-                else:
-                    raise
-            except RETRIABLE_EXCEPTIONS as e:
-                error = f"A retriable error occurred: {e}"
-
-            if error is not None:
-                print(error)
-                retry += 1
-                if retry > MAX_RETRIES:
-                    print("No longer attempting to retry.")
-                    return None
-
-                max_sleep = 2 ** retry
-                sleep_seconds = random.random() * max_sleep
-                print(f"Sleeping {sleep_seconds} seconds and then retrying...")
-                time.sleep(sleep_seconds)
-
-        return None 
\ No newline at end of file
+                    return self._handle_upload_response(response)
+                continue
+
+            retry += 1
+            sleep_seconds = self._backoff(error, retry)
+            if sleep_seconds is None:
+                return None
+            time.sleep(sleep_seconds)
@@ -0,0 +1,50 @@
+"""
+Micro benchmark: list scan vs hashed DiscountIndex/ExceptionIndex on 10k synthetic skins
+
+Usage: python -m benchmarks.discount_index
+"""
+import time
+
+from app.services.lol_store.index import DiscountIndex, ExceptionIndex
+
+SIZE = 10_000
+
+
+def main():
+    skins = [
+        {
+            "url": f"https://cdn-store.leagueoflegends.co.kr/images/v2/champion-splashes/{i}.jpg",
+            "name": f"스킨 {i}",
+            "price": f"{i % 3000} RP",
+            "discount": f"-{i % 90}%",
+        }
+        for i in range(SIZE)
+    ]
+    exceptions = skins[::2]
+
+    start = time.perf_counter()
+    collected = []
+    for skin in skins:
+        if any(skin["name"] == e["name"] and skin["discount"] == e["discount"] for e in exceptions):
+            continue
+        if skin not in collected:
+            collected.append(skin)
+    linear_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    exception_index = ExceptionIndex(exceptions)
+    index = DiscountIndex()
+    for skin in skins:
+        if skin in exception_index:
+            continue
+        index.add(skin)
+    hashed_elapsed = time.perf_counter() - start
+
+    assert index.to_list() == collected
+    print(f"linear scan : {linear_elapsed * 1000:.1f} ms ({len(collected)} items)")
+    print(f"hashed index: {hashed_elapsed * 1000:.1f} ms ({len(index)} items)")
+    print(f"speedup     : {linear_elapsed / hashed_elapsed:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Benchmark: HistoryStore queries on three years of synthetic history
+
+156 weeks of 3,000 skins (468,000 rows), about 20x the real weekly sale of ~150 skins.
+
+Usage: python -m benchmarks.history_queries
+"""
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from app.services.lol_store.history import KST, HistoryStore
+
+WEEKS = 156
+ITEMS_PER_WEEK = 3000
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = HistoryStore(f"{tmp_dir}/history.sqlite3")
+        names = [f"스킨 {i}" for i in range(ITEMS_PER_WEEK * 2)]
+        started = time.perf_counter()
+        for week in range(WEEKS):
+            scraped_at = (KST.localize(datetime(2023, 1, 3, 4, 10)) + timedelta(weeks=week)).isoformat()
+            store.record(
+                [
+                    {"url": "", "name": name, "price": f"{random.randint(3, 30) * 50} RP", "discount": f"-{random.choice((20, 30, 40, 50))}%"}
+                    for name in random.sample(names, ITEMS_PER_WEEK)
+                ],
+                scraped_at
+            )
+        with store._connect() as conn:
+            rows = conn.execute("SELECT COUNT(*) FROM snapshot_items").fetchone()[0]
+        print(f"{rows} rows recorded in {time.perf_counter() - started:.1f}s")
+
+        for label, query in [
+            ("price_history", lambda: store.price_history("스킨 42")),
+            ("week_items", lambda: store.week_items("2024-W10")),
+            ("seen_discounted", lambda: store.seen_discounted(before="2025-01-01")),
+            ("latest_snapshot", lambda: store.latest_snapshot(before_week="2025-W52")),
+        ]:
+            started = time.perf_counter()
+            for _ in range(100):
+                query()
+            print(f"{label:16s} {(time.perf_counter() - started) * 10:.2f} ms/query")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark: encode the same cards with every VideoGenerator backend
+
+Each backend runs in its own spawned process so encode time and peak memory do not mix.
+
+Usage: python -m benchmarks.video_backends [image dir] [audio file]
+"""
+import logging
+import multiprocessing
+import os
+import resource
+import sys
+import time
+from typing import Optional
+
+from app.services.video.video_generator import VideoGenerator
+
+logger = logging.getLogger(__name__)
+
+
+def _run_backend(queue, output_dir, backend, image_dir, audio_file, image_duration):
+    """Child process entry point of benchmark_backends"""
+    generator = VideoGenerator(output_dir=output_dir, backend=backend)
+    started = time.perf_counter()
+    output_path = generator.create_video_from_images(
+        image_dir=image_dir,
+        output_filename=f"benchmark-{backend}.mp4",
+        image_duration=image_duration,
+        audio_file=audio_file
+    )
+    elapsed = time.perf_counter() - started
+    # ru_maxrss 는 리눅스에서 KB 단위, ffmpeg 하위 프로세스는 RUSAGE_CHILDREN 으로 집계
+    peak_kb = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    )
+    queue.put({
+        "seconds": round(elapsed, 2),
+        "peak_rss_mb": round(peak_kb / 1024, 1),
+        "size_mb": round(os.path.getsize(output_path) / (1024 * 1024), 2)
+    })
+
+
+def benchmark_backends(output_dir: str, image_dir: str, audio_file: Optional[str] = None, image_duration: int = 3) -> dict:
+    """
+    Encode the same input with every backend
+
+    Returns:
+        dict: {backend: {"seconds", "peak_rss_mb", "size_mb"}}
+    """
+    context = multiprocessing.get_context("spawn")
+    results = {}
+    for backend in VideoGenerator.BACKENDS:
+        queue = context.Queue()
+        process = context.Process(
+            target=_run_backend,
+            args=(queue, output_dir, backend, image_dir, audio_file, image_duration)
+        )
+        process.start()
+        results[backend] = queue.get()
+        process.join()
+        logger.info(f"{backend}: {results[backend]}")
+    return results
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    image_dir = sys.argv[1] if len(sys.argv) > 1 else "data/images"
+    audio_file = sys.argv[2] if len(sys.argv) > 2 else "data/audio/bgm.mp3"
+    for backend, result in benchmark_backends("data/videos/benchmark", image_dir, audio_file).items():
+        print(f"{backend:8s} {result['seconds']:8.2f}s {result['peak_rss_mb']:8.1f}MB RSS {result['size_mb']:6.2f}MB file")
+
+
+if __name__ == "__main__":
+    main()
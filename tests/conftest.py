@@ -0,0 +1,176 @@
+import re
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from app.core.response_cache import response_cache
+from app.services.image_generator.render_cache import RenderCache
+from app.services.lol_store.history import HistoryStore
+from app.services.lol_store.sources import DiscountSource
+from app.services.lol_store.store import LoLStoreService
+from app.services.video.ffmpeg_encoder import find_ffmpeg
+
+
+def make_skin(name: str, discount: str = "-30%", price: str = "975 RP") -> dict:
+    return {"url": f"https://example.test/{name}.jpg", "name": name, "price": price, "discount": discount}
+
+
+class FakeSource(DiscountSource):
+    """Source returning fixed batches (streamed through on_items), optionally failing after them"""
+
+    def __init__(self, batches=(), error: Exception = None, name: str = "fake"):
+        super().__init__()
+        self.batches = [list(batch) for batch in batches]
+        self.error = error
+        self.name = name
+        self.calls = 0
+
+    async def fetch(self, on_items=None):
+        self.calls += 1
+        results = []
+        for batch in self.batches:
+            if on_items is not None:
+                await on_items(batch)
+            results += batch
+        if self.error is not None:
+            raise self.error
+        self.last_stats = {"items": len(results)}
+        return results
+
+
+def busy_stage(seconds: float, output_path: str) -> str:
+    """CPU-bound stand-in for image rendering / video encoding, run in a spawned process pool"""
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(i * i for i in range(10_000))
+    Path(output_path).write_bytes(b"stage output")
+    return output_path
+
+
+def busy_card(seconds: float, output_path: str, color: tuple) -> Path:
+    """CPU-bound stand-in for rendering one card, run in a spawned process pool"""
+    from PIL import Image
+
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(i * i for i in range(10_000))
+    Image.new("RGB", (320, 568), color).save(output_path)
+    return Path(output_path)
+
+
+# 가짜 카드 색 (스킨 이름별, 그 외는 회색)
+COLORS = {"A": (255, 0, 0), "B": (0, 255, 0), "C": (0, 0, 255), "D": (255, 255, 0)}
+COLORS.update({f"S{i}": (i * 20, 0, 0) for i in range(10)})
+GRAY = (128, 128, 128)
+
+
+class FakeAssetCache:
+    def __init__(self):
+        self.fetched = []
+
+    def fetch(self, url):
+        self.fetched.append(url)
+
+
+class FakeImageGenerator:
+    """DiscountImageGenerator stand-in rendering a solid card per skin name on a thread pool"""
+
+    def __init__(self, workdir, render_seconds: float = 0.0, fail_on: str = None):
+        self.output_dir = workdir / "images"
+        self.output_dir.mkdir(exist_ok=True)
+        self.render_cache = RenderCache(cache_dir=workdir / "renders")
+        self.asset_cache = FakeAssetCache()
+        self.render_seconds = render_seconds
+        self.fail_on = fail_on
+        self.rendered = []
+        self.lock = threading.Lock()
+
+    def _get_date_range(self):
+        return "2025.05.13", "2025.05.20"
+
+    def clear_output_dir(self):
+        for path in self.output_dir.glob("*.png"):
+            path.unlink()
+
+    def render_workers(self):
+        return 1
+
+    def create_render_executor(self, workers):
+        return ThreadPoolExecutor(max_workers=workers)
+
+    def _render(self, skin, index):
+        from PIL import Image
+
+        time.sleep(self.render_seconds)
+        if skin["name"] == self.fail_on:
+            raise RuntimeError(f"render failed: {skin['name']}")
+        path = self.output_dir / f"{index:02d}.png"
+        Image.new("RGB", (320, 568), COLORS.get(skin["name"], GRAY)).save(path)
+        with self.lock:
+            self.rendered.append(skin["name"])
+        return path
+
+    def submit_render(self, executor, skin, index, date_range):
+        return executor.submit(self._render, skin, index)
+
+
+def frame_count(path) -> int:
+    """Number of video frames in a file, counted by decoding it"""
+    result = subprocess.run([find_ffmpeg(), "-i", str(path), "-f", "null", "-"], capture_output=True, text=True)
+    return int(re.findall(r"frame=\s*(\d+)", result.stderr)[-1])
+
+
+def duration(path) -> float:
+    """Container duration in seconds"""
+    result = subprocess.run([find_ffmpeg(), "-i", str(path)], capture_output=True, text=True)
+    hours, minutes, seconds = re.search(r"Duration: (\d+):(\d+):([\d.]+)", result.stderr).groups()
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+def frame_color(path, at: float, tmp_path) -> tuple:
+    """RGB of the center pixel of the frame shown at `at` seconds"""
+    from PIL import Image
+
+    frame_path = tmp_path / "frame.png"
+    subprocess.run(
+        [find_ffmpeg(), "-y", "-loglevel", "error", "-ss", str(at), "-i", str(path), "-frames:v", "1", str(frame_path)],
+        check=True
+    )
+    with Image.open(frame_path) as frame:
+        return frame.convert("RGB").getpixel((frame.width // 2, frame.height // 2))
+
+
+def close_to(color, expected, tolerance=40) -> bool:
+    return all(abs(a - b) <= tolerance for a, b in zip(color, expected))
+
+
+def has_audio(path) -> bool:
+    result = subprocess.run([find_ffmpeg(), "-i", str(path)], capture_output=True, text=True)
+    return "Audio:" in result.stderr
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    # 서비스 인스턴스마다 generation 이 0 부터 시작하므로 테스트 사이에 캐시를 비움
+    response_cache.invalidate()
+    yield
+    response_cache.invalidate()
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Run with data/ under a temporary directory"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def make_store_service(workdir):
+    """LoLStoreService factory sharing data/lol_store/discounts.json and the history DB in workdir"""
+    def make(sources=()):
+        return LoLStoreService(sources=list(sources), history=HistoryStore(str(workdir / "history.sqlite3")))
+    return make
@@ -0,0 +1,131 @@
+import os
+import threading
+import time
+
+import pytest
+import requests
+
+from app.services.image_generator.asset_cache import AssetCache
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+
+class FakeSession:
+    """requests.Session stand-in serving one body per URL with an ETag (304 on a matching If-None-Match, 404 otherwise)"""
+
+    def __init__(self, bodies):
+        self.bodies = bodies
+        self.requests = []
+        self.fail = False
+        self.lock = threading.Lock()
+
+    def get(self, url, headers=None, timeout=None):
+        with self.lock:
+            self.requests.append((url, dict(headers or {})))
+        if self.fail:
+            raise requests.ConnectionError("store unreachable")
+        if url not in self.bodies:
+            return FakeResponse(404)
+        etag = f'"{len(self.bodies[url])}"'
+        if (headers or {}).get("If-None-Match") == etag:
+            return FakeResponse(304)
+        return FakeResponse(200, self.bodies[url], {"ETag": etag, "Last-Modified": "Tue, 13 May 2025 04:10:00 GMT"})
+
+
+URLS = {f"https://example.test/{name}.jpg": name.encode() * 100 for name in "ABC"}
+
+
+@pytest.fixture
+def session():
+    return FakeSession(URLS)
+
+
+@pytest.fixture
+def make_cache(tmp_path, session):
+    def make(**options):
+        cache = AssetCache(cache_dir=tmp_path / "assets", workers=4, **options)
+        cache.session = session
+        return cache
+    return make
+
+
+def test_fetch_downloads_then_serves_fresh_copy(make_cache, session):
+    cache = make_cache(fresh_seconds=3600)
+    url = "https://example.test/A.jpg"
+
+    path = cache.fetch(url)
+    assert path.read_bytes() == URLS[url]
+    assert cache.fetch(url) == path
+
+    assert len(session.requests) == 1
+    assert cache.stats == {"fresh": 1, "revalidated": 0, "downloaded": 1, "errors": 0}
+
+
+def test_stale_copy_is_revalidated(make_cache, session):
+    url = "https://example.test/A.jpg"
+    make_cache(fresh_seconds=0).fetch(url)
+    cache = make_cache(fresh_seconds=0)
+
+    path = cache.fetch(url)
+
+    assert path.read_bytes() == URLS[url]
+    assert session.requests[-1][1] == {
+        "If-None-Match": f'"{len(URLS[url])}"', "If-Modified-Since": "Tue, 13 May 2025 04:10:00 GMT"
+    }
+    assert cache.stats["revalidated"] == 1 and cache.stats["downloaded"] == 0
+
+
+def test_failed_revalidation_keeps_cached_copy(make_cache, session):
+    url = "https://example.test/A.jpg"
+    cache = make_cache(fresh_seconds=0)
+    path = cache.fetch(url)
+    session.fail = True
+
+    assert cache.fetch(url) == path
+    assert path.read_bytes() == URLS[url]
+    assert cache.stats["errors"] == 1
+    with pytest.raises(requests.ConnectionError):
+        cache.fetch("https://example.test/B.jpg")
+
+
+def test_prefetch_requests_each_url_once(make_cache, session):
+    cache = make_cache(fresh_seconds=3600)
+    urls = ["https://example.test/A.jpg", "", "https://example.test/B.jpg", "https://example.test/A.jpg",
+            "https://example.test/C.jpg", "https://example.test/B.jpg"]
+
+    paths = cache.prefetch(urls)
+
+    assert sorted(url for url, _ in session.requests) == sorted(URLS)
+    assert {url: path.read_bytes() for url, path in paths.items()} == URLS
+    # 같은 이름의 에셋은 한 파일로 저장됨
+    assert len(list(cache.cache_dir.glob("*.bin"))) == 3
+
+
+def test_prefetch_skips_failed_urls(make_cache):
+    cache = make_cache()
+
+    paths = cache.prefetch(["https://example.test/A.jpg", "https://example.test/missing.jpg"])
+
+    assert list(paths) == ["https://example.test/A.jpg"]
+
+
+def test_evict_keeps_protected_assets(make_cache):
+    cache = make_cache(max_bytes=250)
+    paths = [cache.fetch(url) for url in URLS]
+    for age, path in zip((300, 200, 100), paths):
+        os.utime(path, (time.time() - age, time.time() - age))
+
+    cache.evict(protected=[paths[0]])
+
+    # 가장 오래된 A 는 이번 실행에서 쓰므로 남기고 B 를 지움
+    assert [path.exists() for path in paths] == [True, False, True]
+    assert not paths[1].with_suffix(".json").exists()
@@ -0,0 +1,109 @@
+import asyncio
+import os
+
+import httpx
+import pytest
+
+from app.core.config.settings import settings
+from app.core import scheduler as scheduler_module
+from app.core.dependencies import get_content_scheduler
+from app.core.leader import LeaderLock
+from app.main import app
+
+TOKEN = "s3cret-token"
+
+
+class FakeContentScheduler:
+    def __init__(self):
+        self.runs = []
+
+    async def run_weekly_update(self, force: bool = False):
+        self.runs.append(force)
+        return {}
+
+
+@pytest.fixture
+def leader_lock(workdir, monkeypatch):
+    lock = LeaderLock(str(workdir / "scheduler.lock"))
+    monkeypatch.setattr(scheduler_module, "leader_lock", lock)
+    yield lock
+    lock.release()
+
+
+@pytest.fixture
+def content_scheduler(leader_lock):
+    """Fake scheduler in a worker that holds the leader lock"""
+    assert leader_lock.try_acquire()
+    fake = FakeContentScheduler()
+    app.dependency_overrides[get_content_scheduler] = lambda: fake
+    yield fake
+    app.dependency_overrides.clear()
+
+
+def trigger(client_host: str, headers=None):
+    async def request():
+        transport = httpx.ASGITransport(app=app, client=(client_host, 51000))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post("/api/v1/content/weekly-update", headers=headers or {})
+            # 백그라운드 태스크가 실행될 기회를 줌
+            await asyncio.sleep(0)
+            return response
+    return asyncio.run(request())
+
+
+def test_local_request_without_token_setting_starts_run(content_scheduler, monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_API_TOKEN", "")
+
+    response = trigger("127.0.0.1")
+
+    assert response.status_code == 202
+    assert response.json()["status"] == "started"
+    assert content_scheduler.runs == [False]
+
+
+def test_remote_request_without_token_setting_is_rejected(content_scheduler, monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_API_TOKEN", "")
+
+    response = trigger("203.0.113.7")
+
+    assert response.status_code == 403
+    assert content_scheduler.runs == []
+
+
+@pytest.mark.parametrize("authorization", [None, "Bearer wrong", f"Basic {TOKEN}", f"Bearer {TOKEN}x"])
+def test_token_is_required_when_configured(content_scheduler, monkeypatch, authorization):
+    monkeypatch.setattr(settings, "ADMIN_API_TOKEN", TOKEN)
+    headers = {"Authorization": authorization} if authorization else {}
+
+    # 토큰을 설정하면 로컬 요청도 토큰이 필요
+    response = trigger("127.0.0.1", headers)
+
+    assert response.status_code == 401
+    assert content_scheduler.runs == []
+
+
+def test_valid_token_from_remote_client_starts_run(content_scheduler, monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_API_TOKEN", TOKEN)
+
+    response = trigger("203.0.113.7", {"Authorization": f"Bearer {TOKEN}"})
+
+    assert response.status_code == 202
+    assert content_scheduler.runs == [False]
+
+
+def test_follower_worker_rejects_run_with_leader_pid(content_scheduler, leader_lock, workdir, monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_API_TOKEN", "")
+    # 다른 워커가 리더인 상태: 같은 잠금 파일을 이미 다른 열린 파일이 잡고 있음
+    leader_lock.release()
+    other_worker = LeaderLock(str(workdir / "scheduler.lock"))
+    assert other_worker.try_acquire()
+    monkeypatch.setattr(scheduler_module, "leader_lock", LeaderLock(str(workdir / "scheduler.lock")))
+
+    try:
+        response = trigger("127.0.0.1")
+    finally:
+        other_worker.release()
+
+    assert response.status_code == 409
+    assert response.json()["detail"]["leader"]["pid"] == os.getpid()
+    assert content_scheduler.runs == []
@@ -0,0 +1,60 @@
+import shutil
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from app.services.image_generator import discount_image
+from app.services.image_generator.discount_image import DiscountImageGenerator
+from tests.conftest import make_skin
+
+ROOT = Path(__file__).resolve().parent.parent
+IMAGE_GENERATOR = Path("app/services/image_generator")
+SKIN_COLORS = [(255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 0), (0, 255, 255)]
+
+
+def png(color) -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", (640, 640), color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class FakeSession:
+    """requests.Session stand-in serving a solid skin image per URL"""
+
+    def __init__(self, bodies):
+        self.bodies = bodies
+
+    def get(self, url, headers=None, timeout=None):
+        response = type("Response", (), {})()
+        response.status_code, response.content, response.headers = 200, self.bodies[url], {}
+        response.raise_for_status = lambda: None
+        return response
+
+
+@pytest.fixture
+def card_workdir(workdir):
+    """Workdir with the card template assets at their relative paths (spawned workers resolve them from the cwd)"""
+    (workdir / IMAGE_GENERATOR / "templates").mkdir(parents=True)
+    (workdir / "data").mkdir()
+    shutil.copy(ROOT / discount_image.RP_ICON_PATH, workdir / discount_image.RP_ICON_PATH)
+    # 카드 폰트는 저장소에 없으므로 같은 경로에 저장소의 한글 폰트를 둠
+    (workdir / IMAGE_GENERATOR / "fonts").mkdir()
+    shutil.copy(ROOT / IMAGE_GENERATOR / "fonts" / "NanumGothic.ttf", workdir / discount_image.FONT_PATH)
+    return workdir
+
+
+def test_spawned_render_pool_keeps_card_order(card_workdir):
+    skins = [make_skin(f"skin {i}") for i in range(len(SKIN_COLORS))]
+    generator = DiscountImageGenerator()
+    generator.asset_cache.session = FakeSession({skin["url"]: png(color) for skin, color in zip(skins, SKIN_COLORS)})
+
+    paths = generator.generate_all_images({"discounts": skins}, workers=2)
+
+    assert [path.name for path in paths] == [f"{i:02d}.png" for i in range(1, len(skins) + 1)]
+    for path, color in zip(paths, SKIN_COLORS):
+        with Image.open(path) as card:
+            # 스킨 이미지는 카드 한가운데에 놓임
+            assert card.convert("RGB").getpixel((card.width // 2, card.height // 2)) == color
+    assert generator.render_cache.stats == {"hits": 0, "misses": len(skins)}
@@ -0,0 +1,96 @@
+import subprocess
+
+import pytest
+from PIL import Image
+
+from app.services.video.ffmpeg_encoder import FFmpegEncoder, find_ffmpeg
+from tests.conftest import close_to, duration, frame_color, frame_count, has_audio
+
+try:
+    FFMPEG = find_ffmpeg()
+except ValueError:
+    pytest.skip("ffmpeg is not available", allow_module_level=True)
+
+FPS = 24
+RED = (255, 0, 0)
+LIME = (0, 255, 0)
+BLUE = (0, 0, 255)
+
+
+@pytest.fixture
+def stills(tmp_path):
+    """Three small solid-color cards"""
+    paths = []
+    for i, color in enumerate((RED, LIME, BLUE)):
+        path = tmp_path / f"{i + 1:02d}.png"
+        Image.new("RGB", (320, 180), color).save(path)
+        paths.append(path)
+    return paths
+
+
+def test_encode_crossfades_two_stills(stills, tmp_path):
+    encoder = FFmpegEncoder(fps=FPS, preset="ultrafast")
+    output = encoder.encode(
+        stills[:2], str(tmp_path / "out.mp4"), image_duration=1, fade_duration=0.1, transition_duration=0.5
+    )
+
+    assert duration(output) == 2
+    # 정지 구간은 프레임을 다시 인코딩하지 않음 (페이드/전환 구간 + 카드마다 첫/마지막 프레임)
+    assert frame_count(output) < FPS
+    assert close_to(frame_color(output, 0.5, tmp_path), RED)
+    # 전환 중간에는 두 카드가 섞여 있어야 함
+    red, green, _ = frame_color(output, 1.25, tmp_path)
+    assert 60 < red < 200 and 60 < green < 200
+    assert close_to(frame_color(output, 1.75, tmp_path), LIME)
+
+
+def test_encode_without_transitions(stills, tmp_path):
+    encoder = FFmpegEncoder(fps=FPS, preset="ultrafast")
+    output = encoder.encode(stills, str(tmp_path / "out.mp4"), image_duration=1, fade_duration=0.1)
+
+    assert duration(output) == 3
+    assert frame_count(output) < FPS
+    assert close_to(frame_color(output, 1.5, tmp_path), LIME)
+    assert close_to(frame_color(output, 2.5, tmp_path), BLUE)
+
+
+def test_segments_concat_matches_crossfade_timeline(stills, tmp_path):
+    encoder = FFmpegEncoder(fps=FPS, preset="ultrafast")
+    segments = []
+    for i, still in enumerate(stills):
+        segments.append(encoder.encode_segment(
+            still,
+            str(tmp_path / f"{i + 1:03d}.mp4"),
+            image_duration=1,
+            previous_image=stills[i - 1] if i > 0 else None,
+            transition_duration=0.5,
+            fade_in=0.1 if i == 0 else 0,
+            fade_out=0.1 if i == len(stills) - 1 else 0
+        ))
+    output = encoder.concat_segments(segments, str(tmp_path / "weekly.mp4"))
+
+    assert [duration(segment) for segment in segments] == [1, 1, 1]
+    assert duration(output) == 3
+    # 각 구간은 이전 카드에서 크로스페이드로 시작해 현재 카드로 끝남
+    red, green, _ = frame_color(output, 1.25, tmp_path)
+    assert 60 < red < 200 and 60 < green < 200
+    assert close_to(frame_color(output, 1.75, tmp_path), LIME)
+    assert close_to(frame_color(output, 2.75, tmp_path), BLUE)
+
+
+def test_encode_with_unprocessed_audio(stills, tmp_path):
+    audio = tmp_path / "tone.wav"
+    subprocess.run(
+        [FFMPEG, "-y", "-loglevel", "error", "-f", "lavfi", "-i", "sine=frequency=440:duration=1", str(audio)],
+        check=True
+    )
+    encoder = FFmpegEncoder(fps=FPS, preset="ultrafast")
+    output = encoder.encode(
+        stills, str(tmp_path / "out.mp4"), image_duration=1, audio_file=str(audio), fade_duration=0.1,
+        transition_duration=0.5
+    )
+
+    # 짧은 배경음악은 반복되어 영상 길이에 맞춰짐
+    assert has_audio(output)
+    assert abs(duration(output) - 3) < 0.05
+    assert close_to(frame_color(output, 2.75, tmp_path), BLUE)
@@ -0,0 +1,102 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.core.dependencies import get_lol_store_service
+from app.main import app
+from app.services.lol_store.history import HistoryStore, iso_week
+from tests.conftest import make_skin
+
+# 2025-W10, W11, W12 의 화요일 새벽 (KST)
+WEEKS = {
+    "2025-W10": "2025-03-04T04:10:00+09:00",
+    "2025-W11": "2025-03-11T04:10:00+09:00",
+    "2025-W12": "2025-03-18T04:10:00+09:00",
+}
+
+
+@pytest.fixture
+def history(tmp_path):
+    return HistoryStore(str(tmp_path / "history.sqlite3"))
+
+
+def names(items):
+    return [item["name"] for item in items]
+
+
+def test_record_and_latest_snapshot_before_week(history):
+    for week, scraped_at in WEEKS.items():
+        history.record([make_skin(f"{week} A"), make_skin(f"{week} B", price="1,350 RP")], scraped_at)
+
+    snapshot = history.latest_snapshot(before_week="2025-W12")
+
+    assert snapshot["week"] == iso_week(WEEKS["2025-W11"]) == "2025-W11"
+    assert snapshot["item_count"] == 2
+    assert snapshot["items"] == [make_skin("2025-W11 A"), make_skin("2025-W11 B", price="1,350 RP")]
+    assert history.latest_snapshot()["week"] == "2025-W12"
+    assert history.latest_snapshot(before_week="2025-W10") is None
+    # 가격/할인율은 숫자로도 저장됨
+    item = history.week_items("2025-W11")[0][1]
+    assert (item["price_rp"], item["discount_pct"]) == (1350, 30)
+
+
+def test_latest_snapshot_of_the_week_wins(history):
+    history.record([make_skin("A")], "2025-03-11T04:10:00+09:00")
+    history.record([make_skin("B")], "2025-03-12T04:10:00+09:00")
+
+    assert names(history.latest_snapshot(week="2025-W11")["items"]) == ["B"]
+    assert names(history.week_items("2025-W11")[0]) == ["B"]
+
+
+def test_price_history_pages_have_no_duplicates_or_gaps(history):
+    for scraped_at in WEEKS.values():
+        history.record([make_skin("A"), make_skin("Other")], scraped_at)
+        history.record([make_skin("A", discount="-50%")], scraped_at)
+
+    first, cursor = history.price_history("A", limit=4)
+    second, last_cursor = history.price_history("A", cursor=cursor, limit=4)
+
+    assert len(first) == 4 and len(second) == 2 and last_cursor is None
+    ids = [item["id"] for item in first + second]
+    assert ids == sorted(set(ids))
+    assert ids == [item["id"] for item in history.price_history("A", limit=100)[0]]
+
+
+@pytest.fixture
+def client(make_store_service):
+    service = make_store_service()
+    service.history.record([make_skin(f"skin {i:02d}") for i in range(5)], WEEKS["2025-W11"])
+    app.dependency_overrides[get_lol_store_service] = lambda: service
+    yield httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+    app.dependency_overrides.clear()
+
+
+def test_week_pages_through_the_api(client):
+    async def scenario():
+        async with client:
+            first = (await client.get("/api/v1/lol-store/history/weeks/2025-W11", params={"limit": 2})).json()
+            second = (await client.get(
+                "/api/v1/lol-store/history/weeks/2025-W11", params={"limit": 2, "cursor": first["next_cursor"]}
+            )).json()
+            third = (await client.get(
+                "/api/v1/lol-store/history/weeks/2025-W11", params={"limit": 2, "cursor": second["next_cursor"]}
+            )).json()
+            return first, second, third
+
+    first, second, third = asyncio.run(scenario())
+
+    assert names(first["items"]) == ["skin 00", "skin 01"]
+    # 두 번째 페이지는 첫 페이지 바로 다음 항목부터 시작
+    assert names(second["items"]) == ["skin 02", "skin 03"]
+    assert names(third["items"]) == ["skin 04"] and third["next_cursor"] is None
+
+
+def test_unknown_week_is_404(client):
+    async def scenario():
+        async with client:
+            return await client.get("/api/v1/lol-store/history/weeks/2024-W01")
+
+    response = asyncio.run(scenario())
+
+    assert response.status_code == 404
@@ -0,0 +1,47 @@
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+# 주간 실행에서만 쓰는 패키지: 서버 기동 시 로드되면 안 됨
+HEAVY_PACKAGES = ("PIL", "numpy", "moviepy", "imageio", "googleapiclient", "oauth2client", "requests")
+# app 패키지 자체의 import 시간 (FastAPI 등 외부 패키지 제외, 측정값 약 0.13초)
+APP_IMPORT_BUDGET_SECONDS = 0.5
+# app.main 전체 import 시간 (측정값 약 1.3초, 대부분 fastapi/pydantic)
+TOTAL_IMPORT_BUDGET_SECONDS = 4.0
+
+SCRIPT = f"""
+import json, sys
+import app.main
+from app.core.dependencies import get_content_scheduler
+get_content_scheduler()
+print(json.dumps([name for name in {HEAVY_PACKAGES!r} if name in sys.modules]))
+"""
+
+
+def import_app_main():
+    """Loaded heavy packages and per-module import times (self, cumulative; seconds) of a fresh interpreter"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", SCRIPT], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    times = {}
+    for self_us, cumulative_us, name in re.findall(r"^import time:\s+(\d+) \|\s+(\d+) \| (.+)$", result.stderr, re.M):
+        times[name.strip()] = (int(self_us) / 1e6, int(cumulative_us) / 1e6)
+    return json.loads(result.stdout.strip().splitlines()[-1]), times
+
+
+def test_app_main_does_not_import_content_packages():
+    loaded, times = import_app_main()
+
+    assert loaded == []
+    assert not [name for name in times if name.split(".")[0] in HEAVY_PACKAGES]
+
+
+def test_app_main_import_time_budget():
+    _, times = import_app_main()
+
+    app_seconds = sum(self_seconds for name, (self_seconds, _) in times.items() if name.split(".")[0] == "app")
+    assert app_seconds < APP_IMPORT_BUDGET_SECONDS, f"app modules took {app_seconds:.2f}s to import"
+    assert times["app.main"][1] < TOTAL_IMPORT_BUDGET_SECONDS, f"app.main took {times['app.main'][1]:.2f}s to import"
@@ -0,0 +1,80 @@
+import asyncio
+
+import httpx
+
+from app.core.dependencies import get_lol_store_service
+from app.main import app
+from app.services.lol_store.persistence import JsonFile
+from tests.conftest import make_skin
+
+
+def save(service, skins, last_update):
+    service.discounts = skins
+    service.last_update = last_update
+    service._save_data()
+
+
+def test_json_file_reloads_only_after_a_save(tmp_path):
+    writer, reader = JsonFile(tmp_path / "data.json"), JsonFile(tmp_path / "data.json")
+    assert reader.load_if_changed() is None
+
+    writer.save({"value": 1})
+    assert writer.load_if_changed() is None
+    assert reader.load_if_changed() == {"value": 1}
+    assert reader.load_if_changed() is None
+
+    writer.save({"value": 2})
+    assert reader.load_if_changed() == {"value": 2}
+    # 임시 파일이 남지 않아야 함
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["data.json"]
+
+
+def test_other_instance_sees_new_save(make_store_service):
+    writer, reader = make_store_service(), make_store_service()
+    save(writer, [make_skin("A")], "2025-05-13T04:10:00+09:00")
+
+    generation = reader.current_generation()
+    assert asyncio.run(reader.get_discounts())["discounts"] == [make_skin("A")]
+    assert reader.current_generation() == generation
+
+    save(writer, [make_skin("B")], "2025-05-20T04:10:00+09:00")
+    assert reader.current_generation() != generation
+    assert reader.get_last_update() == {"last_update": "2025-05-20T04:10:00+09:00"}
+
+
+async def _fetch(client, path, etag=None):
+    headers = {"If-None-Match": etag} if etag else {}
+    return await client.get(path, headers=headers)
+
+
+def test_warm_cache_serves_data_saved_by_another_worker(make_store_service):
+    writer, reader = make_store_service(), make_store_service()
+    save(writer, [make_skin("A")], "2025-05-13T04:10:00+09:00")
+    app.dependency_overrides[get_lol_store_service] = lambda: reader
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            results = {}
+            for path in ("/api/v1/lol-store/discounts", "/discounts"):
+                first = await _fetch(client, path)
+                cached = await _fetch(client, path, first.headers["etag"])
+                results[path] = (first, cached)
+
+            save(writer, [make_skin("B")], "2025-05-20T04:10:00+09:00")
+            for path, (first, cached) in results.items():
+                updated = await _fetch(client, path, first.headers["etag"])
+                results[path] = (first, cached, updated)
+            return results
+
+    try:
+        results = asyncio.run(scenario())
+    finally:
+        app.dependency_overrides.clear()
+
+    for first, cached, updated in results.values():
+        assert first.json()["discounts"] == [make_skin("A")]
+        assert cached.status_code == 304
+        assert updated.status_code == 200
+        assert updated.headers["etag"] != first.headers["etag"]
+        assert updated.json()["discounts"] == [make_skin("B")]
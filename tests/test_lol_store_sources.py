@@ -0,0 +1,187 @@
+import asyncio
+import json
+import re
+from pathlib import Path
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+
+from app.core.config.settings import settings
+from app.services.lol_store.sources import CATALOG_FIELDS, HttpDiscountSource, PlaywrightDiscountSource, _get_path
+from tests.conftest import make_skin
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures" / "lol_store"
+CATALOG_URL = "https://store.test/catalog?page=1&size=4"
+
+EXPECTED = [
+    ("별 수호자 아리", "975 RP", "-30%"),
+    ("프로젝트: 야스오", "1350 RP", "-40%"),
+    ("태양절 세트", "520 RP", "-50%"),
+    ("용 사냥꾼 바루스", "975 RP", "-20%"),
+    ("암흑의 별 카서스", "1820 RP", "-25%"),
+    ("신성한 검 세트", "750 RP", "-35%"),
+]
+
+
+def load_page(page: int) -> dict:
+    with open(FIXTURES / f"catalog_page_{page}.json", "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def catalog_transport(requested: list, status: int = 200, empty: bool = False, delays=None):
+    """MockTransport serving the recorded catalog pages; later pages answer first unless delays say otherwise"""
+    async def handler(request: httpx.Request) -> httpx.Response:
+        page = int(parse_qs(request.url.query.decode())["page"][0])
+        requested.append(page)
+        await asyncio.sleep((delays or {}).get(page, 0.05 / page))
+        if status != 200:
+            return httpx.Response(status, json={"error": "unavailable"})
+        payload = load_page(page)
+        if empty:
+            payload["data"] = []
+        return httpx.Response(200, json=payload)
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.fixture(autouse=True)
+def http_source_enabled(monkeypatch):
+    monkeypatch.setattr(settings, "LOL_STORE_HTTP_SOURCE", True)
+    monkeypatch.setattr(settings, "LOL_STORE_CATALOG_PAGE_PARAM", "page")
+    monkeypatch.setattr(settings, "LOL_STORE_CATALOG_FIRST_PAGE", 1)
+
+
+def as_tuples(skins):
+    return [(skin["name"], skin["price"], skin["discount"]) for skin in skins]
+
+
+def test_http_source_collects_pages_in_order():
+    requested, batches = [], []
+    source = HttpDiscountSource(catalog_url=CATALOG_URL, transport=catalog_transport(requested))
+
+    async def on_items(items):
+        batches.append(as_tuples(items))
+
+    results = asyncio.run(source.fetch(on_items=on_items))
+
+    assert as_tuples(results) == EXPECTED
+    assert sorted(requested) == [1, 2, 3]
+    # 응답이 늦게 온 2페이지도 3페이지보다 먼저 전달되고, 중복(야스오)과 할인 없는 항목은 제외
+    assert batches == [EXPECTED[:3], EXPECTED[3:5], EXPECTED[5:]]
+    assert results[0]["url"].endswith("/1001.jpg")
+    assert results[4]["url"] == ""
+    assert source.last_stats["pages"] == 3
+    assert source.last_stats["items"] == 6
+
+
+def test_http_source_uses_captured_catalog_url(tmp_path):
+    capture_file = tmp_path / "catalog_capture.json"
+    PlaywrightDiscountSource(capture_file=capture_file)._save_capture([CATALOG_URL, CATALOG_URL.replace("page=1", "page=2")])
+    source = HttpDiscountSource(catalog_url="", capture_file=capture_file, transport=catalog_transport([]))
+
+    assert source.enabled
+    assert as_tuples(asyncio.run(source.fetch())) == EXPECTED
+
+
+def test_page_url_replaces_only_the_page_parameter():
+    url = "https://store.test/catalog?tag=skin&page=1&tag=sale&q=&size=4"
+
+    assert HttpDiscountSource._page_url(url, 3) == "https://store.test/catalog?tag=skin&page=3&tag=sale&q=&size=4"
+    assert HttpDiscountSource._page_url("https://store.test/catalog?tag=a&tag=b", 2) == (
+        "https://store.test/catalog?tag=a&tag=b&page=2"
+    )
+
+
+def test_catalog_fields_match_the_recorded_response():
+    # 실제 스토어 응답 녹화본: Playwright 소스가 남긴 data/lol_store/catalog_capture.json 을 복사해서 사용
+    recording = FIXTURES / "catalog_recording.json"
+    if not recording.exists():
+        pytest.skip("no recorded catalog response yet (copy data/lol_store/catalog_capture.json here)")
+    with open(recording, "r", encoding="utf-8") as f:
+        sample = json.load(f)["sample"]
+
+    items = _get_path(sample, CATALOG_FIELDS["items"])
+    skins = [HttpDiscountSource.parse_item(item) for item in items]
+
+    assert items and all(skins)
+    assert int(_get_path(sample, CATALOG_FIELDS["total_pages"])) >= 1
+    assert all(re.fullmatch(r"\d+ RP", skin["price"]) and re.fullmatch(r"-\d+%", skin["discount"]) for skin in skins)
+
+
+def test_http_source_is_disabled_without_a_catalog_url(tmp_path):
+    source = HttpDiscountSource(catalog_url="", capture_file=tmp_path / "missing.json")
+
+    assert not source.enabled
+
+
+@pytest.fixture
+def playwright_results(monkeypatch):
+    """PlaywrightDiscountSource.fetch replaced by a recorded result (streamed in one batch)"""
+    calls = []
+    skins = [make_skin("별 수호자 아리"), make_skin("프로젝트: 야스오", "-40%"), make_skin("Playwright only")]
+
+    async def fetch(self, on_items=None):
+        calls.append(self.name)
+        if on_items is not None:
+            await on_items(skins)
+        self.last_stats = {"items": len(skins)}
+        return skins
+
+    monkeypatch.setattr(PlaywrightDiscountSource, "fetch", fetch)
+    return calls, skins
+
+
+@pytest.mark.parametrize("failure", [{"status": 503}, {"empty": True}])
+def test_falls_back_to_playwright_on_failed_or_empty_http_result(make_store_service, playwright_results, failure):
+    calls, skins = playwright_results
+    http = HttpDiscountSource(catalog_url=CATALOG_URL, transport=catalog_transport([], **failure))
+    service = make_store_service([http, PlaywrightDiscountSource()])
+
+    results = asyncio.run(service.update_discounts())
+
+    assert results == skins
+    assert calls == ["playwright"]
+    assert service.last_scrape_stats["source"] == "playwright"
+
+
+def test_http_result_skips_playwright(make_store_service, playwright_results):
+    calls, _ = playwright_results
+    http = HttpDiscountSource(catalog_url=CATALOG_URL, transport=catalog_transport([]))
+    service = make_store_service([http, PlaywrightDiscountSource()])
+
+    results = asyncio.run(service.update_discounts())
+
+    assert as_tuples(results) == EXPECTED
+    assert calls == []
+    assert service.last_scrape_stats["source"] == "http"
+
+
+def test_fallback_does_not_restream_items_from_a_partial_http_run(make_store_service, playwright_results):
+    _, skins = playwright_results
+    # 1페이지는 전달된 뒤 2페이지에서 실패
+    requested = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        page = int(parse_qs(request.url.query.decode())["page"][0])
+        requested.append(page)
+        if page == 1:
+            payload = load_page(1)
+            payload["data"] = [
+                {"name": skin["name"], "assetUrl": skin["url"], "sale": {"price": 975, "discountRate": 30}}
+                for skin in skins[:1]
+            ]
+            return httpx.Response(200, json=payload)
+        return httpx.Response(500)
+
+    http = HttpDiscountSource(catalog_url=CATALOG_URL, transport=httpx.MockTransport(handler))
+    service = make_store_service([http, PlaywrightDiscountSource()])
+    streamed = []
+
+    async def on_items(items):
+        streamed.extend(items)
+
+    results = asyncio.run(service.update_discounts(on_items=on_items))
+
+    assert results == skins
+    assert [skin["name"] for skin in streamed] == [skin["name"] for skin in skins]
@@ -0,0 +1,86 @@
+import os
+import time
+
+import pytest
+
+from app.services.image_generator.render_cache import RenderCache
+from tests.conftest import make_skin
+
+DATE_RANGE = ("2025.05.13", "2025.05.20")
+
+
+@pytest.fixture
+def font(tmp_path):
+    path = tmp_path / "font.ttf"
+    path.write_bytes(b"font v1")
+    return str(path)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return RenderCache(cache_dir=tmp_path / "renders", max_bytes=1024, max_age_seconds=3600)
+
+
+def card(tmp_path, name="card.png", data=b"card"):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return path
+
+
+def test_key_depends_only_on_rendered_inputs(cache, font):
+    key = cache.key(make_skin("A"), DATE_RANGE, 1, font)
+
+    assert key == cache.key(dict(make_skin("A"), scraped_rank=3), list(DATE_RANGE), 1, font)
+    assert len(key) == 64
+    assert key != cache.key(make_skin("A"), ("2025.05.20", "2025.05.27"), 1, font)
+    assert key != cache.key(dict(make_skin("A"), url="https://example.test/other.jpg"), DATE_RANGE, 1, font)
+
+
+@pytest.mark.parametrize("change", [
+    {"skin": make_skin("A", price="1350 RP")},
+    {"skin": make_skin("A", discount="-50%")},
+    {"template_version": 2},
+    {"font": b"font v2"},
+])
+def test_changed_input_misses(cache, font, tmp_path, change):
+    cache.put(cache.key(make_skin("A"), DATE_RANGE, 1, font), card(tmp_path))
+    if "font" in change:
+        # 같은 경로의 폰트를 바꾸는 대신 다른 파일을 써서 프로세스 내 해시 캐시를 피함
+        font = str(tmp_path / "font-v2.ttf")
+        (tmp_path / "font-v2.ttf").write_bytes(change["font"])
+    key = cache.key(change.get("skin", make_skin("A")), DATE_RANGE, change.get("template_version", 1), font)
+
+    assert not cache.get(key, tmp_path / "01.png")
+    assert not (tmp_path / "01.png").exists()
+    assert cache.stats == {"hits": 0, "misses": 1}
+
+
+def test_hit_copies_the_cached_card(cache, font, tmp_path):
+    key = cache.key(make_skin("A"), DATE_RANGE, 1, font)
+    cache.put(key, card(tmp_path, data=b"rendered A"))
+
+    assert cache.get(key, tmp_path / "01.png")
+    assert (tmp_path / "01.png").read_bytes() == b"rendered A"
+    assert cache.stats == {"hits": 1, "misses": 0}
+    assert not list(cache.cache_dir.glob("*.tmp"))
+
+
+def age(path, seconds):
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def test_evict_drops_expired_then_least_recently_used(cache, font, tmp_path):
+    keys = [cache.key(make_skin(name), DATE_RANGE, 1, font) for name in "ABCD"]
+    for key in keys:
+        cache.put(key, card(tmp_path, data=b"x" * 400))
+    age(cache._path(keys[0]), 7200)
+    age(cache._path(keys[1]), 30)
+    age(cache._path(keys[2]), 60)
+    # 오래 전에 만든 C 를 방금 사용하면 가장 최근 항목이 됨
+    assert cache.get(keys[2], tmp_path / "03.png")
+
+    cache.evict()
+
+    # A 는 만료, 남은 1200 바이트 중 가장 오래 쓰지 않은 B 를 지워 1024 바이트 안으로
+    assert sorted(path.stem for path in cache.cache_dir.glob("*.png")) == sorted(keys[2:])
@@ -0,0 +1,143 @@
+import asyncio
+import json
+import os
+
+import pytest
+import requests
+
+from app.services.youtube import uploader as uploader_module
+from app.services.youtube.resumable import CHUNK_GRANULARITY, ResumableUpload
+from app.services.youtube.uploader import YouTubeUploader
+
+UPLOAD_URL = "https://upload.test/youtube/v3/videos"
+SESSION_URI = "https://upload.test/session/1"
+
+
+def make_response(status: int, headers=None, body=None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    response._content = json.dumps(body).encode("utf-8") if body is not None else b""
+    response.url = UPLOAD_URL
+    return response
+
+
+class FakeYouTube:
+    """In-memory resumable-upload endpoint; `failures` is consumed one entry per request"""
+
+    def __init__(self, failures=()):
+        self.received = bytearray()
+        self.failures = list(failures)
+        self.requests = []
+
+    def _failure(self):
+        failure = self.failures.pop(0) if self.failures else None
+        if failure == "drop":
+            raise requests.ConnectionError("connection reset")
+        if failure is not None:
+            return make_response(failure, body={"error": {"code": failure}})
+        return None
+
+    def _committed(self) -> requests.Response:
+        headers = {"Range": f"bytes=0-{len(self.received) - 1}"} if self.received else {}
+        return make_response(308, headers)
+
+    def post(self, url, params=None, json=None, headers=None):
+        self.requests.append(("POST", None))
+        failure = self._failure()
+        if failure is not None:
+            return failure
+        self.total = int(headers["X-Upload-Content-Length"])
+        return make_response(200, {"Location": SESSION_URI})
+
+    def put(self, url, data=None, headers=None):
+        content_range = headers["Content-Range"]
+        self.requests.append(("PUT", content_range))
+        failure = self._failure()
+        if failure is not None:
+            return failure
+        if content_range.startswith("bytes */"):
+            return self._committed()
+        start = int(content_range.split()[1].split("-")[0])
+        assert start == len(self.received), "chunk does not continue at the committed offset"
+        self.received += data
+        if len(self.received) == self.total:
+            return make_response(200, body={"id": "video-1"})
+        return self._committed()
+
+
+@pytest.fixture
+def video(tmp_path):
+    path = tmp_path / "video.mp4"
+    path.write_bytes(os.urandom(CHUNK_GRANULARITY * 4 + 1000))
+    return path
+
+
+@pytest.fixture
+def uploader(monkeypatch):
+    monkeypatch.setattr(uploader_module.time, "sleep", lambda seconds: None)
+    # 인증 없이 업로드 재시도 로직만 사용
+    return YouTubeUploader.__new__(YouTubeUploader)
+
+
+def make_upload(server, video, tmp_path) -> ResumableUpload:
+    return ResumableUpload(
+        session=server,
+        file_path=str(video),
+        body={"snippet": {"title": "test"}, "status": {"privacyStatus": "private"}},
+        upload_url=UPLOAD_URL,
+        state_file=str(tmp_path / "upload_session.json"),
+        chunk_size=CHUNK_GRANULARITY
+    )
+
+
+def test_upload_retries_dropped_chunk_and_5xx(uploader, video, tmp_path):
+    server = FakeYouTube(failures=[None, None, "drop", None, 503])
+
+    assert uploader._resumable_upload(make_upload(server, video, tmp_path)) == "video-1"
+    assert bytes(server.received) == video.read_bytes()
+    # 연결 오류와 5xx 뒤에는 서버의 수신 위치부터 확인
+    ranges = [content_range for method, content_range in server.requests if method == "PUT"]
+    assert ranges.count(f"bytes */{video.stat().st_size}") == 2
+    assert not (tmp_path / "upload_session.json").exists()
+
+
+def test_restarted_process_resumes_saved_session(uploader, video, tmp_path):
+    server = FakeYouTube()
+    first = make_upload(server, video, tmp_path)
+    for _ in range(3):
+        assert first.next_chunk() is None
+    committed = len(server.received)
+
+    # 새 프로세스: 같은 파일의 세션 상태 파일에서 이어서 업로드
+    second = make_upload(server, video, tmp_path)
+    assert uploader._resumable_upload(second) == "video-1"
+    assert bytes(server.received) == video.read_bytes()
+    assert committed > 0
+    assert sum(1 for method, _ in server.requests if method == "POST") == 1
+
+
+@pytest.mark.parametrize("status", [400, 401, 403])
+def test_client_errors_on_initiate_are_not_retried(uploader, video, tmp_path, status):
+    server = FakeYouTube(failures=[status])
+
+    with pytest.raises(requests.HTTPError):
+        uploader._resumable_upload(make_upload(server, video, tmp_path))
+    assert len(server.requests) == 1
+
+
+def test_client_error_on_chunk_is_not_retried(uploader, video, tmp_path):
+    server = FakeYouTube(failures=[None, None, 403])
+
+    with pytest.raises(requests.HTTPError):
+        uploader._resumable_upload(make_upload(server, video, tmp_path))
+    assert len(server.requests) == 3
+
+
+def test_async_upload_does_not_retry_client_errors(uploader, video, tmp_path, monkeypatch):
+    server = FakeYouTube(failures=[401])
+    monkeypatch.setattr(uploader, "_create_upload", lambda *args: make_upload(server, video, tmp_path))
+
+    with pytest.raises(requests.HTTPError):
+        asyncio.run(uploader.upload_video_async(str(video), "test"))
+    assert len(server.requests) == 1
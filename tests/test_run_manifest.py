@@ -0,0 +1,110 @@
+import asyncio
+from collections import Counter
+
+import pytest
+
+from app.core import dependencies
+from app.core.config.settings import settings
+from app.services.content.manifest import RunManifest
+from app.services.content.scheduler import ContentScheduler
+from tests.conftest import FakeSource, make_skin
+
+
+class FakePublisher:
+    playlist_id = "playlist-1"
+
+    def __init__(self):
+        self.uploads = 0
+        self.fail = False
+
+    async def publish_video_async(self, video_path, description=None):
+        self.uploads += 1
+        return None if self.fail else "video-1"
+
+
+class StageError(Exception):
+    pass
+
+
+@pytest.fixture
+def weekly(make_store_service, workdir, monkeypatch):
+    """ContentScheduler with instant content stages that count their runs and can be made to fail"""
+    source = FakeSource([[make_skin("A"), make_skin("B")]])
+    service = make_store_service([source])
+    publisher = FakePublisher()
+    runs = Counter()
+    failing = set()
+    (workdir / "data" / "images").mkdir(parents=True, exist_ok=True)
+
+    def stage(name, path):
+        runs[name] += 1
+        if name in failing:
+            raise StageError(f"{name} failed")
+        (workdir / path).write_bytes(f"{name} output".encode())
+        return path
+
+    async def generate_images(self, scraped):
+        return {"images": [stage("images", "data/images/01.png")]}
+
+    async def generate_video(self):
+        return {"video": stage("video", "data/weekly.mp4")}
+
+    monkeypatch.setattr(settings, "PIPELINE_STREAMING", False)
+    monkeypatch.setattr(settings, "PIPELINE_ADD_TO_PLAYLIST", False)
+    monkeypatch.setattr(ContentScheduler, "_generate_images", generate_images)
+    monkeypatch.setattr(ContentScheduler, "_generate_video", generate_video)
+    monkeypatch.setattr(dependencies, "get_lol_store_service", lambda: service)
+    monkeypatch.setattr(dependencies, "get_youtube_publisher", lambda: publisher)
+
+    def run(force=False):
+        summary = asyncio.run(ContentScheduler().run_weekly_update(force=force))
+        runs["scrape"] = source.calls
+        runs["upload"] = publisher.uploads
+        return {stage: entry["status"] for stage, entry in summary["stages"].items()}
+
+    run.runs = runs
+    run.failing = failing
+    run.publisher = publisher
+    return run
+
+
+def test_upload_failure_rerun_skips_content_stages(weekly):
+    weekly.publisher.fail = True
+    assert weekly() == {"scrape": "done", "images": "done", "video": "done", "upload": "failed"}
+
+    weekly.publisher.fail = False
+    assert weekly() == {"scrape": "done", "images": "done", "video": "done", "upload": "done", "playlist": "skipped"}
+    assert weekly.runs == {"scrape": 1, "images": 1, "video": 1, "upload": 2}
+
+
+def test_deleted_output_reruns_its_stage(weekly, workdir):
+    weekly()
+    (workdir / "data" / "weekly.mp4").unlink()
+
+    weekly()
+
+    assert (workdir / "data" / "weekly.mp4").exists()
+    # 같은 내용으로 다시 만들어진 영상은 업로드하지 않음
+    assert weekly.runs == {"scrape": 1, "images": 1, "video": 2, "upload": 1}
+
+
+def test_resume_starts_at_first_incomplete_stage(weekly):
+    weekly.failing.add("images")
+    assert weekly() == {"scrape": "done", "images": "failed"}
+    assert weekly.runs == {"scrape": 1, "images": 1, "upload": 0}
+
+    weekly.failing.clear()
+    assert weekly() == {"scrape": "done", "images": "done", "video": "done", "upload": "done", "playlist": "skipped"}
+    assert weekly.runs == {"scrape": 1, "images": 2, "video": 1, "upload": 1}
+
+
+def test_force_resets_the_weeks_manifest(weekly):
+    weekly()
+    manifest = RunManifest.current()
+    assert manifest.reusable("video", manifest.data["stages"]["video"]["inputs_hash"]) is not None
+
+    weekly(force=True)
+
+    assert weekly.runs == {"scrape": 2, "images": 2, "video": 2, "upload": 2}
+    # 강제 실행이 끝난 뒤에도 매니페스트는 이번 실행 결과만 담고 있음
+    assert set(RunManifest.current().data["stages"]) == {"scrape", "images", "video", "upload", "playlist"}
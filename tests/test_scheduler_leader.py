@@ -0,0 +1,121 @@
+import asyncio
+import multiprocessing
+import os
+import time
+
+import httpx
+import pytest
+
+from app.core import scheduler as scheduler_module
+from app.core.config.settings import settings
+from app.core.leader import LeaderLock, fcntl
+from app.main import app
+
+pytestmark = pytest.mark.skipif(fcntl is None, reason="leader lock needs fcntl")
+
+
+def _hold_leadership(lock_path, hold_seconds, queue):
+    lock = LeaderLock(lock_path)
+    while not lock.try_acquire():
+        time.sleep(0.02)
+    queue.put((os.getpid(), time.monotonic()))
+    time.sleep(hold_seconds)
+    # 잠금을 해제하지 않고 종료 (크래시)
+    os._exit(0)
+
+
+def test_only_one_holder_at_a_time(tmp_path):
+    first, second = LeaderLock(str(tmp_path / "scheduler.lock")), LeaderLock(str(tmp_path / "scheduler.lock"))
+
+    assert first.try_acquire()
+    assert not second.try_acquire()
+    assert first.holder()["pid"] == os.getpid()
+
+    first.release()
+    assert second.try_acquire()
+    assert second.is_leader and not first.is_leader
+    second.release()
+
+
+def test_leadership_fails_over_when_the_leader_process_dies(tmp_path):
+    lock_path = str(tmp_path / "scheduler.lock")
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    workers = [context.Process(target=_hold_leadership, args=(lock_path, 0.3, queue)) for _ in range(3)]
+    for worker in workers:
+        worker.start()
+    try:
+        leaders = [queue.get(timeout=30) for _ in workers]
+    finally:
+        for worker in workers:
+            worker.join(timeout=10)
+
+    pids = [pid for pid, _ in leaders]
+    assert sorted(pids) == sorted(worker.pid for worker in workers)
+    # 이전 리더가 잠금을 잡고 있는 동안에는 다음 리더가 나오지 않음
+    times = [acquired for _, acquired in leaders]
+    assert all(later - earlier >= 0.25 for earlier, later in zip(times, times[1:]))
+
+
+class FakeScheduler:
+    running = False
+
+    def start(self):
+        self.running = True
+
+    def shutdown(self, wait=True):
+        self.running = False
+
+    def get_jobs(self):
+        return []
+
+
+def test_browser_starts_only_after_winning_the_election(tmp_path, monkeypatch):
+    lock_path = str(tmp_path / "scheduler.lock")
+    current_leader = LeaderLock(lock_path)
+    assert current_leader.try_acquire()
+    browser_starts = []
+
+    async def start_browser():
+        browser_starts.append(os.getpid())
+
+    monkeypatch.setattr(scheduler_module, "leader_lock", LeaderLock(lock_path))
+    monkeypatch.setattr(scheduler_module, "scheduler", FakeScheduler())
+    monkeypatch.setattr(scheduler_module.browser_manager, "start", start_browser)
+    monkeypatch.setattr(settings, "SCHEDULER_LEADER_RETRY_SECONDS", 0.02)
+
+    async def scenario():
+        election = asyncio.create_task(scheduler_module._run_election())
+        await asyncio.sleep(0.1)
+        follower_state = (scheduler_module.scheduler.running, list(browser_starts))
+        current_leader.release()
+        await asyncio.wait_for(election, timeout=5)
+        return follower_state
+
+    follower_running, follower_browser_starts = asyncio.run(scenario())
+    scheduler_module.leader_lock.release()
+
+    assert (follower_running, follower_browser_starts) == (False, [])
+    assert scheduler_module.scheduler.running
+    assert browser_starts == [os.getpid()]
+
+
+def test_status_endpoint_reports_the_leader(tmp_path, monkeypatch):
+    lock_path = str(tmp_path / "scheduler.lock")
+    leader = LeaderLock(lock_path)
+    assert leader.try_acquire()
+    monkeypatch.setattr(scheduler_module, "leader_lock", LeaderLock(lock_path))
+
+    async def request():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get("/api/v1/scheduler/status")
+
+    try:
+        status = asyncio.run(request()).json()
+    finally:
+        leader.release()
+
+    assert status["is_leader"] is False
+    assert status["leader"]["pid"] == os.getpid()
+    assert status["jobs"] == []
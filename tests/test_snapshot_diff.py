@@ -0,0 +1,113 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+import pytz
+
+from app.services.lol_store.diff import SnapshotDiff
+from app.services.lol_store.history import iso_week
+from tests.conftest import FakeSource, make_skin
+
+PREVIOUS = [
+    make_skin("Carried", "-30%"),
+    make_skin("Deeper", "-20%"),
+    make_skin("Repriced", "-40%", price="1350 RP"),
+    make_skin("Ended", "-50%"),
+]
+CURRENT = [
+    make_skin("Deeper", "-40%"),
+    make_skin("New", "-25%"),
+    make_skin("Carried", "-30%"),
+    make_skin("Repriced", "-40%", price="1820 RP"),
+]
+
+
+def names(skins):
+    return [skin["name"] for skin in skins]
+
+
+def test_diff_categories():
+    diff = SnapshotDiff(PREVIOUS, CURRENT)
+
+    assert diff.summary() == {"added": 1, "removed": 1, "changed": 2, "unchanged": 1}
+    assert names(diff.added) == ["New"]
+    assert names(diff.removed) == ["Ended"]
+    assert names(diff.unchanged) == ["Carried"]
+    changed = {change["name"]: change for change in diff.changed}
+    assert changed["Deeper"]["fields"] == ["discount"]
+    assert changed["Deeper"]["before"]["discount"] == "-20%"
+    assert changed["Deeper"]["after"]["discount"] == "-40%"
+    assert changed["Repriced"]["fields"] == ["price"]
+
+
+def test_fresh_excludes_same_discount_carry_overs():
+    diff = SnapshotDiff(PREVIOUS, CURRENT)
+
+    # 할인율이 그대로인 항목(가격만 바뀐 경우 포함)은 지난주부터 이어진 할인
+    assert names(diff.fresh) == ["Deeper", "New"]
+
+
+def test_fresh_with_a_name_listed_twice_in_the_previous_snapshot():
+    previous = [make_skin("Twice", "-20%"), make_skin("Twice", "-50%")]
+
+    assert SnapshotDiff(previous, [make_skin("Twice", "-20%")]).fresh == []
+    assert names(SnapshotDiff(previous, [make_skin("Twice", "-30%")]).fresh) == ["Twice"]
+
+
+def test_fresh_without_previous_snapshot_is_the_whole_scrape():
+    diff = SnapshotDiff([], CURRENT)
+
+    assert diff.fresh == CURRENT
+    assert diff.summary() == {"added": 4, "removed": 0, "changed": 0, "unchanged": 0}
+
+
+def test_names_are_compared_after_whitespace_normalization():
+    before = dict(make_skin("Ahri"), name="Star  Guardian\u00a0Ahri")
+    after = dict(make_skin("Ahri"), name=" Star Guardian Ahri ")
+    diff = SnapshotDiff([before], [after])
+
+    assert diff.summary()["unchanged"] == 1
+    assert diff.fresh == []
+
+
+def test_to_dict():
+    data = SnapshotDiff(PREVIOUS, CURRENT).to_dict()
+
+    assert set(data) == {"summary", "added", "removed", "changed"}
+    assert names(data["added"]) == ["New"]
+
+
+def record_previous_week(service, skins):
+    last_week = (datetime.now(pytz.timezone("Asia/Seoul")) - timedelta(weeks=1)).isoformat()
+    service.history.record(skins, last_week, kind="weekly")
+
+
+@pytest.mark.parametrize("previous", [PREVIOUS, PREVIOUS + [make_skin("Deeper", "-40%")], []])
+def test_streaming_filter_agrees_with_last_diff(make_store_service, previous):
+    source = FakeSource(batches=[CURRENT[:2], CURRENT[2:]])
+    service = make_store_service([source])
+    if previous:
+        record_previous_week(service, previous)
+    streamed = []
+
+    async def on_items(items):
+        streamed.extend(items)
+
+    results = asyncio.run(service.update_discounts(on_items=on_items))
+
+    assert names(streamed) == names(results) == names(service.last_diff.fresh)
+    assert names(results) == names(SnapshotDiff(previous, CURRENT).fresh)
+    assert service.discounts == results
+    # 이력에는 필터링 전 전체 스크래핑 결과가 남음
+    snapshot = service.history.latest_snapshot(week=iso_week())
+    assert names(snapshot["items"]) == names(CURRENT)
+
+
+def test_diff_for_week(make_store_service):
+    service = make_store_service([FakeSource(batches=[CURRENT])])
+    record_previous_week(service, PREVIOUS)
+    asyncio.run(service.update_discounts())
+
+    diff = service.diff_for_week()
+    assert diff.summary() == {"added": 1, "removed": 1, "changed": 2, "unchanged": 1}
+    assert service.diff_for_week("2000-W01") is None
@@ -0,0 +1,73 @@
+import asyncio
+import importlib
+
+import pytest
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+from app.core import dependencies
+from app.core import scheduler as scheduler_module
+from app.core.leader import LeaderLock
+from app.services.image_generator import discount_image
+from app.services.lol_store.store import LoLStoreService
+from app.services.youtube.uploader import YouTubeUploader
+
+
+@pytest.fixture
+def constructed(monkeypatch):
+    """Names of the heavy service objects created while the fixture is active"""
+    created = []
+
+    def counting(name, original):
+        def wrapper(*args, **kwargs):
+            created.append(name)
+            return original(*args, **kwargs)
+        return wrapper
+
+    monkeypatch.setattr(LoLStoreService, "__init__", counting("LoLStoreService", LoLStoreService.__init__))
+    monkeypatch.setattr(YouTubeUploader, "__init__", counting("YouTubeUploader", YouTubeUploader.__init__))
+    monkeypatch.setattr(discount_image, "_load_font", counting("font", discount_image._load_font))
+    for getter in (
+        dependencies.get_lol_store_service,
+        dependencies.get_content_generator,
+        dependencies.get_youtube_publisher,
+        dependencies.get_slp_login_service,
+        dependencies.get_content_scheduler,
+    ):
+        getter.cache_clear()
+    return created
+
+
+@pytest.fixture
+def isolated_scheduler(tmp_path, monkeypatch):
+    """Fresh scheduler and leader lock, with the shared browser replaced by a no-op"""
+    async def noop():
+        pass
+
+    monkeypatch.setattr(scheduler_module, "scheduler", AsyncIOScheduler())
+    monkeypatch.setattr(scheduler_module, "leader_lock", LeaderLock(str(tmp_path / "scheduler.lock")))
+    monkeypatch.setattr(scheduler_module.browser_manager, "start", noop)
+    monkeypatch.setattr(scheduler_module.browser_manager, "stop", noop)
+    return scheduler_module
+
+
+def test_startup_creates_no_services(constructed, isolated_scheduler, tmp_path, monkeypatch):
+    import app.main
+    main = importlib.reload(app.main)
+    monkeypatch.chdir(tmp_path)
+
+    async def start_and_stop():
+        await main.app.router.startup()
+        # 선출 태스크가 잠금을 잡고 스케줄러를 시작할 때까지 대기
+        await asyncio.sleep(0.05)
+        jobs = sorted(job.id for job in isolated_scheduler.scheduler.get_jobs())
+        await main.app.router.shutdown()
+        return jobs
+
+    jobs = asyncio.run(start_and_stop())
+
+    assert jobs == ["slp_login", "weekly_content_update"]
+    assert constructed == []
+    # 서비스는 처음 요청될 때 한 번만 생성됨
+    dependencies.get_lol_store_service()
+    dependencies.get_lol_store_service()
+    assert constructed == ["LoLStoreService"]
@@ -0,0 +1,146 @@
+import asyncio
+
+import pytest
+from PIL import Image
+
+from app.services.content.pipeline import StreamingContentPipeline
+from app.services.lol_store.sources import DiscountSource
+from app.services.video import video_generator
+from app.services.video.ffmpeg_encoder import find_ffmpeg
+from app.services.video.video_generator import VideoGenerator
+from tests.conftest import COLORS, FakeImageGenerator, FakeSource, close_to, duration, frame_color, make_skin
+
+try:
+    find_ffmpeg()
+except ValueError:
+    pytest.skip("ffmpeg is not available", allow_module_level=True)
+
+
+@pytest.fixture
+def make_pipeline(make_store_service, workdir, monkeypatch):
+    monkeypatch.setattr(video_generator, "ENCODE_STATS_FILE", str(workdir / "encode_stats.jsonl"))
+
+    def make(sources, **options):
+        image_generator = FakeImageGenerator(workdir, **options.pop("images", {}))
+        pipeline = StreamingContentPipeline(
+            make_store_service(sources),
+            image_generator=image_generator,
+            video_generator=VideoGenerator(output_dir=str(workdir / "videos"), backend="ffmpeg", profile="fast-draft"),
+            image_duration=1,
+            transition_duration=0.5,
+            fade_duration=0.1,
+            audio_file=str(workdir / "missing.mp3"),
+            **options
+        )
+        return pipeline, image_generator
+
+    return make
+
+
+def card_colors(video, tmp_path, count):
+    """Color shown in the second half of each one-second card"""
+    return [frame_color(video, i + 0.75, tmp_path) for i in range(count)]
+
+
+def assert_cards(paths, names):
+    assert [path.rsplit("/", 1)[-1] for path in paths] == [f"{i:02d}.png" for i in range(1, len(names) + 1)]
+    for path, name in zip(paths, names):
+        with Image.open(path) as card:
+            assert card.getpixel((0, 0)) == COLORS[name]
+
+
+def test_video_follows_card_order(make_pipeline, tmp_path):
+    source = FakeSource([[make_skin("A")], [make_skin("B"), make_skin("C")]])
+    pipeline, images = make_pipeline([source])
+
+    discounts, image_paths, video = asyncio.run(pipeline.run())
+
+    assert [skin["name"] for skin in discounts] == ["A", "B", "C"]
+    assert_cards(image_paths, ["A", "B", "C"])
+    assert duration(video) == 3
+    assert all(close_to(color, COLORS[name]) for color, name in zip(card_colors(video, tmp_path, 3), "ABC"))
+    # 스크래핑 중에 첫 구간이 인코딩됨
+    assert pipeline.stats["first_segment_s"] <= pipeline.stats["render_done_s"]
+
+
+class CountingSource(DiscountSource):
+    """Streams one skin per batch and records how many batches the pipeline accepted"""
+
+    name = "counting"
+
+    def __init__(self, names):
+        super().__init__()
+        self.names = names
+        self.accepted = 0
+
+    async def fetch(self, on_items=None):
+        skins = [make_skin(name) for name in self.names]
+        for skin in skins:
+            await on_items([skin])
+            self.accepted += 1
+        self.last_stats = {"items": len(skins)}
+        return skins
+
+
+def test_bounded_queues_hold_back_the_scraper(make_pipeline, monkeypatch):
+    source = CountingSource([f"S{i}" for i in range(10)])
+    pipeline, images = make_pipeline([source], queue_size=1, images={"render_seconds": 0.1})
+    ahead = []
+
+    original = images._render
+
+    def render(skin, index):
+        # 렌더링이 시작될 때 스크래퍼가 이미 넘긴 항목 수와 렌더링이 끝난 카드 수의 차이
+        ahead.append(source.accepted - len(images.rendered))
+        return original(skin, index)
+
+    monkeypatch.setattr(images, "_render", render)
+
+    discounts, image_paths, _ = asyncio.run(pipeline.run())
+
+    assert len(image_paths) == 10
+    # 렌더 중인 카드 + 카드 큐(1) + 카드 큐에 넣으려고 대기 중인 카드 + 스킨 큐(1) 보다 앞서가지 않음
+    assert max(ahead) <= 4
+
+
+def test_failing_stage_cancels_the_others(make_pipeline):
+    source = CountingSource(["A", "B"] + [f"S{i}" for i in range(10)])
+    pipeline, images = make_pipeline([source], queue_size=1, images={"fail_on": "B"})
+
+    async def scenario():
+        with pytest.raises(RuntimeError, match="render failed: B"):
+            await pipeline.run()
+        await asyncio.sleep(0)
+        return [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+    leftover = asyncio.run(scenario())
+
+    assert leftover == []
+    # 스크래퍼는 가득 찬 큐에서 기다리다 취소되어 나머지 항목을 넘기지 않음
+    assert source.accepted < 12
+
+
+def test_fallback_result_order_decides_the_video(make_pipeline, tmp_path):
+    # HTTP 소스가 B, D 를 넘긴 뒤 실패하고, 대체 소스는 A, B, C 순서로 결과를 반환
+    http = FakeSource([[make_skin("B"), make_skin("D")]], error=RuntimeError("catalog unavailable"), name="http")
+    playwright = FakeSource([[make_skin("A"), make_skin("B"), make_skin("C")]], name="playwright")
+    pipeline, images = make_pipeline([http, playwright])
+
+    discounts, image_paths, video = asyncio.run(pipeline.run())
+
+    # 설명란은 최종 discounts 순서로 만들어지므로 영상과 카드도 같은 순서여야 함
+    assert [skin["name"] for skin in discounts] == ["A", "B", "C"]
+    assert sorted(images.rendered) == ["A", "B", "C", "D"]
+    assert_cards(image_paths, ["A", "B", "C"])
+    assert sorted(path.name for path in images.output_dir.iterdir()) == ["01.png", "02.png", "03.png"]
+    assert duration(video) == 3
+    assert all(close_to(color, COLORS[name]) for color, name in zip(card_colors(video, tmp_path, 3), "ABC"))
+
+
+def test_requires_the_ffmpeg_backend(make_store_service, workdir):
+    with pytest.raises(ValueError):
+        StreamingContentPipeline(
+            make_store_service(),
+            image_generator=FakeImageGenerator(workdir),
+            video_generator=VideoGenerator(output_dir=str(workdir / "videos"), backend="moviepy")
+        )
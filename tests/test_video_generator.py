@@ -0,0 +1,48 @@
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from app.core.config.video_config import ENCODING_PROFILES
+from app.services.video import video_generator
+from app.services.video.ffmpeg_encoder import find_ffmpeg
+from app.services.video.video_generator import VideoGenerator
+from tests.conftest import duration, has_audio
+
+try:
+    find_ffmpeg()
+except ValueError:
+    pytest.skip("ffmpeg is not available", allow_module_level=True)
+
+BGM = Path(__file__).resolve().parent.parent / "data" / "audio" / "bgm.mp3"
+PROFILE = "fast-draft"
+
+
+@pytest.fixture
+def image_dir(workdir, monkeypatch):
+    monkeypatch.setattr(video_generator, "ENCODE_STATS_FILE", str(workdir / "encode_stats.jsonl"))
+    cards = workdir / "images"
+    cards.mkdir()
+    for i, color in enumerate(("red", "lime", "blue")):
+        Image.new("RGB", (320, 568), color).save(cards / f"{i + 1:02d}.png")
+    return cards
+
+
+@pytest.mark.parametrize("backend", VideoGenerator.BACKENDS)
+@pytest.mark.parametrize("transition_duration", [0.0, 0.5])
+def test_backends_encode_weekly_video(image_dir, workdir, backend, transition_duration):
+    generator = VideoGenerator(output_dir=str(workdir / "videos"), backend=backend, profile=PROFILE)
+
+    output = generator.create_video_from_images(
+        str(image_dir),
+        f"{backend}.mp4",
+        image_duration=1,
+        audio_file=str(BGM) if BGM.exists() else None,
+        transition_duration=transition_duration
+    )
+
+    # ffmpeg 백엔드는 정지 구간 프레임을 생략하므로(가변 프레임레이트) 프레임 수 대신 길이를 비교
+    assert abs(duration(output) - 3) <= 1 / ENCODING_PROFILES[PROFILE]["fps"] + 0.05
+    assert has_audio(output) == BGM.exists()
+    assert generator.last_encode_stats["backend"] == backend
+
@@ -0,0 +1,114 @@
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from app.core import dependencies
+from app.core.config.settings import settings
+from app.core.dependencies import get_lol_store_service
+from app.main import app
+from app.services.content import scheduler as scheduler_module
+from app.services.content.scheduler import ContentScheduler
+from app.services.video import video_generator
+from app.services.video.ffmpeg_encoder import find_ffmpeg
+from app.services.video.video_generator import VideoGenerator
+from tests.conftest import GRAY, FakeImageGenerator, FakeSource, busy_card, busy_stage, make_skin
+
+STAGE_SECONDS = 1.0
+SKINS = 10
+P99_BUDGET_SECONDS = 0.1
+
+
+class FakePublisher:
+    playlist_id = "playlist-1"
+
+    async def publish_video_async(self, video_path, description=None):
+        await asyncio.sleep(0.2)
+        return "video-1"
+
+
+class ProcessImageGenerator(FakeImageGenerator):
+    """Image generator whose cards spin the CPU in a spawned process pool, like DiscountImageGenerator"""
+
+    def create_render_executor(self, workers):
+        return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+    def submit_render(self, executor, skin, index, date_range):
+        # 두 콘텐츠 단계(2 * STAGE_SECONDS)만큼의 CPU 작업을 카드마다 나눠서 실행
+        return executor.submit(busy_card, 2 * STAGE_SECONDS / SKINS, str(self.output_dir / f"{index:02d}.png"), GRAY)
+
+
+def requires_ffmpeg():
+    try:
+        find_ffmpeg()
+    except ValueError:
+        pytest.skip("ffmpeg is not available")
+
+
+@pytest.fixture(params=[False, True], ids=["staged", "streaming"])
+def weekly_run(request, make_store_service, workdir, monkeypatch):
+    """
+    ContentScheduler whose content stages spin the CPU in a process pool instead of rendering
+
+    The staged run offloads whole stages to the content process pool; the streaming run goes through
+    StreamingContentPipeline with cards rendered in a spawned pool and segments encoded by ffmpeg.
+    """
+    streaming = request.param
+    if streaming:
+        requires_ffmpeg()
+    service = make_store_service([FakeSource([[make_skin(f"skin {i}") for i in range(SKINS)]])])
+    # 실행 전에도 이전 주 결과를 서비스하고 있는 상태
+    asyncio.run(service.update_discounts())
+
+    async def generate_images(self, scraped):
+        return {"images": [await self._offload(busy_stage, STAGE_SECONDS, str(workdir / "01.png"))]}
+
+    async def generate_video(self):
+        return {"video": await self._offload(busy_stage, STAGE_SECONDS, str(workdir / "weekly.mp4"))}
+
+    content_generator = SimpleNamespace(
+        image_generator=ProcessImageGenerator(workdir),
+        video_generator=VideoGenerator(output_dir=str(workdir / "videos"), backend="ffmpeg", profile="fast-draft")
+    )
+
+    monkeypatch.setattr(settings, "PIPELINE_STREAMING", streaming)
+    monkeypatch.setattr(settings, "VIDEO_ENCODER_BACKEND", "ffmpeg")
+    monkeypatch.setattr(video_generator, "ENCODE_STATS_FILE", str(workdir / "encode_stats.jsonl"))
+    monkeypatch.setattr(settings, "PIPELINE_ADD_TO_PLAYLIST", False)
+    monkeypatch.setattr(ContentScheduler, "_generate_images", generate_images)
+    monkeypatch.setattr(ContentScheduler, "_generate_video", generate_video)
+    monkeypatch.setattr(dependencies, "get_lol_store_service", lambda: service)
+    monkeypatch.setattr(dependencies, "get_content_generator", lambda: content_generator)
+    monkeypatch.setattr(dependencies, "get_youtube_publisher", lambda: FakePublisher())
+    app.dependency_overrides[get_lol_store_service] = lambda: service
+    yield ContentScheduler()
+    app.dependency_overrides.clear()
+    scheduler_module._terminate_content_executor()
+
+
+def test_discounts_p99_latency_during_weekly_run(weekly_run):
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            run = asyncio.ensure_future(weekly_run.run_weekly_update(force=True))
+            latencies = []
+            while not run.done():
+                started = time.perf_counter()
+                response = await client.get("/api/v1/lol-store/discounts")
+                latencies.append(time.perf_counter() - started)
+                assert response.status_code == 200
+                await asyncio.sleep(0.01)
+            return await run, sorted(latencies)
+
+    summary, latencies = asyncio.run(scenario())
+
+    stages = summary["stages"]
+    assert [stages[stage]["status"] for stage in ("scrape", "images", "video", "upload")] == ["done"] * 4
+    # 두 콘텐츠 단계(합계 2 * STAGE_SECONDS) 동안 요청이 계속 처리되어야 함
+    assert len(latencies) >= 2 * STAGE_SECONDS / 0.02
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    assert p99 < P99_BUDGET_SECONDS, f"p99 {p99 * 1000:.1f}ms over {len(latencies)} requests"